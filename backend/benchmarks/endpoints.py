@@ -0,0 +1,560 @@
+"""
+Drive every API route at a configurable concurrency and record latency.
+
+Runs the app in-process through an ASGI client against DATABASE_URL, seeding
+it first with benchmarks.seed when it is empty (a throwaway SQLite database
+when DATABASE_URL is unset). Each route is warmed up, then called
+--requests times by --concurrency workers as a sample of seeded managers and
+employees. Reports p50/p95/p99 latency, throughput, status codes and SQL
+statements per request for every route as JSON, and lists any route in
+routers/ that has no scenario so the benchmark cannot silently fall behind.
+Write routes run last, after every read. Needs the development requirements
+(pip install -r requirements-dev.txt) for httpx.
+
+    python -m benchmarks.endpoints --requests 200 --concurrency 16 --output bench.json
+    DATABASE_URL=sqlite+aiosqlite:////tmp/bench.db python -m benchmarks.endpoints \\
+        --routes dashboard feedbacks-given --concurrency 64
+"""
+import argparse
+import asyncio
+import contextvars
+import json
+import os
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable
+
+if "DATABASE_URL" not in os.environ:
+    _db_dir = tempfile.mkdtemp(prefix="endpoints_")
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_db_dir}/bench.db"
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+os.environ["SQL_ECHO"] = "0"
+
+import httpx  # noqa: E402
+from fastapi.routing import APIRoute  # noqa: E402
+from sqlalchemy import event, func, make_url, select  # noqa: E402
+from database.db import Base, engine  # noqa: E402
+from main import app  # noqa: E402
+from models.feedback import Feedback, FeedbackRequest  # noqa: E402
+from models.user import User  # noqa: E402
+from benchmarks import percentile, seed  # noqa: E402
+
+
+# Counts the SQL statements issued while serving the request that set it.
+# Each request runs in its own task, so concurrent requests keep separate
+# counters.
+_statements: contextvars.ContextVar[list[int] | None] = contextvars.ContextVar(
+    "statements", default=None
+)
+
+
+@dataclass
+class Scenario:
+    method: str
+    path: str
+    build: Callable[["Sample", random.Random], dict]
+    write: bool = False
+
+    @property
+    def name(self) -> str:
+        return f"{self.method} {self.path}"
+
+
+# Routes a request/response client cannot measure; listed in the report.
+SKIPPED = {
+    "GET /manager/{manager_id}/activities/stream": (
+        "Server-Sent Events stream never completes; the ASGI client buffers "
+        "whole responses"
+    ),
+}
+
+
+@dataclass
+class Sample:
+    """
+    Seeded users the scenarios act as, with rows they may read or change.
+    """
+
+    managers: list[dict]
+    employees: list[dict]
+    given: dict[int, list[int]]
+    received: dict[int, list[int]]
+    pending: list[tuple[str, int]]
+    now: datetime
+
+
+def _manager(sample: Sample, rng: random.Random) -> dict:
+    return rng.choice(sample.managers)
+
+
+def _employee(sample: Sample, rng: random.Random) -> dict:
+    return rng.choice(sample.employees)
+
+
+def _manager_get(path: str) -> Scenario:
+    """
+    A GET of `path` by a sampled manager, filling in their `manager_id`.
+    """
+
+    def build(sample: Sample, rng: random.Random) -> dict:
+        manager = _manager(sample, rng)
+        return {"url": path.format(manager_id=manager["id"]), "headers": manager["headers"]}
+
+    return Scenario("GET", path, build)
+
+
+def _employee_get(path: str) -> Scenario:
+    """
+    A GET of `path` by a sampled employee, filling in their id or name.
+    """
+
+    def build(sample: Sample, rng: random.Random) -> dict:
+        employee = _employee(sample, rng)
+        return {
+            "url": path.format(employee_id=employee["id"], employee_name=employee["name"]),
+            "headers": employee["headers"],
+        }
+
+    return Scenario("GET", path, build)
+
+
+def _feedback_given(sample: Sample, rng: random.Random) -> tuple[dict, int]:
+    manager = _manager(sample, rng)
+    return manager, rng.choice(sample.given[manager["id"]])
+
+
+def _recent(sample: Sample, days: int) -> str:
+    return (sample.now - timedelta(days=days)).isoformat()
+
+
+def _list_feedbacks(sample, rng):
+    employee = _employee(sample, rng)
+    return {
+        "url": "/feedback",
+        "params": {"user": employee["name"]},
+        "headers": employee["headers"],
+    }
+
+
+def _search(sample, rng):
+    return {
+        "url": "/feedback/search",
+        "params": {"q": rng.choice(seed.WORDS).split()[-1]},
+        "headers": _manager(sample, rng)["headers"],
+    }
+
+
+def _export(sample, rng):
+    manager = _manager(sample, rng)
+    return {
+        "url": "/feedback/export",
+        "params": {"member_id": rng.choice(manager["employees"])["id"]},
+        "headers": manager["headers"],
+    }
+
+
+def _export_pdf(sample, rng):
+    manager, feedback_id = _feedback_given(sample, rng)
+    return {"url": f"/feedback/{feedback_id}/export-pdf", "headers": manager["headers"]}
+
+
+def _export_pdf_batch(sample, rng):
+    manager = _manager(sample, rng)
+    return {
+        "url": "/feedback/export-pdf/batch",
+        "params": {
+            "member_id": rng.choice(manager["employees"])["id"],
+            "start": _recent(sample, 30),
+        },
+        "headers": manager["headers"],
+    }
+
+
+def _login(sample, rng):
+    user = rng.choice(sample.managers + sample.employees)
+    return {
+        "url": "/login",
+        "data": {"username": user["email"], "password": "benchmark"},
+    }
+
+
+def _signup(sample, rng):
+    manager = _manager(sample, rng)
+    suffix = rng.getrandbits(64)
+    return {
+        "url": "/signup",
+        "json": {
+            "name": f"Signup {suffix}",
+            "email": f"signup{suffix}@bench.example",
+            "password": "benchmark",
+            "company": manager["company"],
+            "role": "employee",
+        },
+    }
+
+
+def _feedback_body(manager: dict, rng: random.Random) -> dict:
+    employee = rng.choice(manager["employees"])
+    return {
+        "member": employee["name"],
+        "member_id": employee["id"],
+        "strengths": rng.choice(seed.WORDS),
+        "improvement": rng.choice(seed.WORDS),
+        "sentiment": rng.choice(("Positive", "Neutral", "Negative")),
+        "tags": ["Teamwork"],
+        "given_by": manager["id"],
+        "acknowledged": False,
+    }
+
+
+def _create_feedback(sample, rng):
+    manager = _manager(sample, rng)
+    return {
+        "url": "/feedback",
+        "json": _feedback_body(manager, rng),
+        "headers": manager["headers"],
+    }
+
+
+def _import(sample, rng):
+    manager = _manager(sample, rng)
+    return {
+        "url": "/feedback/import",
+        "json": [_feedback_body(manager, rng) for _ in range(100)],
+        "headers": manager["headers"],
+    }
+
+
+def _request_feedback(sample, rng):
+    employee = _employee(sample, rng)
+    return {
+        "url": "/feedback/request",
+        "json": {"member": employee["name"]},
+        "headers": employee["headers"],
+    }
+
+
+def _acknowledge(sample, rng):
+    employee = _employee(sample, rng)
+    return {
+        "url": f"/feedback/{rng.choice(sample.received[employee['id']])}/acknowledge",
+        "headers": employee["headers"],
+    }
+
+
+def _acknowledge_batch(sample, rng):
+    employee = _employee(sample, rng)
+    received = sample.received[employee["id"]]
+    return {
+        "url": "/feedback/acknowledge-batch",
+        "json": {"feedback_ids": rng.sample(received, min(10, len(received)))},
+        "headers": employee["headers"],
+    }
+
+
+def _complete(sample, rng):
+    employee, manager_id = rng.choice(sample.pending)
+    manager = next(m for m in sample.managers if m["id"] == manager_id)
+    return {
+        "url": "/feedback_request/complete",
+        "json": {"employee": employee, "manager_id": manager_id},
+        "headers": manager["headers"],
+    }
+
+
+def _complete_batch(sample, rng):
+    manager = _manager(sample, rng)
+    employees = rng.sample(manager["employees"], min(5, len(manager["employees"])))
+    return {
+        "url": "/feedback_request/complete-batch",
+        "json": {"employees": [employee["name"] for employee in employees]},
+        "headers": manager["headers"],
+    }
+
+
+def _edit(sample, rng):
+    manager, feedback_id = _feedback_given(sample, rng)
+    return {
+        "url": f"/feedback/{feedback_id}",
+        "params": {"user_id": manager["id"]},
+        "json": {"improvement": rng.choice(seed.WORDS)},
+        "headers": manager["headers"],
+    }
+
+
+def _activity_log(sample, rng):
+    employee = _employee(sample, rng)
+    return {
+        "url": "/activity-log",
+        "json": {
+            "user_id": employee["id"],
+            "manager_id": employee["manager_id"],
+            "action": "viewed_dashboard",
+        },
+        "headers": employee["headers"],
+    }
+
+
+SCENARIOS = [
+    _manager_get("/manager/{manager_id}/employees"),
+    _manager_get("/manager/{manager_id}/dashboard"),
+    _manager_get("/manager/{manager_id}/feedbacks/count"),
+    _manager_get("/manager/{manager_id}/team/response-rate"),
+    _manager_get("/manager/{manager_id}/feedbacks/average-sentiment"),
+    _manager_get("/manager/{manager_id}/feedbacks/pending-ack"),
+    _manager_get("/manager/{manager_id}/feedbacks/sentiment-trends"),
+    _manager_get("/manager/{manager_id}/feedbacks/tags"),
+    _manager_get("/manager/{manager_id}/feedbacks-given"),
+    _manager_get("/manager/{manager_id}/activities"),
+    _employee_get("/employee/{employee_id}/feedbacks/count"),
+    _employee_get("/employee/{employee_id}/feedbacks/pending-ack"),
+    _employee_get("/employee/{employee_id}/feedbacks/ack-rate"),
+    _employee_get("/employee/{employee_id}/feedbacks/average-sentiment"),
+    _employee_get("/employee/{employee_id}/feedbacks/tags"),
+    _employee_get("/employee/{employee_name}/feedbacks"),
+    _manager_get("/metrics-cache/stats"),
+    _manager_get("/metrics"),
+    Scenario("GET", "/feedback", _list_feedbacks),
+    Scenario("GET", "/feedback/search", _search),
+    Scenario("GET", "/feedback/export", _export),
+    Scenario("GET", "/feedback/{feedback_id}/export-pdf", _export_pdf),
+    Scenario("GET", "/feedback/export-pdf/batch", _export_pdf_batch),
+    Scenario("POST", "/login", _login),
+    Scenario("POST", "/signup", _signup, write=True),
+    Scenario("POST", "/feedback", _create_feedback, write=True),
+    Scenario("POST", "/feedback/import", _import, write=True),
+    Scenario("POST", "/feedback/request", _request_feedback, write=True),
+    Scenario("PUT", "/feedback/{feedback_id}/acknowledge", _acknowledge, write=True),
+    Scenario("POST", "/feedback/acknowledge-batch", _acknowledge_batch, write=True),
+    Scenario("PUT", "/feedback_request/complete", _complete, write=True),
+    Scenario("PUT", "/feedback_request/complete-batch", _complete_batch, write=True),
+    Scenario("PUT", "/feedback/{feedback_id}", _edit, write=True),
+    Scenario("POST", "/activity-log", _activity_log, write=True),
+]
+
+
+def _count_statements(conn, cursor, statement, parameters, context, executemany):
+    counter = _statements.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+async def _load_sample(client, users: int, rng: random.Random) -> Sample:
+    """
+    Pick `users` seeded managers and employees of the same companies and log
+    each of them in.
+    """
+    async with engine.connect() as conn:
+        manager_rows = (
+            await conn.execute(
+                select(User.id, User.name, User.email, User.company)
+                .where(User.role == "manager")
+                .order_by(func.random())
+                .limit(max(1, users // 2))
+            )
+        ).all()
+        managers = [dict(row._mapping, employees=[]) for row in manager_rows]
+        by_company = {}
+        for manager in managers:
+            by_company.setdefault(manager["company"], []).append(manager)
+
+        employee_rows = (
+            await conn.execute(
+                select(User.id, User.name, User.email, User.company)
+                .where(User.role == "employee", User.company.in_(by_company))
+                .order_by(func.random())
+                .limit(max(1, users - len(managers)))
+            )
+        ).all()
+        employees = []
+        for row in employee_rows:
+            company_managers = by_company[row.company]
+            employee = dict(row._mapping, manager_id=company_managers[0]["id"])
+            employees.append(employee)
+            for manager in company_managers:
+                manager["employees"].append(employee)
+
+        given, received = {}, {}
+        for manager in managers:
+            given[manager["id"]] = (
+                await conn.scalars(
+                    select(Feedback.id).where(Feedback.given_by == manager["id"]).limit(200)
+                )
+            ).all()
+        for employee in employees:
+            received[employee["id"]] = (
+                await conn.scalars(
+                    select(Feedback.id).where(Feedback.member_id == employee["id"]).limit(200)
+                )
+            ).all()
+        pending = (
+            await conn.execute(
+                select(User.name, FeedbackRequest.manager_id)
+                .join(User, User.id == FeedbackRequest.employee_id)
+                .where(
+                    FeedbackRequest.status == "pending",
+                    FeedbackRequest.manager_id.in_(given),
+                )
+                .limit(1000)
+            )
+        ).all()
+
+    managers = [m for m in managers if m["employees"] and given[m["id"]]]
+    employees = [e for e in employees if received[e["id"]]]
+    if not managers or not employees:
+        raise SystemExit("The database has no managers and employees with feedback")
+    manager_ids = {manager["id"] for manager in managers}
+    pending = [tuple(row) for row in pending if row.manager_id in manager_ids]
+    for user in managers + employees:
+        response = await client.post(
+            "/login", data={"username": user["email"], "password": "benchmark"}
+        )
+        response.raise_for_status()
+        user["headers"] = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    return Sample(
+        managers,
+        employees,
+        given,
+        received,
+        pending or [(employees[0]["name"], managers[0]["id"])],
+        datetime.utcnow(),
+    )
+
+
+async def _call(client, scenario: Scenario, sample: Sample, rng: random.Random):
+    request = scenario.build(sample, rng)
+    counter = [0]
+    token = _statements.set(counter)
+    start = time.perf_counter()
+    try:
+        response = await client.request(scenario.method, **request)
+    finally:
+        _statements.reset(token)
+    return (time.perf_counter() - start) * 1000, response.status_code, counter[0]
+
+
+async def _run_scenario(client, scenario: Scenario, sample: Sample, args, rng) -> dict:
+    for _ in range(args.warmup):
+        await _call(client, scenario, sample, rng)
+
+    latencies, statements, statuses = [], [], {}
+    remaining = args.requests
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            latency, status, count = await _call(client, scenario, sample, rng)
+            latencies.append(latency)
+            statements.append(count)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    seconds = time.perf_counter() - started
+
+    return {
+        "route": scenario.name,
+        "requests": len(latencies),
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+        "errors": sum(count for status, count in statuses.items() if status >= 500),
+        "throughput_rps": round(len(latencies) / seconds, 1),
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "max_ms": round(max(latencies), 2),
+        "queries_per_request": round(statistics.mean(statements), 2),
+        "max_queries": max(statements),
+    }
+
+
+def _commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args) -> dict:
+    started_at = datetime.utcnow().isoformat(timespec="seconds")
+    seeded = None
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    counts = await seed.table_counts(engine)
+    if not counts["users"]:
+        seeded = await seed.seed(engine, args)
+        counts = await seed.table_counts(engine)
+
+    routes = {
+        f"{method} {route.path}"
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        for method in route.methods
+    }
+    scenarios = [
+        scenario
+        for scenario in sorted(SCENARIOS, key=lambda scenario: scenario.write)
+        if not args.routes or any(part in scenario.name for part in args.routes)
+    ]
+    rng = random.Random(args.seed)
+    results = []
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _count_statements)
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="https://bench", timeout=None
+        ) as client:
+            sample = await _load_sample(client, args.users, rng)
+            for scenario in scenarios:
+                results.append(await _run_scenario(client, scenario, sample, args, rng))
+                print(f"{scenario.name}: p50 {results[-1]['p50_ms']}ms")
+
+    covered = {scenario.name for scenario in SCENARIOS} | SKIPPED.keys()
+    return {
+        "started_at": started_at,
+        "commit": _commit(),
+        "database": make_url(os.environ["DATABASE_URL"]).render_as_string(
+            hide_password=True
+        ),
+        "rows": counts,
+        "seeded": seeded,
+        "concurrency": args.concurrency,
+        "requests_per_route": args.requests,
+        "sample_users": len(sample.managers) + len(sample.employees),
+        "routes": results,
+        "skipped": [{"route": name, "reason": reason} for name, reason in SKIPPED.items()],
+        "uncovered": sorted(routes - covered),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--routes", nargs="*", help="Only routes containing any of these")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    seed.add_arguments(parser)
+    args = parser.parse_args()
+
+    report = json.dumps(asyncio.run(run(args)), indent=2)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(report + "\n")
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Measure how a burst of logins affects the latency of unrelated endpoints.
+
+Runs the app in-process against a throwaway SQLite database, fires a storm of
+concurrent logins and, while they are in flight, repeatedly calls a cheap
+metrics endpoint. Pass --blocking to hash on the event loop the way the auth
+router used to, for a before/after comparison.
+
+    python -m benchmarks.login_storm --logins 40
+    python -m benchmarks.login_storm --logins 40 --blocking
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+
+_db_dir = tempfile.mkdtemp(prefix="login_storm_")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_db_dir}/bench.db"
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+
+import httpx  # noqa: E402
+from main import app  # noqa: E402
+from services import passwords  # noqa: E402
+from benchmarks import percentile  # noqa: E402
+
+
+async def _run_inline(func, *args):
+    return func(*args)
+
+
+async def run(logins: int, probe_interval: float) -> dict:
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="https://bench", timeout=None
+        ) as client:
+            await client.post(
+                "/signup",
+                json={
+                    "name": "Bench Manager",
+                    "email": "bench@example.com",
+                    "password": "benchmark",
+                    "company": "Bench",
+                    "role": "manager",
+                },
+            )
+            credentials = {"username": "bench@example.com", "password": "benchmark"}
+            login = (await client.post("/login", data=credentials)).json()
+            headers = {"Authorization": f"Bearer {login['access_token']}"}
+            probe_path = f"/manager/{login['id']}/feedbacks/count"
+
+            storm_done = asyncio.Event()
+            probe_latencies = []
+            statuses = {}
+
+            async def probe():
+                while not storm_done.is_set():
+                    start = time.perf_counter()
+                    await client.get(probe_path, headers=headers)
+                    probe_latencies.append((time.perf_counter() - start) * 1000)
+                    await asyncio.sleep(probe_interval)
+
+            async def one_login():
+                response = await client.post("/login", data=credentials)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+            prober = asyncio.create_task(probe())
+            storm_start = time.perf_counter()
+            await asyncio.gather(*(one_login() for _ in range(logins)))
+            storm_seconds = time.perf_counter() - storm_start
+            storm_done.set()
+            await prober
+
+    return {
+        "mode": "blocking" if passwords._run is _run_inline else "worker_pool",
+        "logins": logins,
+        "login_statuses": statuses,
+        "storm_seconds": round(storm_seconds, 3),
+        "probe_requests": len(probe_latencies),
+        "probe_p50_ms": round(statistics.median(probe_latencies), 2),
+        "probe_p99_ms": round(percentile(probe_latencies, 99), 2),
+        "probe_max_ms": round(max(probe_latencies), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=40)
+    parser.add_argument("--probe-interval", type=float, default=0.005)
+    parser.add_argument("--blocking", action="store_true")
+    args = parser.parse_args()
+
+    if args.blocking:
+        passwords._run = _run_inline
+    print(json.dumps(asyncio.run(run(args.logins, args.probe_interval)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""
+Seed an empty database with a synthetic workload for the endpoint benchmarks.
+
+Creates companies of managers and employees, then feedbacks, feedback
+requests and activity logs between them spread over the last --days days.
+Rows are generated deterministically from --seed and inserted in chunks; the
+full-text index, tag index and rollups are built once after the load rather
+than row by row. Every seeded user's password is "benchmark".
+
+    python -m benchmarks.seed --database-url sqlite+aiosqlite:////tmp/bench.db
+    python -m benchmarks.seed --database-url sqlite+aiosqlite:////tmp/bench.db \\
+        --companies 500 --managers 2500 --employees 47500 --feedbacks 5000000 \\
+        --feedback-requests 500000 --activities 2000000
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from datetime import datetime, timedelta
+
+os.environ["SQL_ECHO"] = "0"
+
+from sqlalchemy import func, insert, select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession  # noqa: E402
+from database.db import Base, make_engine  # noqa: E402
+from database.migrations import run_migrations  # noqa: E402
+from models.activity_log import ActivityLog  # noqa: E402
+from models.feedback import Feedback, FeedbackRequest  # noqa: E402
+from models.user import User  # noqa: E402
+import models.change_version  # noqa: E402,F401
+import models.feedback_stats  # noqa: E402,F401
+from services import feedback_stats, passwords  # noqa: E402
+
+
+BENCH_PASSWORD = "benchmark"
+CHUNK_ROWS = 5000
+
+SENTIMENTS = ("Positive", "Neutral", "Negative")
+SENTIMENT_WEIGHTS = (6, 3, 1)
+TAGS = (
+    "Teamwork",
+    "Leadership",
+    "Communication",
+    "Ownership",
+    "Growth",
+    "Delivery",
+    "Mentoring",
+    "Creativity",
+)
+WORDS = (
+    "clear communication with stakeholders during the release planning",
+    "takes ownership of incidents and follows up on the root cause",
+    "mentors new joiners patiently and shares context generously",
+    "could break large pull requests into smaller reviewable changes",
+    "writes thorough documentation for the onboarding guide",
+    "should raise blockers earlier in the sprint",
+    "delivered the migration ahead of schedule with no downtime",
+    "needs to keep estimates realistic when scope changes",
+    "brings creative ideas to design discussions",
+    "could delegate more routine work to grow the team",
+    "handles customer escalations calmly and professionally",
+    "tests edge cases carefully before shipping",
+)
+ACTIONS = (
+    "sent_feedback",
+    "requested_feedback",
+    "acknowledged_feedback",
+    "completed_feedback_request",
+)
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--companies", type=int, default=10)
+    parser.add_argument("--managers", type=int, default=50)
+    parser.add_argument("--employees", type=int, default=950)
+    parser.add_argument("--feedbacks", type=int, default=100000)
+    parser.add_argument("--feedback-requests", type=int, default=20000)
+    parser.add_argument("--activities", type=int, default=50000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--seed", type=int, default=42)
+
+
+def _chunks(rows, size: int = CHUNK_ROWS):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _sentence(rng: random.Random) -> str:
+    return "; ".join(rng.sample(WORDS, rng.randint(1, 3))).capitalize() + "."
+
+
+def _moment(rng: random.Random, now: datetime, days: int) -> datetime:
+    return now - timedelta(seconds=rng.uniform(0, days * 86400))
+
+
+async def _insert_users(conn, args, password_hash: str) -> list[dict]:
+    """
+    Insert every user and return them grouped by company, each employee
+    paired with a home manager who gives most of their feedback.
+    """
+    rows = [
+        {
+            "name": f"Manager {i}",
+            "email": f"manager{i}@bench.example",
+            "password": password_hash,
+            "company": f"Company {i % args.companies}",
+            "role": "manager",
+        }
+        for i in range(args.managers)
+    ] + [
+        {
+            "name": f"Employee {i}",
+            "email": f"employee{i}@bench.example",
+            "password": password_hash,
+            "company": f"Company {i % args.companies}",
+            "role": "employee",
+        }
+        for i in range(args.employees)
+    ]
+    ids = []
+    for chunk in _chunks(rows):
+        result = await conn.execute(
+            insert(User).returning(User.id, sort_by_parameter_order=True), chunk
+        )
+        ids.extend(result.scalars().all())
+
+    companies = [{"managers": [], "employees": []} for _ in range(args.companies)]
+    for index, (user_id, row) in enumerate(zip(ids, rows)):
+        position = index if index < args.managers else index - args.managers
+        company = companies[position % args.companies]
+        if index < args.managers:
+            company["managers"].append(user_id)
+        else:
+            managers = company["managers"]
+            home = managers[len(company["employees"]) % len(managers)]
+            company["employees"].append((user_id, row["name"], home))
+    return [company for company in companies if company["employees"]]
+
+
+def _feedback_rows(rng: random.Random, companies: list[dict], args, now: datetime):
+    for _ in range(args.feedbacks):
+        company = rng.choice(companies)
+        member_id, member, home = rng.choice(company["employees"])
+        given_by = home if rng.random() < 0.9 else rng.choice(company["managers"])
+        yield {
+            "member": member,
+            "member_id": member_id,
+            "strengths": _sentence(rng),
+            "improvement": _sentence(rng),
+            "sentiment": rng.choices(SENTIMENTS, SENTIMENT_WEIGHTS)[0],
+            "tags": rng.sample(TAGS, rng.randint(0, 3)),
+            "given_by": given_by,
+            "acknowledged": rng.random() < 0.6,
+            "created_at": _moment(rng, now, args.days),
+        }
+
+
+def _request_rows(rng: random.Random, companies: list[dict], args):
+    for _ in range(args.feedback_requests):
+        employee_id, _, home = rng.choice(rng.choice(companies)["employees"])
+        yield {
+            "employee_id": employee_id,
+            "manager_id": home,
+            "status": "completed" if rng.random() < 0.7 else "pending",
+        }
+
+
+def _activity_rows(rng: random.Random, companies: list[dict], args, now: datetime):
+    for _ in range(args.activities):
+        employee_id, member, home = rng.choice(rng.choice(companies)["employees"])
+        action = rng.choice(ACTIONS)
+        if action == "sent_feedback":
+            user_id, target = home, member
+        else:
+            user_id, target = employee_id, str(home)
+        key = "request_id" if "request" in action else "feedback_id"
+        yield {
+            "user_id": user_id,
+            "manager_id": home,
+            "action": action,
+            "target": target,
+            "details": {key: rng.randint(1, max(args.feedbacks, 1))},
+            "timestamp": _moment(rng, now, args.days),
+        }
+
+
+async def _insert_rows(engine: AsyncEngine, table, rows) -> int:
+    count = 0
+    for chunk in _chunks(rows):
+        async with engine.begin() as conn:
+            await conn.execute(insert(table), chunk)
+        count += len(chunk)
+    return count
+
+
+async def seed(engine: AsyncEngine, args) -> dict:
+    """
+    Load the workload described by `args` into the empty database behind
+    `engine` and return the row counts and time spent per phase.
+    """
+    if args.managers < args.companies:
+        raise SystemExit("--managers must be at least --companies")
+    rng = random.Random(args.seed)
+    now = datetime.utcnow()
+    timings = {}
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        if (await conn.execute(select(User.id).limit(1))).first() is not None:
+            raise SystemExit("The database already has users; seed an empty one")
+
+    started = time.perf_counter()
+    password_hash = passwords.pwd_context.hash(BENCH_PASSWORD)
+    async with engine.begin() as conn:
+        companies = await _insert_users(conn, args, password_hash)
+    timings["users"] = time.perf_counter() - started
+
+    phases = (
+        ("feedbacks", Feedback, _feedback_rows(rng, companies, args, now)),
+        ("feedback requests", FeedbackRequest, _request_rows(rng, companies, args)),
+        ("activities", ActivityLog, _activity_rows(rng, companies, args, now)),
+    )
+    for name, table, rows in phases:
+        started = time.perf_counter()
+        count = await _insert_rows(engine, table, rows)
+        timings[name] = time.perf_counter() - started
+        print(f"Seeded {count} {name} in {timings[name]:.1f}s")
+
+    # The search index and feedback_tags are filled from the loaded rows by
+    # the same migrations that backfill an existing database.
+    started = time.perf_counter()
+    async with engine.begin() as conn:
+        await conn.run_sync(run_migrations)
+    async with AsyncSession(engine) as db:
+        await feedback_stats.rebuild_stats(db)
+    timings["indexes"] = time.perf_counter() - started
+
+    return {
+        "companies": len(companies),
+        "managers": args.managers,
+        "employees": args.employees,
+        "feedbacks": args.feedbacks,
+        "feedback_requests": args.feedback_requests,
+        "activities": args.activities,
+        "seconds": {name: round(seconds, 2) for name, seconds in timings.items()},
+    }
+
+
+async def table_counts(engine: AsyncEngine) -> dict:
+    async with engine.connect() as conn:
+        return {
+            table.__tablename__: await conn.scalar(select(func.count()).select_from(table))
+            for table in (User, Feedback, FeedbackRequest, ActivityLog)
+        }
+
+
+async def main(args):
+    engine = make_engine(args.database_url)
+    try:
+        return await seed(engine, args)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", required=True)
+    add_arguments(parser)
+    print(json.dumps(asyncio.run(main(parser.parse_args())), indent=2))
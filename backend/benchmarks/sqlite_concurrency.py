@@ -0,0 +1,149 @@
+"""
+Compare engine profiles on read latency while a writer is committing.
+
+For each profile, seeds a throwaway SQLite database, then runs one writer
+inserting and committing feedback rows while several readers run the
+dashboard-style queries the routers issue. Echo is disabled for every
+profile so the comparison measures the database, not stdout.
+
+    python -m benchmarks.sqlite_concurrency --seconds 10 --readers 8
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+
+os.environ["SQL_ECHO"] = "0"
+
+from sqlalchemy import desc, func, insert, select  # noqa: E402
+from database.db import Base, ENGINE_PROFILES, make_engine  # noqa: E402
+from models.feedback import Feedback  # noqa: E402
+from models.user import User  # noqa: E402
+import models.activity_log  # noqa: E402,F401
+import models.feedback_stats  # noqa: E402,F401
+from benchmarks import percentile  # noqa: E402
+
+
+def feedback_row(manager_id: int, member_id: int, index: int) -> dict:
+    return {
+        "member": f"Employee {member_id}",
+        "member_id": member_id,
+        "strengths": f"Strength note {index}",
+        "improvement": f"Improvement note {index}",
+        "sentiment": ("Positive", "Neutral", "Negative")[index % 3],
+        "tags": ["Teamwork"],
+        "given_by": manager_id,
+        "acknowledged": index % 2 == 0,
+    }
+
+
+async def seed(engine, managers: int, employees: int, feedbacks: int):
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(
+            insert(User),
+            [
+                {
+                    "name": f"User {i}",
+                    "email": f"user{i}@example.com",
+                    "password": "x",
+                    "company": "Bench",
+                    "role": "manager" if i <= managers else "employee",
+                }
+                for i in range(1, managers + employees + 1)
+            ],
+        )
+        await conn.execute(
+            insert(Feedback),
+            [
+                feedback_row(1 + i % managers, managers + 1 + i % employees, i)
+                for i in range(feedbacks)
+            ],
+        )
+
+
+async def run_profile(profile: str, args) -> dict:
+    directory = tempfile.mkdtemp(prefix=f"sqlite_{profile}_")
+    engine = make_engine(f"sqlite+aiosqlite:///{directory}/bench.db", profile)
+    await seed(engine, args.managers, args.employees, args.feedbacks)
+
+    deadline = time.perf_counter() + args.seconds
+    read_latencies = []
+    commits = 0
+    errors = 0
+
+    async def writer():
+        nonlocal commits, errors
+        index = 0
+        while time.perf_counter() < deadline:
+            try:
+                async with engine.begin() as conn:
+                    await conn.execute(
+                        insert(Feedback),
+                        [
+                            feedback_row(1, args.managers + 1, index + i)
+                            for i in range(args.write_batch)
+                        ],
+                    )
+                commits += 1
+            except Exception:
+                errors += 1
+            index += args.write_batch
+
+    async def reader(manager_id: int):
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                async with engine.connect() as conn:
+                    await conn.execute(
+                        select(func.count())
+                        .select_from(Feedback)
+                        .where(Feedback.given_by == manager_id)
+                    )
+                    await conn.execute(
+                        select(Feedback)
+                        .where(Feedback.given_by == manager_id)
+                        .order_by(desc(Feedback.created_at))
+                        .limit(50)
+                    )
+                read_latencies.append((time.perf_counter() - start) * 1000)
+            except Exception:
+                errors += 1
+
+    await asyncio.gather(
+        writer(),
+        *(reader(1 + i % args.managers) for i in range(args.readers)),
+    )
+    await engine.dispose()
+
+    return {
+        "profile": profile,
+        "reads": len(read_latencies),
+        "reads_per_second": round(len(read_latencies) / args.seconds, 1),
+        "read_p50_ms": round(statistics.median(read_latencies), 2),
+        "read_p99_ms": round(percentile(read_latencies, 99), 2),
+        "write_commits": commits,
+        "errors": errors,
+    }
+
+
+async def main(args):
+    return [await run_profile(profile, args) for profile in args.profiles]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--managers", type=int, default=20)
+    parser.add_argument("--employees", type=int, default=500)
+    parser.add_argument("--feedbacks", type=int, default=50000)
+    parser.add_argument("--write-batch", type=int, default=20)
+    parser.add_argument(
+        "--profiles", nargs="+", default=sorted(ENGINE_PROFILES), choices=sorted(ENGINE_PROFILES)
+    )
+    print(json.dumps(asyncio.run(main(parser.parse_args())), indent=2))
@@ -1,9 +1,119 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+import os
+from sqlalchemy import event, make_url
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
+from database.dialects import SUPPORTED_DIALECTS
 
-DATABASE_URL = "sqlite+aiosqlite:////tmp/workplace_vibe.db"
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:////tmp/workplace_vibe.db")
+DB_PROFILE = os.getenv("DB_PROFILE", "production")
 
-engine = create_async_engine(DATABASE_URL, echo=True)
+ENGINE_PROFILES = {
+    # SQLite defaults: rollback journal, full fsync and every statement echoed.
+    "development": {
+        "echo": True,
+        "pragmas": {},
+        "pool": {},
+    },
+    # WAL lets readers proceed while a write is in flight; NORMAL sync is
+    # durable across application crashes and only fsyncs at checkpoints.
+    "production": {
+        "echo": False,
+        "pragmas": {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "busy_timeout": 5000,
+            "cache_size": -64000,
+            "mmap_size": 268435456,
+            "temp_store": "MEMORY",
+        },
+        "pool": {
+            "pool_size": 8,
+            "max_overflow": 8,
+            "pool_timeout": 10,
+        },
+    },
+}
+
+# Server databases sit behind a network and may drop idle connections, so
+# their pools are larger, validate connections on checkout and recycle them.
+DIALECT_POOLS = {
+    "postgresql": {
+        "pool_size": 20,
+        "max_overflow": 10,
+        "pool_timeout": 10,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+    },
+}
+
+# Keyed by driver, since connect_args are passed to the DBAPI's connect().
+DRIVER_CONNECT_ARGS = {
+    "asyncpg": {
+        "command_timeout": 30,
+        "server_settings": {"application_name": "workplace_vibe"},
+    },
+}
+
+POOL_ENV_OVERRIDES = {
+    "pool_size": "DB_POOL_SIZE",
+    "max_overflow": "DB_MAX_OVERFLOW",
+    "pool_timeout": "DB_POOL_TIMEOUT",
+    "pool_recycle": "DB_POOL_RECYCLE",
+}
+
+
+def _apply_pragmas(engine: AsyncEngine, pragmas: dict):
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+def make_engine(url: str = DATABASE_URL, profile: str = DB_PROFILE) -> AsyncEngine:
+    """
+    Build the async engine for any SQLAlchemy async `url` using one of
+    ENGINE_PROFILES.
+
+    SQL_ECHO overrides the profile's echo setting and the DB_POOL_* variables
+    override individual pool settings. Backends outside SUPPORTED_DIALECTS
+    are rejected, since the queries use SQLite or PostgreSQL specific SQL.
+    """
+    if profile not in ENGINE_PROFILES:
+        raise ValueError(
+            f"Unknown DB_PROFILE {profile!r}, expected one of {sorted(ENGINE_PROFILES)}"
+        )
+    settings = ENGINE_PROFILES[profile]
+    parsed = make_url(url)
+    dialect = parsed.get_backend_name()
+    if dialect not in SUPPORTED_DIALECTS:
+        raise ValueError(
+            f"Unsupported database {dialect!r}, expected one of {list(SUPPORTED_DIALECTS)}"
+        )
+    echo = os.getenv("SQL_ECHO", str(settings["echo"])).lower() in ("1", "true", "yes")
+
+    # In-memory SQLite runs on a single static connection with no pool to size.
+    if ":memory:" in url:
+        pool = {}
+    else:
+        pool = {**settings["pool"], **DIALECT_POOLS.get(dialect, {})}
+        for option, variable in POOL_ENV_OVERRIDES.items():
+            if os.getenv(variable):
+                pool[option] = int(os.environ[variable])
+
+    engine = create_async_engine(
+        url,
+        echo=echo,
+        connect_args=DRIVER_CONNECT_ARGS.get(parsed.get_driver_name(), {}),
+        **pool,
+    )
+    if dialect == "sqlite" and settings["pragmas"]:
+        _apply_pragmas(engine, settings["pragmas"])
+    return engine
+
+
+engine = make_engine()
 
 Base = declarative_base()
 
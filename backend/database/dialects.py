@@ -0,0 +1,47 @@
+from sqlalchemy import String, func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+
+# Backends every dialect-specific construct below compiles for.
+SUPPORTED_DIALECTS = ("sqlite", "postgresql")
+
+
+class year_month(FunctionElement):
+    """
+    Format a timestamp as 'YYYY-MM' on any supported backend.
+    """
+
+    type = String()
+    inherit_cache = True
+
+    def __init__(self, column):
+        super().__init__(column)
+
+
+@compiles(year_month, "sqlite")
+def _year_month_sqlite(element, compiler, **kw):
+    return compiler.process(func.strftime("%Y-%m", *element.clauses), **kw)
+
+
+@compiles(year_month, "postgresql")
+def _year_month_postgresql(element, compiler, **kw):
+    return "to_char(%s, 'YYYY-MM')" % compiler.process(element.clauses, **kw)
+
+
+_UPSERT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def upsert_insert(db: AsyncSession, table):
+    """
+    The dialect-specific INSERT construct that supports ON CONFLICT DO UPDATE.
+    """
+    dialect = db.bind.dialect.name
+    if dialect not in _UPSERT_INSERTS:
+        raise NotImplementedError(f"Upserts are not supported on {dialect}")
+    return _UPSERT_INSERTS[dialect](table)
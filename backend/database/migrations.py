@@ -0,0 +1,184 @@
+import json
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+from database.db import Base
+from services.feedback_tags import tag_rows
+
+
+SUPERSEDED_INDEXES = (
+    "ix_feedbacks_given_by_member",
+    "ix_feedbacks_member_created_at",
+)
+
+
+def add_feedback_member_id(connection: Connection):
+    """
+    Add `feedbacks.member_id` to databases created before it existed and
+    backfill it from the member name.
+
+    Only employees of the giver's company are considered, as when feedback
+    is created. Rows whose name matches several of them are linked to the
+    oldest account, and rows matching none are left NULL.
+
+    Rows an earlier backfill linked to an employee of another company are
+    unlinked and matched again. The rollups are then cleared so startup
+    rebuilds them from the corrected links.
+    """
+    columns = {column["name"] for column in inspect(connection).get_columns("feedbacks")}
+    if "member_id" not in columns:
+        connection.execute(
+            text("ALTER TABLE feedbacks ADD COLUMN member_id INTEGER REFERENCES users(id)")
+        )
+    relinked = connection.execute(
+        text(
+            "UPDATE feedbacks SET member_id = NULL WHERE member_id IS NOT NULL "
+            "AND (SELECT company FROM users WHERE users.id = feedbacks.member_id) "
+            "!= (SELECT company FROM users WHERE users.id = feedbacks.given_by)"
+        )
+    ).rowcount
+    if relinked:
+        connection.execute(text("DELETE FROM feedback_stats"))
+    connection.execute(
+        text(
+            "UPDATE feedbacks SET member_id = ("
+            "SELECT users.id FROM users "
+            "WHERE users.name = feedbacks.member AND users.role = 'employee' "
+            "AND users.company = ("
+            "SELECT giver.company FROM users giver WHERE giver.id = feedbacks.given_by"
+            ") "
+            "ORDER BY users.id LIMIT 1"
+            ") WHERE member_id IS NULL"
+        )
+    )
+
+
+def normalize_feedback_timestamps(connection: Connection):
+    """
+    Rewrite `feedbacks.created_at` values stored without microseconds, e.g.
+    rows written by hand or by older tools, in the `YYYY-MM-DD HH:MM:SS.ffffff`
+    form SQLAlchemy writes.
+
+    SQLite compares these columns as text, so `2025-06-25 19:17:23` sorts
+    before `2025-06-25 19:17:23.000000` and keyset pagination would never seek
+    past such a row.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    connection.execute(
+        text(
+            "UPDATE feedbacks SET created_at = substr("
+            "replace(created_at, 'T', ' ') "
+            "|| CASE WHEN instr(created_at, '.') THEN '000000' ELSE '.000000' END, 1, 26"
+            ") WHERE created_at NOT LIKE '____-__-__ __:__:__.______' "
+            "AND length(created_at) BETWEEN 19 AND 25"
+        )
+    )
+
+
+def drop_superseded_indexes(connection: Connection):
+    for name in SUPERSEDED_INDEXES:
+        connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+
+def create_missing_indexes(connection: Connection):
+    """
+    Create indexes declared on the models that an existing database lacks.
+
+    `Base.metadata.create_all` only emits indexes for tables it creates, so
+    indexes added to a model later never reach databases created before them.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
+FEEDBACK_SEARCH_TRIGGERS = {
+    "feedbacks_fts_insert": (
+        "AFTER INSERT ON feedbacks BEGIN "
+        "INSERT INTO feedbacks_fts(rowid, strengths, improvement) "
+        "VALUES (new.id, new.strengths, new.improvement); END"
+    ),
+    "feedbacks_fts_delete": (
+        "AFTER DELETE ON feedbacks BEGIN "
+        "INSERT INTO feedbacks_fts(feedbacks_fts, rowid, strengths, improvement) "
+        "VALUES ('delete', old.id, old.strengths, old.improvement); END"
+    ),
+    "feedbacks_fts_update": (
+        "AFTER UPDATE OF strengths, improvement ON feedbacks BEGIN "
+        "INSERT INTO feedbacks_fts(feedbacks_fts, rowid, strengths, improvement) "
+        "VALUES ('delete', old.id, old.strengths, old.improvement); "
+        "INSERT INTO feedbacks_fts(rowid, strengths, improvement) "
+        "VALUES (new.id, new.strengths, new.improvement); END"
+    ),
+}
+
+
+def create_feedback_search_index(connection: Connection):
+    """
+    Create the full-text index searched by `/feedback/search`.
+
+    On SQLite this is an external-content FTS5 table over `feedbacks` kept in
+    sync by triggers, filled from the existing rows when first created. On
+    PostgreSQL it is a GIN expression index over the same text.
+    """
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        connection.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_feedbacks_search ON feedbacks "
+                "USING GIN (to_tsvector('english', strengths || ' ' || improvement))"
+            )
+        )
+        return
+    if dialect != "sqlite":
+        return
+
+    exists = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'feedbacks_fts'")
+    ).first()
+    if not exists:
+        connection.execute(
+            text(
+                "CREATE VIRTUAL TABLE feedbacks_fts USING fts5("
+                "strengths, improvement, content='feedbacks', content_rowid='id', "
+                "tokenize='porter unicode61')"
+            )
+        )
+        connection.execute(text("INSERT INTO feedbacks_fts(feedbacks_fts) VALUES ('rebuild')"))
+    for name, body in FEEDBACK_SEARCH_TRIGGERS.items():
+        connection.execute(text(f"CREATE TRIGGER IF NOT EXISTS {name} {body}"))
+
+
+def backfill_feedback_tags(connection: Connection):
+    """
+    Fill `feedback_tags` from the JSON `feedbacks.tags` column when the table
+    is still empty, e.g. right after it was introduced.
+    """
+    if connection.execute(text("SELECT 1 FROM feedback_tags LIMIT 1")).first():
+        return
+    result = connection.execute(
+        text("SELECT id, tags FROM feedbacks WHERE tags IS NOT NULL ORDER BY id")
+    )
+    while True:
+        batch = result.fetchmany(1000)
+        if not batch:
+            break
+        rows = []
+        for feedback_id, tags in batch:
+            if isinstance(tags, str):
+                tags = json.loads(tags)
+            rows.extend(tag_rows(feedback_id, tags))
+        if rows:
+            connection.execute(
+                text("INSERT INTO feedback_tags (feedback_id, tag) VALUES (:feedback_id, :tag)"),
+                rows,
+            )
+
+
+def run_migrations(connection: Connection):
+    add_feedback_member_id(connection)
+    normalize_feedback_timestamps(connection)
+    drop_superseded_indexes(connection)
+    create_missing_indexes(connection)
+    create_feedback_search_index(connection)
+    backfill_feedback_tags(connection)
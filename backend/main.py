@@ -1,12 +1,16 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from database.db import engine, Base
+from database.db import engine, Base, async_session_maker
+from database.migrations import run_migrations
 from contextlib import asynccontextmanager
 import routers.auth as auth
 import routers.feedback as feedback
 from middleware.auth_middleware import auth_middleware
+from middleware.metrics_middleware import metrics_middleware
 import routers.activity_log as activity_log
 import routers.user_management as user_management
+import routers.metrics as metrics
+from services import feedback_stats, passwords, pdf_reports, request_metrics
 from fastapi.middleware.httpsredirect import HTTPSRedirectMiddleware
 
 
@@ -14,8 +18,13 @@ from fastapi.middleware.httpsredirect import HTTPSRedirectMiddleware
 async def lifespan(app: FastAPI):
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-        print("🏪Database is ready")
+        await conn.run_sync(run_migrations)
+    async with async_session_maker() as db:
+        await feedback_stats.ensure_stats(db)
+    print("🏪Database is ready")
     yield
+    passwords.shutdown()
+    pdf_reports.shutdown()
     await engine.dispose()
 
 app = FastAPI(lifespan=lifespan)
@@ -29,8 +38,12 @@ app.add_middleware(
     allow_headers=["Authorization", "Content-Type"],
 )
 auth_middleware(app)
+# Added last so it wraps authentication and also times rejected requests.
+metrics_middleware(app)
+request_metrics.instrument(engine)
 
 app.include_router(auth.router)
 app.include_router(feedback.router) 
 app.include_router(activity_log.router)
 app.include_router(user_management.router)
+app.include_router(metrics.router)
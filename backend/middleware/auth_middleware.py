@@ -1,22 +1,35 @@
 import os
-import os
 from fastapi import Request
 from fastapi.responses import JSONResponse
 from jose import jwt, JWTError
+from sqlalchemy.future import select
+from database.db import async_session_maker
+from middleware.token_cache import CurrentUser, TokenCache
+from models.user import User
 from routers.auth import ALGORITHM
+from routers.metrics import METRICS_TOKEN
 from dotenv import load_dotenv
 
 load_dotenv()
 
 SECRET_KEY = os.getenv("SECRET_KEY")
-from routers.auth import ALGORITHM
-from dotenv import load_dotenv
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "4096"))
+TOKEN_CACHE_TTL_SECONDS = float(os.getenv("TOKEN_CACHE_TTL_SECONDS", "60"))
 
-load_dotenv()
+EXCLUDE_PATHS = {"/login", "/signup", "/docs"}
 
-SECRET_KEY = os.getenv("SECRET_KEY")
+token_cache = TokenCache(TOKEN_CACHE_SIZE, TOKEN_CACHE_TTL_SECONDS)
 
-EXCLUDE_PATHS = {"/login", "/signup", "/docs"}
+
+async def _load_user(email: str) -> CurrentUser | None:
+    async with async_session_maker() as db:
+        result = await db.execute(
+            select(User.id, User.email, User.name, User.role, User.company).where(
+                User.email == email
+            )
+        )
+        row = result.first()
+    return CurrentUser(*row) if row else None
 
 
 def auth_middleware(app):
@@ -28,6 +41,8 @@ def auth_middleware(app):
         for path in EXCLUDE_PATHS:
             if request.url.path.startswith(path):
                 return await call_next(request)
+        if METRICS_TOKEN and request.url.path == "/metrics":
+            return await call_next(request)
 
         auth_header = request.headers.get("Authorization")
         if not auth_header or not auth_header.startswith("Bearer "):
@@ -36,13 +51,24 @@ def auth_middleware(app):
             )
 
         token = auth_header.split(" ", 1)[1]
-        try:
+        user = token_cache.get(token)
+        if user is None:
             if SECRET_KEY is None:
                 return JSONResponse(
                     status_code=500, content={"detail": "Server configuration error"}
                 )
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-            request.state.user = payload.get("sub")
-        except JWTError:
-            return JSONResponse(status_code=401, content={"detail": "Invalid token"})
+            try:
+                payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+            except JWTError:
+                return JSONResponse(
+                    status_code=401, content={"detail": "Invalid token"}
+                )
+            user = await _load_user(payload.get("sub"))
+            if user is None:
+                return JSONResponse(
+                    status_code=401, content={"detail": "Invalid token"}
+                )
+            if payload.get("exp") is not None:
+                token_cache.put(token, payload["exp"], user)
+        request.state.user = user
         return await call_next(request)
@@ -0,0 +1,55 @@
+import time
+from fastapi import Request
+from starlette.routing import Match
+from services import request_metrics
+
+
+def _route_path(request: Request) -> str:
+    """
+    The path template of the route `request` is for, matched the way the
+    router will so requests rejected before routing are labelled too.
+    """
+    partial = None
+    for route in request.app.router.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return route.path
+        if match == Match.PARTIAL and partial is None:
+            partial = route.path
+    return partial or request_metrics.UNMATCHED_ROUTE
+
+
+def metrics_middleware(app):
+    @app.middleware("http")
+    async def metrics_middleware(request: Request, call_next):
+        method, route = request.method, _route_path(request)
+        stats = request_metrics.track()
+        request_metrics.metrics.started(method, route)
+        start = time.perf_counter()
+        try:
+            response = await call_next(request)
+        except Exception:
+            request_metrics.metrics.finished(
+                method, route, 500, time.perf_counter() - start, stats
+            )
+            raise
+
+        # Streamed bodies keep querying after the headers go out, so the
+        # request is only recorded once the last chunk has been sent.
+        response.headers["Server-Timing"] = (
+            f'db;dur={stats.seconds * 1000:.2f};desc="{stats.queries} queries", '
+            f"app;dur={(time.perf_counter() - start) * 1000:.2f}"
+        )
+        body = response.body_iterator
+
+        async def measured_body():
+            try:
+                async for chunk in body:
+                    yield chunk
+            finally:
+                request_metrics.metrics.finished(
+                    method, route, response.status_code, time.perf_counter() - start, stats
+                )
+
+        response.body_iterator = measured_body()
+        return response
@@ -0,0 +1,51 @@
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+
+class CurrentUser(NamedTuple):
+    id: int
+    email: str
+    name: str
+    role: str
+    company: str
+
+
+class TokenCache:
+    """
+    Bounded LRU of verified bearer tokens and the user they belong to.
+
+    Entries are dropped once the token's `exp` passes, so a cached token is
+    never honoured for longer than a fresh decode would allow. They are also
+    dropped `ttl` seconds after being cached, so a changed or deleted account
+    is looked up again within that time.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, CurrentUser]] = OrderedDict()
+
+    def get(self, token: str) -> CurrentUser | None:
+        entry = self._entries.get(token)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if expires_at <= time.time():
+            del self._entries[token]
+            return None
+        self._entries.move_to_end(token)
+        return user
+
+    def put(self, token: str, expires_at: float, user: CurrentUser):
+        expires_at = min(expires_at, time.time() + self.ttl)
+        self._entries[token] = (expires_at, user)
+        self._entries.move_to_end(token)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index
 from database.db import Base
 from sqlalchemy.types import JSON
 from datetime import datetime
@@ -14,3 +14,7 @@ class ActivityLog(Base):
     target = Column(String, nullable=True)
     details = Column(JSON, nullable=True)
     timestamp = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_activity_logs_manager_timestamp", "manager_id", "timestamp"),
+    )
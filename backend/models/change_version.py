@@ -0,0 +1,9 @@
+from sqlalchemy import Column, Integer, ForeignKey
+from database.db import Base
+
+
+class ChangeVersion(Base):
+    __tablename__ = "change_versions"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Integer, String, ForeignKey, Text, DateTime
+from sqlalchemy import Boolean, Column, Integer, String, ForeignKey, Text, DateTime, Index
 from database.db import Base
 from sqlalchemy.types import JSON
 from datetime import datetime
@@ -9,6 +9,7 @@ class Feedback(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     member = Column(String, nullable=False)
+    member_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     strengths = Column(Text, nullable=False)
     improvement = Column(Text, nullable=False)
     sentiment = Column(String, nullable=False)
@@ -17,6 +18,21 @@ class Feedback(Base):
     acknowledged = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        Index("ix_feedbacks_given_by_created_at", "given_by", "created_at"),
+        Index("ix_feedbacks_given_by_member_id", "given_by", "member_id"),
+        Index("ix_feedbacks_member_id_created_at", "member_id", "created_at"),
+    )
+
+
+class FeedbackTag(Base):
+    __tablename__ = "feedback_tags"
+
+    feedback_id = Column(Integer, ForeignKey("feedbacks.id"), primary_key=True)
+    tag = Column(String, primary_key=True)
+
+    __table_args__ = (Index("ix_feedback_tags_tag_feedback_id", "tag", "feedback_id"),)
+
 
 class FeedbackRequest(Base):
     __tablename__ = "feedback_requests"
@@ -25,3 +41,18 @@ class FeedbackRequest(Base):
     employee_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     manager_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     status = Column(String, default="pending")
+
+    __table_args__ = (
+        Index(
+            "ix_feedback_requests_manager_status_employee",
+            "manager_id",
+            "status",
+            "employee_id",
+        ),
+        Index(
+            "ix_feedback_requests_employee_manager_status",
+            "employee_id",
+            "manager_id",
+            "status",
+        ),
+    )
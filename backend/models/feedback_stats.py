@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, ForeignKey
+from database.db import Base
+
+
+class FeedbackStats(Base):
+    __tablename__ = "feedback_stats"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    scope = Column(String, primary_key=True)
+    total = Column(Integer, nullable=False, default=0)
+    acknowledged = Column(Integer, nullable=False, default=0)
+    positive = Column(Integer, nullable=False, default=0)
+    neutral = Column(Integer, nullable=False, default=0)
+    negative = Column(Integer, nullable=False, default=0)
+
+
+class SentimentTrend(Base):
+    __tablename__ = "sentiment_trends"
+
+    manager_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    month = Column(String, primary_key=True)
+    sentiment = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Enum
+from sqlalchemy import Column, Integer, String, Enum, Index
 from database.db import Base
 from enum import Enum as PyEnum
 
@@ -17,3 +17,5 @@ class User(Base):
     password = Column(String, nullable=False)
     company = Column(String, nullable=False)
     role = Column(Enum(RoleEnum), nullable=False)
+
+    __table_args__ = (Index("ix_users_company_role", "company", "role"),)
@@ -1,4 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Body
+import asyncio
+import os
+from fastapi import APIRouter, Depends, HTTPException, Query, Body, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from database.db import get_db
@@ -6,6 +9,11 @@ from sqlalchemy import desc
 from models.activity_log import ActivityLog
 from models.user import User
 from schemas.activity_log import ActivityLogCreate, ActivityLogSchema
+from services.activity_feed import activity_feed
+from services.change_versions import user_etag
+
+
+ACTIVITY_FEED_KEEPALIVE_SECONDS = float(os.getenv("ACTIVITY_FEED_KEEPALIVE_SECONDS", "15"))
 
 
 router = APIRouter()
@@ -22,7 +30,11 @@ async def create_activity_log(
     return db_log
 
 
-@router.get("/manager/{manager_id}/activities", response_model=list[ActivityLogSchema])
+@router.get(
+    "/manager/{manager_id}/activities",
+    response_model=list[ActivityLogSchema],
+    dependencies=[Depends(user_etag("manager_id"))],
+)
 async def get_manager_activities(manager_id: int, db: AsyncSession = Depends(get_db)):
     result = await db.execute(
         select(ActivityLog, User)
@@ -37,3 +49,34 @@ async def get_manager_activities(manager_id: int, db: AsyncSession = Depends(get
         activity_dict["user_name"] = user.name
         activities.append(activity_dict)
     return activities
+
+
+@router.get("/manager/{manager_id}/activities/stream")
+async def stream_manager_activities(manager_id: int, request: Request):
+    """
+    Push new activity and dashboard metric deltas to a manager as Server-Sent
+    Events.
+
+    Events are `activity` (an ActivityLogSchema), `metrics` (counter deltas
+    matching the dashboard's `counters`) and `resync` (refetch everything).
+    """
+    caller = request.state.user
+    if caller.role != "manager" or caller.id != manager_id:
+        raise HTTPException(status_code=403, detail="Not authorized to follow this feed")
+
+    async def events():
+        with activity_feed.subscribe(manager_id) as queue:
+            yield ": connected\n\n"
+            while True:
+                try:
+                    yield await asyncio.wait_for(
+                        queue.get(), ACTIVITY_FEED_KEEPALIVE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
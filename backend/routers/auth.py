@@ -3,12 +3,13 @@ from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from passlib.context import CryptContext
 from jose import jwt
 import datetime
 from database.db import get_db
 from models.user import User, RoleEnum
 from schemas import user as user_schema
+from services import change_versions
+from services.passwords import hash_password, verify_password
 from dotenv import load_dotenv
 
 
@@ -22,8 +23,6 @@ SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 3600
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 @router.post("/signup", response_model=user_schema.UserOut)
 async def signup(user: user_schema.UserCreate, db: AsyncSession = Depends(get_db)):
@@ -37,7 +36,7 @@ async def signup(user: user_schema.UserCreate, db: AsyncSession = Depends(get_db
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
 
-    hashed_password = pwd_context.hash(user.password)
+    hashed_password = await hash_password(user.password)
     db_user = User(
         name=user.name,
         email=user.email,
@@ -47,6 +46,9 @@ async def signup(user: user_schema.UserCreate, db: AsyncSession = Depends(get_db
     )
 
     db.add(db_user)
+    if user.role == "employee":
+        # The new employee joins the team lists of the company's managers.
+        await change_versions.bump_company_managers(db, user.company)
     await db.commit()
     await db.refresh(db_user)
     return db_user
@@ -59,7 +61,7 @@ async def login(
     result = await db.execute(select(User).where(User.email == form_data.username))
     user = result.scalar_one_or_none()
 
-    if not user or not pwd_context.verify(
+    if not user or not await verify_password(
         form_data.password, getattr(user, "password", "")
     ):
         raise HTTPException(status_code=400, detail="Incorrect email or password")
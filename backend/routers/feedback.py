@@ -1,7 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Body
+import csv
+import json
+from fastapi import APIRouter, Depends, HTTPException, Query, Body, Request
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, insert, update
 from sqlalchemy.future import select
+from sqlalchemy.orm import aliased
 from database.db import get_db
+from models.activity_log import ActivityLog
 from models.feedback import Feedback
 from models.user import User
 from models.feedback import FeedbackRequest
@@ -11,39 +16,103 @@ from schemas.feedback import (
     FeedbackRequestOut,
     FeedbackRequestComplete,
     FeedbackSchema,
+    FeedbackPage,
+    FeedbackImportResult,
+    FeedbackAcknowledgeBatch,
+    FeedbackAcknowledgeBatchResult,
+    FeedbackRequestCompleteBatch,
+    FeedbackSearchPage,
 )
-from models.activity_log import ActivityLog
-from fastapi.responses import StreamingResponse
-from io import BytesIO
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
+from fastapi.responses import Response, StreamingResponse
+from datetime import datetime
 from schemas.feedback import FeedbackEdit
+from services import feedback_stats
+from services.activity_feed import activity_feed
+from services.metrics_cache import metrics_cache
+from services.pagination import PageParams, page_params, fetch_feedback_page
+from services import (
+    change_versions,
+    feedback_export,
+    feedback_import,
+    feedback_search,
+    feedback_tags,
+    pdf_cache,
+    pdf_reports,
+)
+from typing import Literal
 
 
 router = APIRouter()
 
+# Times an edit re-reads a row that changed between its read and its write.
+EDIT_ATTEMPTS = 5
+
 
 @router.post("/feedback", response_model=FeedbackOut)
-async def create_feedback(feedback: FeedbackCreate, db: AsyncSession = Depends(get_db)):
+async def create_feedback(
+    feedback: FeedbackCreate, request: Request, db: AsyncSession = Depends(get_db)
+):
     """
     Create a new feedback entry.
+
+    The member must be an employee of the giver's company. A given member_id
+    must name that employee; without one the oldest account matching the
+    member name is used.
     """
-    try:
-        db_feedback = Feedback(**feedback.dict())
-        db.add(db_feedback)
-        await db.commit()
-        await db.refresh(db_feedback)
+    giver_company = (
+        select(User.company).where(User.id == feedback.given_by).scalar_subquery()
+    )
+    query = select(User.id).where(
+        User.name == feedback.member,
+        User.role == "employee",
+        User.company == giver_company,
+    )
+    if feedback.member_id is None:
+        query = query.order_by(User.id).limit(1)
+    else:
+        query = query.where(User.id == feedback.member_id)
+    member_id = await db.scalar(query)
+    if member_id is None:
+        if feedback.member_id is None:
+            raise HTTPException(status_code=404, detail="Employee not found")
+        raise HTTPException(
+            status_code=400,
+            detail="member_id is not an employee of the giver's company named member",
+        )
+    feedback.member_id = member_id
 
-        db_log = ActivityLog(
-            user_id=feedback.given_by,
+    try:
+        db_feedback = await db.scalar(
+            insert(Feedback)
+            .values(**feedback.model_dump(), created_at=datetime.utcnow())
+            .returning(Feedback)
+        )
+        delta = feedback_stats.contribution(
+            db_feedback.sentiment, db_feedback.acknowledged
+        )
+        await feedback_stats.apply_delta(
+            db,
+            db_feedback.member_id,
+            db_feedback.given_by,
+            db_feedback.created_at,
+            delta,
+        )
+        await feedback_tags.add_tags(
+            db, feedback_tags.tag_rows(db_feedback.id, db_feedback.tags)
+        )
+        log = ActivityLog(
+            user_id=db_feedback.given_by,
             action="sent_feedback",
-            target=feedback.member,
+            target=db_feedback.member,
             details={"feedback_id": db_feedback.id},
-            manager_id=feedback.given_by,
+            manager_id=db_feedback.given_by,
         )
-        db.add(db_log)
+        db.add(log)
+        await change_versions.bump(db, db_feedback.given_by, db_feedback.member_id)
         await db.commit()
-        await db.refresh(db_log)
+        await metrics_cache.invalidate(db_feedback.given_by, db_feedback.member_id)
+        activity_feed.publish_activity(log, request.state.user.name)
+        activity_feed.publish_metrics(db_feedback.given_by, delta)
         return db_feedback
     except Exception as e:
         await db.rollback()
@@ -52,64 +121,146 @@ async def create_feedback(feedback: FeedbackCreate, db: AsyncSession = Depends(g
         )
 
 
-@router.get("/feedback", response_model=list[FeedbackOut])
+@router.post("/feedback/import", response_model=FeedbackImportResult)
+async def import_feedbacks(request: Request, db: AsyncSession = Depends(get_db)):
+    """
+    Bulk-import feedback from a JSON array, a CSV body or a multipart `file`
+    upload of either, reporting the rows that could not be imported.
+    """
+    caller = request.state.user
+    if caller.role != "manager":
+        raise HTTPException(status_code=403, detail="Only managers can import feedback")
+
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("multipart/form-data"):
+        form = await request.form()
+        upload = form.get("file")
+        if upload is None or isinstance(upload, str):
+            raise HTTPException(status_code=400, detail="Missing file upload")
+        body = await upload.read()
+        is_csv = (upload.filename or "").lower().endswith(".csv") or (
+            upload.content_type == "text/csv"
+        )
+    else:
+        body = await request.body()
+        is_csv = content_type.startswith("text/csv")
+
+    try:
+        if is_csv:
+            records = feedback_import.parse_csv(body.decode("utf-8-sig"))
+        else:
+            records = feedback_import.parse_json(json.loads(body))
+    except (UnicodeDecodeError, json.JSONDecodeError, csv.Error) as e:
+        raise HTTPException(status_code=400, detail=f"Could not parse upload: {str(e)}")
+    return await feedback_import.import_feedbacks(db, caller.company, records)
+
+
+@router.get("/feedback", response_model=FeedbackPage)
 async def get_feedbacks(
     user: str = Query(..., description="ID of the user whose feedbacks to fetch"),
+    tag: list[str] | None = Query(None, description="Only feedback carrying every tag"),
+    page: PageParams = Depends(page_params),
     db: AsyncSession = Depends(get_db),
 ):
     """
-    Get all feedbacks for a specific user.
+    Get a page of feedbacks for a specific user, newest first.
     """
     try:
-        result = await db.execute(select(Feedback).where(Feedback.member == user))
-        return result.scalars().all()
+        return await fetch_feedback_page(
+            db,
+            feedback_tags.with_tags(
+                select(Feedback)
+                .join(User, Feedback.member_id == User.id)
+                .where(User.name == user),
+                tag,
+            ),
+            page,
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to fetch feedbacks: {str(e)}"
         )
 
 
+@router.get("/feedback/search", response_model=FeedbackSearchPage)
+async def search_feedbacks(
+    request: Request,
+    q: str = Query(..., min_length=1, description="Words or \"quoted phrases\" to find"),
+    manager_id: int | None = Query(None),
+    member_id: int | None = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Full-text search over the strengths and improvement of feedback in the
+    caller's company, ranked by relevance with matches highlighted.
+    """
+    caller = request.state.user
+    if caller.role != "manager":
+        raise HTTPException(status_code=403, detail="Only managers can search feedback")
+    return await feedback_search.search_feedback(
+        db, caller.company, q, limit, offset, manager_id, member_id
+    )
+
+
 @router.post("/feedback/request", response_model=FeedbackRequestOut)
 async def create_request_feedback(
-    member: str = Body(..., embed=True), db: AsyncSession = Depends(get_db)
+    request: Request,
+    member: str = Body(..., embed=True),
+    db: AsyncSession = Depends(get_db),
 ):
     """
-    Create a feedback request for an employee from their manager.
+    Create a feedback request for an employee of the caller's company from
+    that company's longest-standing manager.
+
+    An employee requesting feedback under their own name always gets their
+    own account, even if a colleague shares the name.
     """
-    emp_result = await db.execute(
-        select(User).where(User.name == member, User.role == "employee")
+    caller = request.state.user
+    manager = aliased(User)
+    manager_id = (
+        select(func.min(manager.id))
+        .where(manager.company == User.company, manager.role == "manager")
+        .scalar_subquery()
     )
-    emp = emp_result.scalar_one_or_none()
-    if not emp:
-        raise HTTPException(status_code=404, detail="Employee not found")
-
-    mgr_result = await db.execute(
-        select(User).where(User.company == emp.company, User.role == "manager")
+    result = await db.execute(
+        select(User.id, manager_id.label("manager_id"))
+        .where(
+            User.name == member,
+            User.role == "employee",
+            User.company == caller.company,
+        )
+        .order_by(User.id != caller.id, User.id)
+        .limit(1)
     )
-    mgr = mgr_result.scalar_one_or_none()
-    if not mgr:
+    row = result.first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    if row.manager_id is None:
         raise HTTPException(
             status_code=404, detail="Manager not found for this company"
         )
 
     try:
-        db_request = FeedbackRequest(
-            employee_id=emp.id, manager_id=mgr.id, status="pending"
+        db_request = await db.scalar(
+            insert(FeedbackRequest)
+            .values(employee_id=row.id, manager_id=row.manager_id, status="pending")
+            .returning(FeedbackRequest)
         )
-        db.add(db_request)
-        await db.commit()
-        await db.refresh(db_request)
-
-        db_log = ActivityLog(
-            user_id=emp.id,
+        log = ActivityLog(
+            user_id=row.id,
             action="requested_feedback",
-            target=str(mgr.id),
+            target=str(row.manager_id),
             details={"request_id": db_request.id},
-            manager_id=mgr.id,
+            manager_id=row.manager_id,
         )
-        db.add(db_log)
+        db.add(log)
+        await change_versions.bump(db, row.manager_id, row.id)
         await db.commit()
-        await db.refresh(db_log)
+        await metrics_cache.invalidate(row.manager_id, row.id)
+        activity_feed.publish_activity(log, member)
+        activity_feed.publish_metrics(row.manager_id, {"total_requests": 1})
         return db_request
     except Exception as e:
         await db.rollback()
@@ -123,124 +274,350 @@ async def acknowledge_feedback(feedback_id: int, db: AsyncSession = Depends(get_
     """
     Mark a feedback as acknowledged by the employee.
     """
-    result = await db.execute(select(Feedback).where(Feedback.id == feedback_id))
-    feedback = result.scalar_one_or_none()
+    # Only an unacknowledged row matches, so the rollups and the activity log
+    # change once however many times the employee acknowledges.
+    feedback = await db.scalar(
+        update(Feedback)
+        .where(Feedback.id == feedback_id, Feedback.acknowledged.isnot(True))
+        .values(acknowledged=True)
+        .returning(Feedback)
+    )
     if not feedback:
-        raise HTTPException(status_code=404, detail="Feedback not found")
-    feedback.acknowledged = True
-    await db.commit()
+        exists = await db.scalar(select(Feedback.id).where(Feedback.id == feedback_id))
+        if not exists:
+            raise HTTPException(status_code=404, detail="Feedback not found")
+        return {"message": "Feedback acknowledged"}
 
-    emp_result = await db.execute(select(User).where(User.name == feedback.member))
-    emp = emp_result.scalar_one_or_none()
-    if emp:
-        db_log = ActivityLog(
-            user_id=emp.id,
+    delta = feedback_stats.difference(
+        feedback_stats.contribution(feedback.sentiment, False),
+        feedback_stats.contribution(feedback.sentiment, True),
+    )
+    await feedback_stats.apply_delta(
+        db, feedback.member_id, feedback.given_by, feedback.created_at, delta
+    )
+    log = None
+    if feedback.member_id is not None:
+        log = ActivityLog(
+            user_id=feedback.member_id,
             action="acknowledged_feedback",
             target=str(feedback.id),
             details={"feedback_id": feedback.id},
             manager_id=feedback.given_by,
         )
-        db.add(db_log)
-        await db.commit()
-        await db.refresh(db_log)
+        db.add(log)
+    await change_versions.bump(db, feedback.given_by, feedback.member_id)
+    await db.commit()
+    await pdf_cache.invalidate(feedback.id)
+    await metrics_cache.invalidate(feedback.given_by, feedback.member_id)
+    if log is not None:
+        activity_feed.publish_activity(log, feedback.member)
+    activity_feed.publish_metrics(feedback.given_by, delta)
     return {"message": "Feedback acknowledged"}
 
 
+@router.post(
+    "/feedback/acknowledge-batch", response_model=FeedbackAcknowledgeBatchResult
+)
+async def acknowledge_feedbacks(
+    data: FeedbackAcknowledgeBatch,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Acknowledge several feedbacks received by the caller at once.
+
+    Ids that are unknown, belong to someone else or were already acknowledged
+    are returned as unchanged.
+    """
+    caller = request.state.user
+    result = await db.scalars(
+        update(Feedback)
+        .where(
+            Feedback.id.in_(data.feedback_ids),
+            Feedback.member_id == caller.id,
+            Feedback.acknowledged.isnot(True),
+        )
+        .values(acknowledged=True)
+        .returning(Feedback)
+        .execution_options(synchronize_session=False)
+    )
+    feedbacks = result.all()
+    changes = [
+        (
+            feedback.member_id,
+            feedback.given_by,
+            feedback.created_at,
+            feedback_stats.difference(
+                feedback_stats.contribution(feedback.sentiment, False),
+                feedback_stats.contribution(feedback.sentiment, True),
+            ),
+        )
+        for feedback in feedbacks
+    ]
+    logs = []
+    if feedbacks:
+        await feedback_stats.apply_deltas(db, changes)
+        now = datetime.utcnow()
+        result = await db.scalars(
+            insert(ActivityLog).returning(ActivityLog),
+            [
+                {
+                    "user_id": feedback.member_id,
+                    "action": "acknowledged_feedback",
+                    "target": str(feedback.id),
+                    "details": {"feedback_id": feedback.id},
+                    "manager_id": feedback.given_by,
+                    "timestamp": now,
+                }
+                for feedback in feedbacks
+            ],
+        )
+        # Returned in no particular order: asking for parameter order would
+        # make SQLite insert row by row, and each row describes itself.
+        logs = sorted(result.all(), key=lambda log: log.id)
+        await change_versions.bump(
+            db, caller.id, *(feedback.given_by for feedback in feedbacks)
+        )
+    await db.commit()
+
+    acknowledged = sorted(feedback.id for feedback in feedbacks)
+    await pdf_cache.invalidate(*acknowledged)
+    await metrics_cache.invalidate(caller.id, *(feedback.given_by for feedback in feedbacks))
+    for log in logs:
+        activity_feed.publish_activity(log, caller.name)
+    for _, manager_id, _, delta in changes:
+        activity_feed.publish_metrics(manager_id, delta)
+    return {
+        "acknowledged": acknowledged,
+        "unchanged": sorted(set(data.feedback_ids) - set(acknowledged)),
+    }
+
+
 @router.put("/feedback_request/complete", response_model=FeedbackRequestOut)
 async def complete_feedback_request(
     data: FeedbackRequestComplete, db: AsyncSession = Depends(get_db)
 ):
     """
     Mark a feedback request as completed for an employee-manager pair.
+
+    The employee is looked up by name among the manager's company; when
+    several share the name, their oldest pending request is completed.
     """
-    employee = data.employee
-    manager_id = data.manager_id
-    emp_result = await db.execute(
-        select(User).where(User.name == employee, User.role == "employee")
+    manager_company = (
+        select(User.company).where(User.id == data.manager_id).scalar_subquery()
     )
-    emp = emp_result.scalar_one_or_none()
-    if not emp:
-        raise HTTPException(status_code=404, detail="Employee not found")
-
-    result = await db.execute(
-        select(FeedbackRequest)
+    employee_ids = select(User.id).where(
+        User.name == data.employee,
+        User.role == "employee",
+        User.company == manager_company,
+    )
+    pending_id = (
+        select(FeedbackRequest.id)
         .where(
-            FeedbackRequest.employee_id == emp.id,
-            FeedbackRequest.manager_id == manager_id,
+            FeedbackRequest.employee_id.in_(employee_ids),
+            FeedbackRequest.manager_id == data.manager_id,
             FeedbackRequest.status == "pending",
         )
+        .order_by(FeedbackRequest.id)
         .limit(1)
+        .scalar_subquery()
+    )
+    req = await db.scalar(
+        update(FeedbackRequest)
+        .where(FeedbackRequest.id == pending_id)
+        .values(status="completed")
+        .returning(FeedbackRequest)
+        .execution_options(synchronize_session=False)
     )
-    req = result.scalar_one_or_none()
-
     if not req:
+        emp = await db.scalar(employee_ids.limit(1))
+        if not emp:
+            raise HTTPException(status_code=404, detail="Employee not found")
         raise HTTPException(
             status_code=404, detail="Pending feedback request not found"
         )
-    req.status = "completed"
+    log = ActivityLog(
+        user_id=req.employee_id,
+        action="completed_feedback_request",
+        target=str(req.manager_id),
+        details={"request_id": req.id},
+        manager_id=req.manager_id,
+    )
+    db.add(log)
+    await change_versions.bump(db, req.manager_id, req.employee_id)
     await db.commit()
-    await db.refresh(req)
+    await metrics_cache.invalidate(req.manager_id, req.employee_id)
+    activity_feed.publish_activity(log, data.employee)
+    activity_feed.publish_metrics(req.manager_id, {"completed_requests": 1})
     return req
 
 
+@router.put(
+    "/feedback_request/complete-batch", response_model=list[FeedbackRequestOut]
+)
+async def complete_feedback_requests(
+    data: FeedbackRequestCompleteBatch,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Complete the oldest pending request of each listed employee addressed to
+    the calling manager.
+    """
+    caller = request.state.user
+    if caller.role != "manager":
+        raise HTTPException(
+            status_code=403, detail="Only managers can complete feedback requests"
+        )
+
+    oldest_pending = (
+        select(func.min(FeedbackRequest.id))
+        .join(User, User.id == FeedbackRequest.employee_id)
+        .where(
+            User.name.in_(data.employees),
+            User.role == "employee",
+            FeedbackRequest.manager_id == caller.id,
+            FeedbackRequest.status == "pending",
+        )
+        .group_by(FeedbackRequest.employee_id)
+    )
+    result = await db.scalars(
+        update(FeedbackRequest)
+        .where(FeedbackRequest.id.in_(oldest_pending))
+        .values(status="completed")
+        .returning(FeedbackRequest)
+        .execution_options(synchronize_session=False)
+    )
+    completed = result.all()
+    logs, names = [], {}
+    if completed:
+        now = datetime.utcnow()
+        result = await db.scalars(
+            insert(ActivityLog).returning(ActivityLog),
+            [
+                {
+                    "user_id": req.employee_id,
+                    "action": "completed_feedback_request",
+                    "target": str(req.manager_id),
+                    "details": {"request_id": req.id},
+                    "manager_id": req.manager_id,
+                    "timestamp": now,
+                }
+                for req in completed
+            ],
+        )
+        logs = sorted(result.all(), key=lambda log: log.id)
+        result = await db.execute(
+            select(User.id, User.name).where(
+                User.id.in_([req.employee_id for req in completed])
+            )
+        )
+        names = dict(result.all())
+        await change_versions.bump(
+            db, caller.id, *(req.employee_id for req in completed)
+        )
+    await db.commit()
+    await metrics_cache.invalidate(caller.id, *(req.employee_id for req in completed))
+    for log in logs:
+        activity_feed.publish_activity(log, names[log.user_id])
+    activity_feed.publish_metrics(caller.id, {"completed_requests": len(completed)})
+    return completed
+
+
 @router.get("/feedback/{feedback_id}/export-pdf")
-async def export_feedback_pdf(feedback_id: int, db: AsyncSession = Depends(get_db)):
+async def export_feedback_pdf(
+    feedback_id: int, request: Request, db: AsyncSession = Depends(get_db)
+):
     """
     Export a feedback entry as a PDF file.
     """
-    result = await db.execute(select(Feedback).where(Feedback.id == feedback_id))
-    feedback = result.scalar_one_or_none()
-    if not feedback:
+    result = await db.execute(
+        select(Feedback, User.name)
+        .outerjoin(User, User.id == Feedback.given_by)
+        .where(Feedback.id == feedback_id)
+    )
+    row = result.first()
+    if not row:
         raise HTTPException(status_code=404, detail="Feedback not found")
-
-    manager_result = await db.execute(select(User).where(User.id == feedback.given_by))
-    manager = manager_result.scalar_one_or_none()
-    if not manager:
+    feedback, manager_name = row
+    if manager_name is None:
         raise HTTPException(status_code=404, detail="Manager not found")
 
-    print(feedback)
-    buffer = BytesIO()
-    p = canvas.Canvas(buffer, pagesize=letter)
-    p.setFont("Helvetica-Bold", 16)
-    p.drawString(72, 750, f"Feedback Report (ID: {feedback.id})")
-    p.setFont("Helvetica", 12)
-    y = 720
-    p.drawString(72, y, f"Member: {feedback.member}")
-    y -= 20
-    p.drawString(72, y, f"Strengths: {feedback.strengths}")
-    y -= 20
-    p.drawString(72, y, f"Improvement: {feedback.improvement}")
-    y -= 20
-    p.drawString(72, y, f"Sentiment: {feedback.sentiment}")
-    y -= 20
-    tags = feedback.tags if isinstance(feedback.tags, list) else []
-    p.drawString(72, y, f"Tags: {', '.join(tags) if tags else '-'}")
-    y -= 20
-    p.drawString(72, y, f"Given By: {manager.name}")
-    p.drawString(72, y, f"Given By: {manager.name}")
-    y -= 20
-    p.drawString(
-        72, y, f"Acknowledged: {'Yes' if bool(feedback.acknowledged) else 'No'}"
+    data = pdf_reports.report_data(feedback, manager_name)
+    version = pdf_cache.content_version(data)
+    etag = f'"{version}"'
+    cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if pdf_cache.etag_matches(request.headers.get("If-None-Match"), etag):
+        return Response(status_code=304, headers=cache_headers)
+
+    pdf = await pdf_cache.get_pdf(data, version)
+    return Response(
+        pdf,
+        media_type="application/pdf",
+        headers={
+            **cache_headers,
+            "Content-Disposition": f"attachment; filename=feedback_from_{manager_name}_to_{feedback.member}.pdf",
+        },
     )
-    y -= 20
-    created_at_str = (
-        feedback.created_at.strftime("%Y-%m-%d %H:%M:%S")
-        if feedback.created_at
-        else "-"
+
+
+@router.get("/feedback/export")
+async def export_feedbacks(
+    request: Request,
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    manager_id: int | None = Query(None),
+    member_id: int | None = Query(None),
+    start: datetime | None = Query(None, description="Include feedback created at or after"),
+    end: datetime | None = Query(None, description="Include feedback created before"),
+):
+    """
+    Stream every feedback in the caller's company as NDJSON or CSV.
+    """
+    caller = request.state.user
+    if caller.role != "manager":
+        raise HTTPException(status_code=403, detail="Only managers can export feedback")
+
+    query = feedback_export.export_query(
+        caller.company, manager_id, member_id, start, end
     )
-    p.drawString(72, y, f"Created At: {created_at_str}")
-    p.showPage()
-    p.save()
-    buffer.seek(0)
+    if format == "csv":
+        body, media_type = feedback_export.stream_csv(query), "text/csv"
+    else:
+        body, media_type = feedback_export.stream_ndjson(query), "application/x-ndjson"
     return StreamingResponse(
-        buffer,
-        media_type="application/pdf",
+        body,
+        media_type=media_type,
         headers={
-            "Content-Disposition": f"attachment; filename=feedback_from_{manager.name}_to_{feedback.member}.pdf"
+            "Content-Disposition": f"attachment; filename=feedback_export.{format}"
         },
     )
 
 
+@router.get("/feedback/export-pdf/batch")
+async def export_feedback_pdf_batch(
+    request: Request,
+    manager_id: int | None = Query(None),
+    member_id: int | None = Query(None),
+    start: datetime | None = Query(None, description="Include feedback created at or after"),
+    end: datetime | None = Query(None, description="Include feedback created before"),
+):
+    """
+    Render PDF reports for many feedbacks in parallel and stream them as a zip.
+    """
+    caller = request.state.user
+    if caller.role != "manager":
+        raise HTTPException(status_code=403, detail="Only managers can export feedback")
+
+    query = feedback_export.export_query(
+        caller.company, manager_id, member_id, start, end
+    )
+    return StreamingResponse(
+        pdf_reports.stream_zip(feedback_export.stream_rows(query)),
+        media_type="application/zip",
+        headers={"Content-Disposition": "attachment; filename=feedback_reports.zip"},
+    )
+
+
 @router.put("/feedback/{feedback_id}", response_model=FeedbackSchema)
 async def edit_feedback(
     feedback_id: int,
@@ -251,24 +628,57 @@ async def edit_feedback(
     """
     Edit an existing feedback entry. Only the user who gave the feedback can edit it.
     """
-    result = await db.execute(select(Feedback).where(Feedback.id == feedback_id))
-    feedback = result.scalar_one_or_none()
-    if not feedback:
-        raise HTTPException(status_code=404, detail="Feedback not found")
-    if user_id is not None and feedback.given_by != user_id:
+    changes = data.model_dump(exclude_none=True)
+    # The rollup delta needs the values this UPDATE replaces, which RETURNING
+    # does not give. Only update the row if it still holds the values read, so
+    # a concurrent edit or acknowledgement in between is retried instead of
+    # skewing the counters; SQLite ignores FOR UPDATE.
+    for _ in range(EDIT_ATTEMPTS):
+        result = await db.execute(
+            select(Feedback.given_by, Feedback.sentiment, Feedback.acknowledged).where(
+                Feedback.id == feedback_id
+            )
+        )
+        current = result.one_or_none()
+        if not current:
+            raise HTTPException(status_code=404, detail="Feedback not found")
+        if user_id is not None and current.given_by != user_id:
+            raise HTTPException(
+                status_code=403, detail="Not authorized to edit this feedback"
+            )
+        if not changes:
+            return await db.get(Feedback, feedback_id)
+
+        feedback = await db.scalar(
+            update(Feedback)
+            .where(
+                Feedback.id == feedback_id,
+                Feedback.sentiment == current.sentiment,
+                Feedback.acknowledged.is_(current.acknowledged),
+            )
+            .values(**changes)
+            .returning(Feedback)
+            .execution_options(synchronize_session=False)
+        )
+        if feedback is not None:
+            break
+    else:
+        await db.rollback()
         raise HTTPException(
-            status_code=403, detail="Not authorized to edit this feedback"
+            status_code=409, detail="Feedback is being changed concurrently, try again"
         )
-    if data.strengths is not None:
-        feedback.strengths = data.strengths
-    if data.improvement is not None:
-        feedback.improvement = data.improvement
-    if data.sentiment is not None:
-        feedback.sentiment = data.sentiment
-    if data.tags is not None:
-        feedback.tags = data.tags
-    if data.acknowledged is not None:
-        feedback.acknowledged = data.acknowledged
+    delta = feedback_stats.difference(
+        feedback_stats.contribution(current.sentiment, current.acknowledged),
+        feedback_stats.contribution(feedback.sentiment, feedback.acknowledged),
+    )
+    await feedback_stats.apply_delta(
+        db, feedback.member_id, feedback.given_by, feedback.created_at, delta
+    )
+    if "tags" in changes:
+        await feedback_tags.replace_tags(db, feedback.id, feedback.tags)
+    await change_versions.bump(db, feedback.given_by, feedback.member_id)
     await db.commit()
-    await db.refresh(feedback)
+    await pdf_cache.invalidate(feedback.id)
+    await metrics_cache.invalidate(feedback.given_by, feedback.member_id)
+    activity_feed.publish_metrics(feedback.given_by, delta)
     return feedback
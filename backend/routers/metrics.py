@@ -0,0 +1,24 @@
+import os
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import PlainTextResponse
+from services import request_metrics
+
+
+# When set, /metrics skips user authentication and instead expects this
+# static bearer token, which a Prometheus scrape config can carry.
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+
+router = APIRouter()
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics(request: Request):
+    """
+    Expose per-route request, latency and query metrics for Prometheus.
+    """
+    if METRICS_TOKEN and request.headers.get("Authorization") != f"Bearer {METRICS_TOKEN}":
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return PlainTextResponse(
+        request_metrics.metrics.render(), media_type=request_metrics.CONTENT_TYPE
+    )
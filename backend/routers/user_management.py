@@ -1,23 +1,37 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from database.db import get_db
 from models.user import User
 from models.feedback import Feedback, FeedbackRequest
-from datetime import datetime, timedelta
-from schemas.feedback import FeedbackSchema, FeedbackOut
-from sqlalchemy import func, desc
+from models.feedback_stats import FeedbackStats
+from datetime import datetime
+from schemas.feedback import FeedbackPage
+from services import feedback_stats, feedback_tags
+from services.change_versions import employee_name_etag, user_etag
+from services.metrics_cache import metrics_cache
+from services.pagination import PageParams, page_params, fetch_feedback_page
+from sqlalchemy import func, desc, case, and_
+from typing import Literal
 
 
 router = APIRouter()
 
 
-@router.get("/manager/{manager_id}/employees")
+@router.get(
+    "/manager/{manager_id}/employees",
+    dependencies=[Depends(user_etag("manager_id"))],
+)
 async def get_employees_under_manager(
-    manager_id: int, db: AsyncSession = Depends(get_db)
+    manager_id: int,
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    sort_by: Literal["name", "pending", "given"] = Query("name"),
+    order: Literal["asc", "desc"] = Query("asc"),
+    db: AsyncSession = Depends(get_db),
 ):
     """
-    Get all employees under a specific manager.
+    Get a page of employees under a specific manager with their feedback counts.
     """
     manager_result = await db.execute(
         select(User).where(User.id == manager_id, User.role == "manager")
@@ -26,56 +40,147 @@ async def get_employees_under_manager(
     if not manager:
         raise HTTPException(status_code=404, detail="Manager not found")
 
-    employees_result = await db.execute(
-        select(User).where(User.company == manager.company, User.role == "employee")
+    team_filter = (User.company == manager.company, User.role == "employee")
+
+    given_counts = (
+        select(Feedback.member_id, func.count().label("given_feedbacks"))
+        .where(Feedback.given_by == manager_id)
+        .group_by(Feedback.member_id)
+        .subquery()
     )
-    employees = employees_result.scalars().all()
-
-    employee_data = []
-    for emp in employees:
-        feedbacks_result = await db.execute(
-            select(func.count())
-            .select_from(Feedback)
-            .where(Feedback.member == emp.name, Feedback.given_by == manager_id)
+    pending_counts = (
+        select(FeedbackRequest.employee_id, func.count().label("pending_feedbacks"))
+        .where(
+            FeedbackRequest.manager_id == manager_id,
+            FeedbackRequest.status == "pending",
         )
-        given_feedbacks = feedbacks_result.scalar()
-        pending_result = await db.execute(
-            select(func.count())
-            .select_from(FeedbackRequest)
-            .where(
-                FeedbackRequest.employee_id == emp.id,
-                FeedbackRequest.manager_id == manager_id,
-                FeedbackRequest.status == "pending",
-            )
+        .group_by(FeedbackRequest.employee_id)
+        .subquery()
+    )
+    given = func.coalesce(given_counts.c.given_feedbacks, 0)
+    pending = func.coalesce(pending_counts.c.pending_feedbacks, 0)
+
+    sort_columns = {"name": User.name, "pending": pending, "given": given}
+    sort_column = sort_columns[sort_by]
+    if order == "desc":
+        sort_column = desc(sort_column)
+
+    total_result = await db.execute(
+        select(func.count()).select_from(User).where(*team_filter)
+    )
+    total = total_result.scalar()
+
+    result = await db.execute(
+        select(
+            User.id,
+            User.name,
+            pending.label("pending_feedbacks"),
+            given.label("given_feedbacks"),
         )
-        pending_feedbacks = pending_result.scalar()
-        employee_data.append(
-            {
-                "id": emp.id,
-                "name": emp.name,
-                "pending_feedbacks": pending_feedbacks,
-                "given_feedbacks": given_feedbacks,
-            }
+        .outerjoin(given_counts, given_counts.c.member_id == User.id)
+        .outerjoin(pending_counts, pending_counts.c.employee_id == User.id)
+        .where(*team_filter)
+        .order_by(sort_column, User.id)
+        .limit(limit)
+        .offset(offset)
+    )
+    employee_data = [dict(row._mapping) for row in result.all()]
+
+    return {
+        "items": employee_data,
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+    }
+
+
+async def _employee_counters(db: AsyncSession, employee_id: int) -> dict:
+    result = await db.execute(
+        select(User.id, FeedbackStats)
+        .outerjoin(
+            FeedbackStats,
+            and_(
+                FeedbackStats.user_id == User.id,
+                FeedbackStats.scope == feedback_stats.MEMBER,
+            ),
         )
+        .where(User.id == employee_id)
+    )
+    row = result.first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    return feedback_stats.to_counters(row.FeedbackStats)
 
-    return employee_data
 
+@router.get(
+    "/manager/{manager_id}/dashboard",
+    dependencies=[Depends(user_etag("manager_id"))],
+)
+@metrics_cache.cached("manager_dashboard", "manager_id")
+async def manager_dashboard(manager_id: int, db: AsyncSession = Depends(get_db)):
+    """
+    Get all dashboard summary metrics for a manager in a single query.
+    """
+    request_stats = (
+        select(
+            func.count(FeedbackRequest.id).label("total_requests"),
+            func.coalesce(
+                func.sum(case((FeedbackRequest.status == "completed", 1), else_=0)),
+                0,
+            ).label("completed_requests"),
+        )
+        .where(FeedbackRequest.manager_id == manager_id)
+        .subquery()
+    )
+    result = await db.execute(
+        select(request_stats, FeedbackStats).outerjoin(
+            FeedbackStats,
+            and_(
+                FeedbackStats.user_id == manager_id,
+                FeedbackStats.scope == feedback_stats.MANAGER,
+            ),
+        )
+    )
+    row = result.one()
+    counters = feedback_stats.to_counters(row.FeedbackStats)
 
-@router.get("/manager/{manager_id}/feedbacks/count")
+    response_rate = (
+        round((row.completed_requests / row.total_requests) * 100, 2)
+        if row.total_requests
+        else 0
+    )
+    return {
+        "total_feedback_given": counters["total"],
+        "response_rate": response_rate,
+        "average_sentiment": feedback_stats.average_sentiment(counters),
+        "pending_acknowledgments": counters["total"] - counters["acknowledged"],
+        # Raw counters let a dashboard apply pushed metric deltas itself.
+        "counters": {
+            **counters,
+            "total_requests": row.total_requests,
+            "completed_requests": row.completed_requests,
+        },
+    }
+
+
+@router.get(
+    "/manager/{manager_id}/feedbacks/count",
+    dependencies=[Depends(user_etag("manager_id"))],
+)
+@metrics_cache.cached("manager_feedback_count", "manager_id")
 async def total_feedback_given(manager_id: int, db: AsyncSession = Depends(get_db)):
     """
     Get the total number of feedbacks given by a manager.
     """
-    result = await db.execute(
-        select(func.count())
-        .select_from(Feedback)
-        .where(Feedback.given_by == manager_id)
-    )
-    count = result.scalar()
-    return {"total_feedback_given": count}
+    counters = await feedback_stats.get_stats(db, manager_id, feedback_stats.MANAGER)
+    return {"total_feedback_given": counters["total"]}
 
 
-@router.get("/manager/{manager_id}/team/response-rate")
+@router.get(
+    "/manager/{manager_id}/team/response-rate",
+    dependencies=[Depends(user_etag("manager_id"))],
+)
+@metrics_cache.cached("manager_response_rate", "manager_id")
 async def team_response_rate(manager_id: int, db: AsyncSession = Depends(get_db)):
     """
     Get the response rate of a manager's team to feedback requests.
@@ -101,128 +206,100 @@ async def team_response_rate(manager_id: int, db: AsyncSession = Depends(get_db)
     return {"response_rate": round(response_rate, 2)}
 
 
-@router.get("/manager/{manager_id}/feedbacks/average-sentiment")
+@router.get(
+    "/manager/{manager_id}/feedbacks/average-sentiment",
+    dependencies=[Depends(user_etag("manager_id"))],
+)
+@metrics_cache.cached("manager_average_sentiment", "manager_id")
 async def average_sentiment(manager_id: int, db: AsyncSession = Depends(get_db)):
     """
     Get the average sentiment score of feedbacks given by a manager.
     """
-    sentiment_map = {"Positive": 5, "Neutral": 3, "Negative": 1}
-    result = await db.execute(
-        select(Feedback.sentiment).where(Feedback.given_by == manager_id)
-    )
-    sentiments = result.scalars().all()
-    if not sentiments:
-        return {"average_sentiment": 0}
-    scores = [sentiment_map.get(s, 3) for s in sentiments]
-    avg_score = sum(scores) / len(scores)
-    return {"average_sentiment": round(avg_score, 2)}
+    counters = await feedback_stats.get_stats(db, manager_id, feedback_stats.MANAGER)
+    return {"average_sentiment": feedback_stats.average_sentiment(counters)}
 
 
-@router.get("/manager/{manager_id}/feedbacks/pending-ack")
+@router.get(
+    "/manager/{manager_id}/feedbacks/pending-ack",
+    dependencies=[Depends(user_etag("manager_id"))],
+)
+@metrics_cache.cached("manager_pending_ack", "manager_id")
 async def pending_acknowledgments(manager_id: int, db: AsyncSession = Depends(get_db)):
     """
     Get the number of feedbacks given by a manager that are pending acknowledgment.
     """
-    result = await db.execute(
-        select(func.count())
-        .select_from(Feedback)
-        .where(Feedback.given_by == manager_id, Feedback.acknowledged == False)
-    )
-    count = result.scalar()
-    return {"pending_acknowledgments": count}
+    counters = await feedback_stats.get_stats(db, manager_id, feedback_stats.MANAGER)
+    return {"pending_acknowledgments": counters["total"] - counters["acknowledged"]}
 
 
-@router.get("/employee/{employee_id}/feedbacks/count")
+@router.get(
+    "/employee/{employee_id}/feedbacks/count",
+    dependencies=[Depends(user_etag("employee_id"))],
+)
+@metrics_cache.cached("employee_feedback_count", "employee_id")
 async def feedback_received_employee(
     employee_id: int, db: AsyncSession = Depends(get_db)
 ):
     """
     Get the total number of feedbacks received by an employee.
     """
-    print("1")
-    emp_result = await db.execute(select(User).where(User.id == employee_id))
-    emp = emp_result.scalar_one_or_none()
-    print(emp)
-    if not emp:
-        raise HTTPException(status_code=404, detail="Employee not found")
-    result = await db.execute(
-        select(func.count()).select_from(Feedback).where(Feedback.member == emp.name)
-    )
-    count = result.scalar() or 0
-    return {"feedback_received": count}
+    counters = await _employee_counters(db, employee_id)
+    return {"feedback_received": counters["total"]}
 
 
-@router.get("/employee/{employee_id}/feedbacks/pending-ack")
+@router.get(
+    "/employee/{employee_id}/feedbacks/pending-ack",
+    dependencies=[Depends(user_etag("employee_id"))],
+)
+@metrics_cache.cached("employee_pending_ack", "employee_id")
 async def pending_acknowledgments_employee(
     employee_id: int, db: AsyncSession = Depends(get_db)
 ):
     """
     Get the number of feedbacks received by an employee that are pending acknowledgment.
     """
-    emp_result = await db.execute(select(User).where(User.id == employee_id))
-    emp = emp_result.scalar_one_or_none()
-    if not emp:
-        raise HTTPException(status_code=404, detail="Employee not found")
-    result = await db.execute(
-        select(func.count())
-        .select_from(Feedback)
-        .where(Feedback.member == emp.name, Feedback.acknowledged == False)
-    )
-    count = result.scalar() or 0
-    return {"pending_acknowledgments": count}
+    counters = await _employee_counters(db, employee_id)
+    return {"pending_acknowledgments": counters["total"] - counters["acknowledged"]}
 
 
-@router.get("/employee/{employee_id}/feedbacks/ack-rate")
+@router.get(
+    "/employee/{employee_id}/feedbacks/ack-rate",
+    dependencies=[Depends(user_etag("employee_id"))],
+)
+@metrics_cache.cached("employee_ack_rate", "employee_id")
 async def acknowledgment_rate_employee(
     employee_id: int, db: AsyncSession = Depends(get_db)
 ):
     """
     Get the acknowledgment rate of feedbacks received by an employee.
     """
-    emp_result = await db.execute(select(User).where(User.id == employee_id))
-    emp = emp_result.scalar_one_or_none()
-    if not emp:
-        raise HTTPException(status_code=404, detail="Employee not found")
-    total_result = await db.execute(
-        select(func.count()).select_from(Feedback).where(Feedback.member == emp.name)
-    )
-    total = total_result.scalar() or 0
-    if not total:
+    counters = await _employee_counters(db, employee_id)
+    if not counters["total"]:
         return {"acknowledgment_rate": 0}
-    ack_result = await db.execute(
-        select(func.count())
-        .select_from(Feedback)
-        .where(Feedback.member == emp.name, Feedback.acknowledged == True)
-    )
-    ack = ack_result.scalar() or 0
-    rate = (ack / total) * 100 if total else 0
+    rate = (counters["acknowledged"] / counters["total"]) * 100
     return {"acknowledgment_rate": round(rate, 2)}
 
 
-@router.get("/employee/{employee_id}/feedbacks/average-sentiment")
+@router.get(
+    "/employee/{employee_id}/feedbacks/average-sentiment",
+    dependencies=[Depends(user_etag("employee_id"))],
+)
+@metrics_cache.cached("employee_average_sentiment", "employee_id")
 async def average_sentiment_employee(
     employee_id: int, db: AsyncSession = Depends(get_db)
 ):
     """
     Get the average sentiment score of feedbacks received by an employee.
     """
-    sentiment_map = {"Positive": 5, "Neutral": 3, "Negative": 1}
-    emp_result = await db.execute(select(User).where(User.id == employee_id))
-    emp = emp_result.scalar_one_or_none()
-    if not emp:
-        raise HTTPException(status_code=404, detail="Employee not found")
-    result = await db.execute(
-        select(Feedback.sentiment).where(Feedback.member == emp.name)
-    )
-    sentiments = result.scalars().all()
-    if not sentiments:
-        return {"average_sentiment": 0}
-    scores = [sentiment_map.get(s, 3) for s in sentiments]
-    avg_score = sum(scores) / len(scores) if scores else 0
-    return {"average_sentiment": round(avg_score, 2)}
+    counters = await _employee_counters(db, employee_id)
+    return {"average_sentiment": feedback_stats.average_sentiment(counters)}
 
 
-@router.get("/manager/{manager_id}/feedbacks/sentiment-trends")
+@router.get(
+    "/manager/{manager_id}/feedbacks/sentiment-trends",
+    dependencies=[Depends(user_etag("manager_id", monthly=True))],
+)
+@metrics_cache.cached("manager_sentiment_trends", "manager_id")
 async def manager_sentiment_trends(manager_id: int, db: AsyncSession = Depends(get_db)):
     """
     Get the sentiment trends of feedbacks given by a manager over the last 12 months.
@@ -234,73 +311,105 @@ async def manager_sentiment_trends(manager_id: int, db: AsyncSession = Depends(g
     if not mgr:
         raise HTTPException(status_code=404, detail="Manager not found")
 
-    now = datetime.utcnow()
-    months = []
-    for i in range(11, -1, -1):
-        month = (now.replace(day=1) - timedelta(days=30 * i)).strftime("%Y-%m")
-        months.append(month)
+    months = feedback_stats.recent_months(datetime.utcnow())
+    trends = await feedback_stats.get_trends(db, manager_id, months)
+    return [{"month": month, **trends[month]} for month in months]
 
-    result = await db.execute(
-        select(
-            func.strftime("%Y-%m", Feedback.created_at).label("month"),
-            Feedback.sentiment,
-            func.count().label("count"),
-        )
-        .where(
-            Feedback.given_by == manager_id,
-            func.strftime("%Y-%m", Feedback.created_at) >= months[-1],
-        )
-        .group_by(func.strftime("%Y-%m", Feedback.created_at), Feedback.sentiment)
-        .order_by(func.strftime("%Y-%m", Feedback.created_at))
+
+@router.get(
+    "/manager/{manager_id}/feedbacks/tags",
+    dependencies=[Depends(user_etag("manager_id"))],
+)
+async def manager_tag_counts(
+    manager_id: int,
+    start: datetime | None = Query(None, description="Count feedback created at or after"),
+    end: datetime | None = Query(None, description="Count feedback created before"),
+    limit: int = Query(20, ge=1, le=200),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get the most used tags on feedbacks given by a manager.
+    """
+    return await feedback_tags.tag_counts(
+        db, Feedback.given_by, manager_id, start, end, limit
     )
-    rows = result.all()
 
-    month_sentiment_map = {
-        m: {"positive": 0, "neutral": 0, "negative": 0} for m in months
-    }
-    for row in rows:
-        sentiment = row.sentiment.lower()
-        if sentiment in month_sentiment_map[row.month]:
-            month_sentiment_map[row.month][sentiment] = row.count
 
-    data = []
-    for m in months:
-        entry = {"month": m}
-        entry.update(month_sentiment_map[m])
-        data.append(entry)
-    return data
+@router.get(
+    "/employee/{employee_id}/feedbacks/tags",
+    dependencies=[Depends(user_etag("employee_id"))],
+)
+async def employee_tag_counts(
+    employee_id: int,
+    start: datetime | None = Query(None, description="Count feedback created at or after"),
+    end: datetime | None = Query(None, description="Count feedback created before"),
+    limit: int = Query(20, ge=1, le=200),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get the most used tags on feedbacks received by an employee.
+    """
+    return await feedback_tags.tag_counts(
+        db, Feedback.member_id, employee_id, start, end, limit
+    )
+
+
+@router.get("/metrics-cache/stats")
+async def metrics_cache_stats():
+    """
+    Get hit, miss and invalidation counts of the metrics response cache.
+    """
+    return metrics_cache.stats()
 
 
 @router.get(
-    "/manager/{manager_id}/feedbacks-given", response_model=list[FeedbackSchema]
+    "/manager/{manager_id}/feedbacks-given",
+    response_model=FeedbackPage,
+    dependencies=[Depends(user_etag("manager_id"))],
 )
 async def get_feedbacks_given_by_manager(
-    manager_id: int, db: AsyncSession = Depends(get_db)
+    manager_id: int,
+    tag: list[str] | None = Query(None, description="Only feedback carrying every tag"),
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_db),
 ):
     """
-    Get all feedbacks given by a manager, ordered by creation date.
+    Get a page of feedbacks given by a manager, newest first.
     """
-    result = await db.execute(
-        select(Feedback)
-        .where(Feedback.given_by == manager_id)
-        .order_by(desc(Feedback.created_at))
+    return await fetch_feedback_page(
+        db,
+        feedback_tags.with_tags(
+            select(Feedback).where(Feedback.given_by == manager_id), tag
+        ),
+        page,
     )
-    feedbacks = result.scalars().all()
-    return feedbacks
 
 
-@router.get("/employee/{employee_name}/feedbacks", response_model=list[FeedbackOut])
+@router.get(
+    "/employee/{employee_name}/feedbacks",
+    response_model=FeedbackPage,
+    dependencies=[Depends(employee_name_etag)],
+)
 async def get_employee_feedbacks(
-    employee_name: str, db: AsyncSession = Depends(get_db)
+    employee_name: str,
+    tag: list[str] | None = Query(None, description="Only feedback carrying every tag"),
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_db),
 ):
     """
-    Get all feedbacks for a specific employee by name.
+    Get a page of feedbacks for a specific employee by name, newest first.
     """
     try:
-        result = await db.execute(
-            select(Feedback).where(Feedback.member == employee_name)
+        return await fetch_feedback_page(
+            db,
+            feedback_tags.with_tags(
+                select(Feedback)
+                .join(User, Feedback.member_id == User.id)
+                .where(User.name == employee_name, User.role == "employee"),
+                tag,
+            ),
+            page,
         )
-        return result.scalars().all()
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to fetch feedbacks: {str(e)}"
@@ -1,9 +1,16 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from datetime import datetime
 from typing import List, Optional
 
 
+# Items per batch request, keeping each batch's IN list well under the
+# databases' bound-parameter limits.
+MAX_BATCH_ITEMS = 1000
+
+
 class FeedbackCreate(BaseModel):
     member: str
+    member_id: Optional[int] = None
     strengths: str
     improvement: str
     sentiment: str
@@ -12,9 +19,25 @@ class FeedbackCreate(BaseModel):
     acknowledged: bool
 
 
+class FeedbackImport(FeedbackCreate):
+    created_at: Optional[datetime] = None
+
+
+class FeedbackImportError(BaseModel):
+    row: int
+    errors: List[str]
+
+
+class FeedbackImportResult(BaseModel):
+    imported: int
+    failed: int
+    errors: List[FeedbackImportError]
+
+
 class FeedbackOut(BaseModel):
     id: int
     member: str
+    member_id: Optional[int] = None
     strengths: str
     improvement: str
     sentiment: str
@@ -26,6 +49,30 @@ class FeedbackOut(BaseModel):
         from_attributes = True
 
 
+class FeedbackPage(BaseModel):
+    items: List[FeedbackOut]
+    next_cursor: Optional[str] = None
+
+
+class FeedbackSearchHit(BaseModel):
+    id: int
+    member: str
+    member_id: Optional[int] = None
+    given_by: int
+    given_by_name: str
+    sentiment: str
+    acknowledged: bool
+    created_at: Optional[datetime] = None
+    strengths: str
+    improvement: str
+    score: float
+
+
+class FeedbackSearchPage(BaseModel):
+    items: List[FeedbackSearchHit]
+    next_offset: Optional[int] = None
+
+
 class FeedbackRequestCreate(BaseModel):
     employee_id: int
     manager_id: int
@@ -47,9 +94,23 @@ class FeedbackRequestComplete(BaseModel):
     manager_id: int
 
 
+class FeedbackRequestCompleteBatch(BaseModel):
+    employees: List[str] = Field(max_length=MAX_BATCH_ITEMS)
+
+
+class FeedbackAcknowledgeBatch(BaseModel):
+    feedback_ids: List[int] = Field(max_length=MAX_BATCH_ITEMS)
+
+
+class FeedbackAcknowledgeBatchResult(BaseModel):
+    acknowledged: List[int]
+    unchanged: List[int]
+
+
 class FeedbackSchema(BaseModel):
     id: int
     member: str
+    member_id: Optional[int] = None
     strengths: str
     improvement: str
     sentiment: str
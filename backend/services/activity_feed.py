@@ -0,0 +1,87 @@
+import asyncio
+import json
+import os
+from contextlib import contextmanager
+from models.activity_log import ActivityLog
+from schemas.activity_log import ActivityLogSchema
+
+
+ACTIVITY_FEED_QUEUE_SIZE = int(os.getenv("ACTIVITY_FEED_QUEUE_SIZE", "256"))
+
+# Deltas are sent for these keys: the feedback counters of
+# feedback_stats.COUNTERS plus the feedback request totals.
+REQUEST_COUNTERS = ("total_requests", "completed_requests")
+
+
+def _message(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+class ActivityFeed:
+    """
+    In-process fan-out of dashboard events to connected managers.
+
+    Each subscriber owns a bounded queue of pre-encoded Server-Sent Events
+    messages. Publishing never waits: a subscriber that falls
+    `queue_size` messages behind has its backlog replaced by a single
+    `resync` event telling the client to refetch. Subscribers only see
+    events published by the same process.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._subscribers: dict[int, set[asyncio.Queue]] = {}
+
+    @contextmanager
+    def subscribe(self, manager_id: int):
+        queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        self._subscribers.setdefault(manager_id, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            queues = self._subscribers.get(manager_id)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[manager_id]
+
+    def _publish(self, manager_id: int | None, message: str):
+        for queue in self._subscribers.get(manager_id, ()):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(_message("resync", {}))
+
+    def publish_activity(self, log: ActivityLog, user_name: str):
+        """
+        Push a committed activity log row to its manager's dashboards.
+        """
+        if not self._subscribers.get(log.manager_id):
+            return
+        data = ActivityLogSchema(
+            id=log.id,
+            user_id=log.user_id,
+            user_name=user_name,
+            manager_id=log.manager_id,
+            action=log.action,
+            target=log.target,
+            details=log.details,
+            timestamp=log.timestamp,
+        ).model_dump(mode="json")
+        self._publish(log.manager_id, _message("activity", data))
+
+    def publish_metrics(self, manager_id: int, delta: dict):
+        """
+        Push changes to a manager's dashboard counters; zero entries are dropped.
+        """
+        delta = {key: value for key, value in delta.items() if value}
+        if delta:
+            self._publish(manager_id, _message("metrics", delta))
+
+    def publish_resync(self, manager_id: int):
+        self._publish(manager_id, _message("resync", {}))
+
+
+activity_feed = ActivityFeed(ACTIVITY_FEED_QUEUE_SIZE)
@@ -0,0 +1,132 @@
+import contextvars
+import hashlib
+from datetime import datetime
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy import literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.db import get_db
+from database.dialects import upsert_insert
+from models.change_version import ChangeVersion
+from models.user import User
+from services.feedback_stats import month_key
+from services.pdf_cache import etag_matches
+
+
+# (user id, version) read by the ETag check of the request being served, so
+# the response cache looks entries up under the version the ETag names.
+_observed: contextvars.ContextVar[tuple[int, int] | None] = contextvars.ContextVar(
+    "observed_version", default=None
+)
+
+
+async def bump(db: AsyncSession, *user_ids: int | None):
+    """
+    Advance the change version of every given user.
+
+    Runs inside the caller's transaction so the new version becomes visible
+    together with the write that caused it.
+    """
+    ids = sorted({user_id for user_id in user_ids if user_id is not None})
+    if not ids:
+        return
+    stmt = upsert_insert(db, ChangeVersion).values(
+        [{"user_id": user_id, "version": 1} for user_id in ids]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ChangeVersion.user_id],
+        set_={"version": ChangeVersion.version + 1},
+    )
+    await db.execute(stmt)
+
+
+async def bump_company_managers(db: AsyncSession, company: str):
+    """
+    Advance the version of every manager of `company`, whose team just changed.
+    """
+    stmt = upsert_insert(db, ChangeVersion).from_select(
+        ["user_id", "version"],
+        select(User.id, literal(1)).where(
+            User.company == company, User.role == "manager"
+        ),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ChangeVersion.user_id],
+        set_={"version": ChangeVersion.version + 1},
+    )
+    await db.execute(stmt)
+
+
+def _check(request: Request, response: Response, state: str, monthly: bool):
+    """
+    Answer with 304 when the client already holds `state`, else tag the response.
+
+    The tag also covers the path and query string, so every page, sort order
+    and user of an endpoint gets its own ETag; `monthly` adds the current
+    month for responses that roll over with the calendar.
+    """
+    vary = f"{request.url.path}?{request.url.query}"
+    if monthly:
+        vary += f"|{month_key(datetime.utcnow())}"
+    digest = hashlib.sha256(vary.encode()).hexdigest()[:12]
+    etag = f'"{state}-{digest}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("If-None-Match"), etag):
+        raise HTTPException(status_code=304, headers=headers)
+    response.headers.update(headers)
+
+
+def user_etag(path_param: str, monthly: bool = False):
+    """
+    Dependency that makes an endpoint conditional on the change version of
+    the user named by `path_param`, before the endpoint runs any query.
+    """
+
+    async def check(
+        request: Request, response: Response, db: AsyncSession = Depends(get_db)
+    ):
+        try:
+            user_id = int(request.path_params[path_param])
+        except ValueError:
+            # Let the endpoint's own path validation answer with a 422.
+            return
+        version = await db.scalar(
+            select(ChangeVersion.version).where(ChangeVersion.user_id == user_id)
+        ) or 0
+        _observed.set((user_id, version))
+        _check(request, response, f"{user_id}.{version}", monthly)
+
+    return check
+
+
+async def current_version(db: AsyncSession, user_id: int) -> int:
+    """
+    The change version of `user_id`, as already read by this request's ETag
+    check when there was one.
+    """
+    observed = _observed.get()
+    if observed is not None and observed[0] == user_id:
+        return observed[1]
+    version = await db.scalar(
+        select(ChangeVersion.version).where(ChangeVersion.user_id == user_id)
+    )
+    return version or 0
+
+
+async def employee_name_etag(
+    request: Request, response: Response, db: AsyncSession = Depends(get_db)
+):
+    """
+    Like `user_etag`, for endpoints addressing employees by name: the state
+    covers every employee sharing that name.
+    """
+    result = await db.execute(
+        select(User.id, ChangeVersion.version)
+        .outerjoin(ChangeVersion, ChangeVersion.user_id == User.id)
+        .where(
+            User.name == request.path_params["employee_name"],
+            User.role == "employee",
+        )
+        .order_by(User.id)
+    )
+    state = "_".join(f"{user_id}.{version or 0}" for user_id, version in result.all())
+    _check(request, response, state or "none", monthly=False)
@@ -0,0 +1,110 @@
+import csv
+import io
+import json
+from datetime import datetime
+from sqlalchemy import select
+from sqlalchemy.orm import aliased
+from database.db import async_session_maker
+from models.feedback import Feedback
+from models.user import User
+
+
+EXPORT_CHUNK_ROWS = 1000
+
+EXPORT_COLUMNS = (
+    "id",
+    "member_id",
+    "member",
+    "given_by",
+    "given_by_name",
+    "strengths",
+    "improvement",
+    "sentiment",
+    "tags",
+    "acknowledged",
+    "created_at",
+)
+
+
+def export_query(
+    company: str,
+    manager_id: int | None = None,
+    member_id: int | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+):
+    giver = aliased(User)
+    query = (
+        select(
+            Feedback.id,
+            Feedback.member_id,
+            Feedback.member,
+            Feedback.given_by,
+            giver.name.label("given_by_name"),
+            Feedback.strengths,
+            Feedback.improvement,
+            Feedback.sentiment,
+            Feedback.tags,
+            Feedback.acknowledged,
+            Feedback.created_at,
+        )
+        .join(giver, Feedback.given_by == giver.id)
+        .where(giver.company == company)
+        .order_by(Feedback.id)
+    )
+    if manager_id is not None:
+        query = query.where(Feedback.given_by == manager_id)
+    if member_id is not None:
+        query = query.where(Feedback.member_id == member_id)
+    if start is not None:
+        query = query.where(Feedback.created_at >= start)
+    if end is not None:
+        query = query.where(Feedback.created_at < end)
+    return query
+
+
+async def stream_rows(query):
+    """
+    Yield lists of row mappings from a server-side cursor.
+
+    The generator owns its session: request-scoped sessions are closed before
+    a streaming response body starts being sent.
+    """
+    async with async_session_maker() as db:
+        result = await db.stream(
+            query.execution_options(yield_per=EXPORT_CHUNK_ROWS)
+        )
+        async for partition in result.mappings().partitions():
+            yield partition
+
+
+def _created_at(row) -> str | None:
+    return row["created_at"].isoformat() if row["created_at"] else None
+
+
+async def stream_ndjson(query):
+    async for rows in stream_rows(query):
+        yield "".join(
+            json.dumps({**row, "created_at": _created_at(row)}) + "\n" for row in rows
+        )
+
+
+async def stream_csv(query):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    async for rows in stream_rows(query):
+        for row in rows:
+            writer.writerow(
+                [
+                    *(row[column] for column in EXPORT_COLUMNS[:8]),
+                    ";".join(row["tags"] or []),
+                    row["acknowledged"],
+                    _created_at(row),
+                ]
+            )
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
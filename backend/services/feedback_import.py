@@ -0,0 +1,226 @@
+import csv
+import io
+import os
+from collections import defaultdict
+from datetime import datetime
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.activity_log import ActivityLog
+from models.feedback import Feedback
+from models.user import User
+from schemas.feedback import FeedbackImport
+from services import change_versions, feedback_stats, feedback_tags
+from services.activity_feed import activity_feed
+from services.metrics_cache import metrics_cache
+
+
+IMPORT_CHUNK_ROWS = int(os.getenv("IMPORT_CHUNK_ROWS", "1000"))
+
+
+def parse_json(payload) -> list:
+    if not isinstance(payload, list):
+        raise HTTPException(status_code=400, detail="Expected a JSON array of feedback")
+    return payload
+
+
+def parse_csv(text: str) -> list[dict]:
+    """
+    Read CSV records in the layout written by the feedback export.
+
+    Empty cells are treated as missing and tags are `;`-separated, so an
+    export can be imported back unchanged; unknown columns are ignored.
+    """
+    records = []
+    for row in csv.DictReader(io.StringIO(text)):
+        record = {key: value for key, value in row.items() if key and value != ""}
+        if "tags" in record:
+            record["tags"] = [tag for tag in record["tags"].split(";") if tag]
+        records.append(record)
+    return records
+
+
+# Every column an imported row sets, identifying it among the rows returned by
+# the bulk INSERT; rows that agree on all of them are interchangeable.
+_ROW_COLUMNS = tuple(
+    getattr(Feedback, name)
+    for name in (
+        "member",
+        "member_id",
+        "strengths",
+        "improvement",
+        "sentiment",
+        "tags",
+        "given_by",
+        "acknowledged",
+        "created_at",
+    )
+)
+
+
+def _row_key(row) -> tuple:
+    key = []
+    for column in _ROW_COLUMNS:
+        value = row[column.key]
+        if column.key == "tags":
+            value = tuple(value or ())
+        elif column.key == "created_at":
+            # Timestamps are stored without their offset.
+            value = value.replace(tzinfo=None)
+        key.append(value)
+    return tuple(key)
+
+
+def _validation_messages(error: ValidationError) -> list[str]:
+    return [
+        f"{'.'.join(str(part) for part in item['loc']) or 'record'}: {item['msg']}"
+        for item in error.errors()
+    ]
+
+
+async def _company_users(db: AsyncSession, company: str, records: list[FeedbackImport]):
+    """
+    Look up, in one query, every user a chunk refers to within `company`.
+
+    Returns the ids of all such users and a map of employee names to the
+    oldest matching account, which is how `create_feedback` resolves names.
+    """
+    ids = {record.given_by for record in records}
+    ids.update(record.member_id for record in records if record.member_id is not None)
+    names = {record.member for record in records if record.member_id is None}
+    result = await db.execute(
+        select(User.id, User.name, User.role)
+        .where(User.company == company, or_(User.id.in_(ids), User.name.in_(names)))
+        .order_by(User.id)
+    )
+    users, employees_by_name = {}, {}
+    for user in result.all():
+        users[user.id] = user.role
+        if user.role == "employee":
+            employees_by_name.setdefault(user.name, user.id)
+    return users, employees_by_name
+
+
+async def _import_chunk(
+    db: AsyncSession, company: str, chunk: list[tuple[int, dict]], errors: list
+) -> int:
+    valid = []
+    for row, raw in chunk:
+        try:
+            valid.append((row, FeedbackImport.model_validate(raw)))
+        except ValidationError as e:
+            errors.append({"row": row, "errors": _validation_messages(e)})
+    if not valid:
+        return 0
+
+    users, employees_by_name = await _company_users(
+        db, company, [record for _, record in valid]
+    )
+    now = datetime.utcnow()
+    rows, row_numbers = [], []
+    for row, record in valid:
+        problems = []
+        if record.given_by not in users:
+            problems.append("given_by: user not found in your company")
+        member_id = record.member_id
+        if member_id is None:
+            member_id = employees_by_name.get(record.member)
+            if member_id is None:
+                problems.append("member: employee not found in your company")
+        elif users.get(member_id) != "employee":
+            problems.append("member_id: employee not found in your company")
+        if problems:
+            errors.append({"row": row, "errors": problems})
+            continue
+        rows.append(
+            {
+                **record.model_dump(),
+                "member_id": member_id,
+                "created_at": record.created_at or now,
+            }
+        )
+        row_numbers.append(row)
+    if not rows:
+        return 0
+
+    try:
+        # RETURNING with sort_by_parameter_order would make SQLite insert row
+        # by row, so the ids are matched back to the rows by content instead.
+        result = await db.execute(
+            insert(Feedback).returning(Feedback.id, *_ROW_COLUMNS), rows
+        )
+        ids_by_row = defaultdict(list)
+        for returned in result.all():
+            ids_by_row[_row_key(returned._mapping)].append(returned.id)
+        feedback_ids = [ids_by_row[_row_key(row)].pop() for row in rows]
+        await feedback_tags.add_tags(
+            db,
+            [
+                tag_row
+                for row, feedback_id in zip(rows, feedback_ids)
+                for tag_row in feedback_tags.tag_rows(feedback_id, row["tags"])
+            ],
+        )
+        await db.execute(
+            insert(ActivityLog),
+            [
+                {
+                    "user_id": row["given_by"],
+                    "action": "sent_feedback",
+                    "target": row["member"],
+                    "details": {"feedback_id": feedback_id, "imported": True},
+                    "manager_id": row["given_by"],
+                    "timestamp": now,
+                }
+                for row, feedback_id in zip(rows, feedback_ids)
+            ],
+        )
+
+        await feedback_stats.apply_deltas(
+            db,
+            (
+                (
+                    row["member_id"],
+                    row["given_by"],
+                    row["created_at"],
+                    feedback_stats.contribution(row["sentiment"], row["acknowledged"]),
+                )
+                for row in rows
+            ),
+        )
+        await change_versions.bump(
+            db, *(row["given_by"] for row in rows), *(row["member_id"] for row in rows)
+        )
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        errors.extend(
+            {"row": row, "errors": [f"Failed to load into database: {str(e)}"]}
+            for row in row_numbers
+        )
+        return 0
+    await metrics_cache.invalidate(
+        *{row["given_by"] for row in rows}, *{row["member_id"] for row in rows}
+    )
+    # A bulk load is too many events to stream one by one; dashboards refetch.
+    for manager_id in {row["given_by"] for row in rows}:
+        activity_feed.publish_resync(manager_id)
+    return len(rows)
+
+
+async def import_feedbacks(db: AsyncSession, company: str, records: list) -> dict:
+    """
+    Validate and insert `records` in chunks of IMPORT_CHUNK_ROWS, one
+    transaction per chunk.
+
+    Invalid rows are reported by their 1-based position and skipped; a chunk
+    that fails to commit is reported row by row while later chunks still load.
+    """
+    imported, errors = 0, []
+    numbered = list(enumerate(records, start=1))
+    for start in range(0, len(numbered), IMPORT_CHUNK_ROWS):
+        chunk = numbered[start : start + IMPORT_CHUNK_ROWS]
+        imported += await _import_chunk(db, company, chunk, errors)
+    errors.sort(key=lambda error: error["row"])
+    return {"imported": imported, "failed": len(errors), "errors": errors}
@@ -0,0 +1,121 @@
+import html
+import re
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+# Matches are marked with control characters in SQL so the stored text can be
+# HTML-escaped before the markers become <mark> tags.
+_OPEN, _CLOSE = "\x02", "\x03"
+SNIPPET_TOKENS = 32
+
+_SQLITE_SEARCH = """
+SELECT f.id, f.member, f.member_id, f.given_by, giver.name AS given_by_name,
+       f.sentiment, f.acknowledged, f.created_at,
+       snippet(feedbacks_fts, 0, :open, :close, '…', :tokens) AS strengths,
+       snippet(feedbacks_fts, 1, :open, :close, '…', :tokens) AS improvement,
+       -bm25(feedbacks_fts) AS score
+FROM feedbacks_fts
+JOIN feedbacks AS f ON f.id = feedbacks_fts.rowid
+JOIN users AS giver ON giver.id = f.given_by
+WHERE feedbacks_fts MATCH :query AND giver.company = :company {filters}
+ORDER BY bm25(feedbacks_fts), f.id
+LIMIT :limit OFFSET :offset
+"""
+
+_POSTGRESQL_SEARCH = """
+WITH search AS (SELECT websearch_to_tsquery('english', :query) AS query)
+SELECT f.id, f.member, f.member_id, f.given_by, giver.name AS given_by_name,
+       f.sentiment, f.acknowledged, f.created_at,
+       ts_headline('english', f.strengths, search.query, :options) AS strengths,
+       ts_headline('english', f.improvement, search.query, :options) AS improvement,
+       ts_rank_cd(
+           to_tsvector('english', f.strengths || ' ' || f.improvement), search.query
+       ) AS score
+FROM feedbacks AS f
+CROSS JOIN search
+JOIN users AS giver ON giver.id = f.given_by
+WHERE to_tsvector('english', f.strengths || ' ' || f.improvement) @@ search.query
+  AND giver.company = :company {filters}
+ORDER BY score DESC, f.id
+LIMIT :limit OFFSET :offset
+"""
+
+
+def fts5_query(search: str) -> str:
+    """
+    Turn user input into an FTS5 query matching every word and "quoted
+    phrase", so operators and punctuation in the input cannot cause syntax
+    errors.
+    """
+    terms = re.findall(r'"([^"]+)"|(\S+)', search)
+    return " ".join(
+        '"' + (phrase or word).replace('"', '""') + '"' for phrase, word in terms
+    )
+
+
+def _highlight(value: str | None) -> str | None:
+    if value is None:
+        return None
+    return html.escape(value).replace(_OPEN, "<mark>").replace(_CLOSE, "</mark>")
+
+
+async def search_feedback(
+    db: AsyncSession,
+    company: str,
+    search: str,
+    limit: int,
+    offset: int,
+    manager_id: int | None = None,
+    member_id: int | None = None,
+) -> dict:
+    """
+    Rank the company's feedback against `search`, best match first.
+
+    `strengths` and `improvement` come back as HTML-escaped excerpts with the
+    matched terms wrapped in <mark>.
+    """
+    dialect = db.bind.dialect.name
+    params = {"company": company, "limit": limit + 1, "offset": offset}
+    filters = ""
+    if manager_id is not None:
+        filters += "AND f.given_by = :manager_id "
+        params["manager_id"] = manager_id
+    if member_id is not None:
+        filters += "AND f.member_id = :member_id "
+        params["member_id"] = member_id
+
+    if dialect == "sqlite":
+        query = fts5_query(search)
+        sql = _SQLITE_SEARCH
+        params.update(open=_OPEN, close=_CLOSE, tokens=SNIPPET_TOKENS)
+    elif dialect == "postgresql":
+        query = search.strip()
+        sql = _POSTGRESQL_SEARCH
+        params["options"] = (
+            f"StartSel={_OPEN}, StopSel={_CLOSE}, MaxWords={SNIPPET_TOKENS}, MinWords=8"
+        )
+    else:
+        raise HTTPException(
+            status_code=501, detail=f"Search is not supported on {dialect}"
+        )
+    if not query:
+        raise HTTPException(status_code=400, detail="Search query is empty")
+    params["query"] = query
+
+    result = await db.execute(text(sql.format(filters=filters)), params)
+    rows = result.mappings().all()
+    items = [
+        {
+            **row,
+            "strengths": _highlight(row["strengths"]),
+            "improvement": _highlight(row["improvement"]),
+            "score": round(row["score"], 4),
+        }
+        for row in rows[:limit]
+    ]
+    return {
+        "items": items,
+        "next_offset": offset + limit if len(rows) > limit else None,
+    }
@@ -0,0 +1,341 @@
+import asyncio
+from datetime import datetime
+from sqlalchemy import case, delete, func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.dialects import upsert_insert, year_month
+from models.feedback import Feedback
+from models.feedback_stats import FeedbackStats, SentimentTrend
+
+
+MEMBER = "member"
+MANAGER = "manager"
+
+COUNTERS = ("total", "acknowledged", "positive", "neutral", "negative")
+SENTIMENT_SCORES = {"positive": 5, "neutral": 3, "negative": 1}
+
+# Bound parameters per rollup upsert, under both SQLite's (32766 since 3.32)
+# and PostgreSQL's (32767) limits.
+UPSERT_MAX_PARAMS = 32000
+
+
+def sentiment_bucket(sentiment: str) -> str:
+    """
+    Map a feedback sentiment to its counter column; unknown values count as neutral.
+    """
+    if sentiment == "Positive":
+        return "positive"
+    if sentiment == "Negative":
+        return "negative"
+    return "neutral"
+
+
+def contribution(sentiment: str, acknowledged: bool) -> dict:
+    """
+    Counter increments contributed by a single feedback row.
+    """
+    counters = dict.fromkeys(COUNTERS, 0)
+    counters["total"] = 1
+    counters["acknowledged"] = 1 if acknowledged else 0
+    counters[sentiment_bucket(sentiment)] = 1
+    return counters
+
+
+def difference(before: dict, after: dict) -> dict:
+    return {key: after[key] - before[key] for key in COUNTERS}
+
+
+def month_key(moment: datetime) -> str:
+    return moment.strftime("%Y-%m")
+
+
+def recent_months(now: datetime, count: int = 12) -> list[str]:
+    """
+    The last `count` calendar months up to and including `now`, oldest first.
+    """
+    year, month = now.year, now.month
+    months = []
+    for _ in range(count):
+        months.append(f"{year:04d}-{month:02d}")
+        month -= 1
+        if month == 0:
+            year, month = year - 1, 12
+    return months[::-1]
+
+
+async def apply_delta(
+    db: AsyncSession,
+    member_id: int | None,
+    manager_id: int,
+    created_at: datetime,
+    delta: dict,
+):
+    """
+    Add a counter delta to the member, manager and monthly trend rollups of a
+    feedback.
+
+    Runs inside the caller's transaction so the rollups commit together with
+    the feedback change they reflect.
+    """
+    await apply_deltas(db, [(member_id, manager_id, created_at, delta)])
+
+
+async def _upsert(db: AsyncSession, table, rows: list[dict], keys: list, set_) -> None:
+    """
+    Insert `rows`, merging into existing rows with `set_(stmt)`, in as few
+    multi-row statements as the bound-parameter limit allows.
+    """
+    size = max(1, UPSERT_MAX_PARAMS // len(rows[0])) if rows else 1
+    for start in range(0, len(rows), size):
+        stmt = upsert_insert(db, table).values(rows[start : start + size])
+        stmt = stmt.on_conflict_do_update(index_elements=keys, set_=set_(stmt))
+        await db.execute(stmt)
+
+
+async def apply_deltas(db: AsyncSession, changes):
+    """
+    Apply many `(member_id, manager_id, created_at, delta)` changes.
+
+    The deltas are summed per rollup row first, so however many feedbacks
+    changed, each rollup table gets one multi-row upsert. Each row appears
+    once per statement, as PostgreSQL requires, and rows are written in key
+    order so concurrent writers lock them in the same order.
+    """
+    stats, trends = {}, {}
+    for member_id, manager_id, created_at, delta in changes:
+        targets = [(manager_id, MANAGER)]
+        if member_id is not None:
+            targets.append((member_id, MEMBER))
+        for target in targets:
+            total = stats.setdefault(target, dict.fromkeys(COUNTERS, 0))
+            for counter in COUNTERS:
+                total[counter] += delta[counter]
+        if created_at is None:
+            continue
+        month = month_key(created_at)
+        for sentiment in SENTIMENT_SCORES:
+            if delta[sentiment]:
+                cell = (manager_id, month, sentiment)
+                trends[cell] = trends.get(cell, 0) + delta[sentiment]
+
+    await _upsert(
+        db,
+        FeedbackStats,
+        [
+            {"user_id": user_id, "scope": scope, **total}
+            for (user_id, scope), total in sorted(stats.items())
+            if any(total.values())
+        ],
+        [FeedbackStats.user_id, FeedbackStats.scope],
+        lambda stmt: {
+            key: getattr(FeedbackStats, key) + getattr(stmt.excluded, key)
+            for key in COUNTERS
+        },
+    )
+    await _upsert(
+        db,
+        SentimentTrend,
+        [
+            {"manager_id": manager_id, "month": month, "sentiment": sentiment, "count": count}
+            for (manager_id, month, sentiment), count in sorted(trends.items())
+            if count
+        ],
+        [SentimentTrend.manager_id, SentimentTrend.month, SentimentTrend.sentiment],
+        lambda stmt: {"count": SentimentTrend.count + stmt.excluded.count},
+    )
+
+
+async def get_trends(db: AsyncSession, manager_id: int, months: list[str]) -> dict:
+    """
+    Fetch per-sentiment counts for each of `months`, filling gaps with zeros.
+    """
+    result = await db.execute(
+        select(SentimentTrend).where(
+            SentimentTrend.manager_id == manager_id,
+            SentimentTrend.month.between(months[0], months[-1]),
+        )
+    )
+    trends = {month: dict.fromkeys(SENTIMENT_SCORES, 0) for month in months}
+    for trend in result.scalars():
+        if trend.month in trends:
+            trends[trend.month][trend.sentiment] = trend.count
+    return trends
+
+
+async def get_stats(db: AsyncSession, user_id: int, scope: str) -> dict:
+    """
+    Fetch the rollup counters for a user, returning zeros when none exist yet.
+    """
+    stats = await db.get(FeedbackStats, (user_id, scope))
+    return to_counters(stats)
+
+
+def to_counters(stats: FeedbackStats | None) -> dict:
+    if stats is None:
+        return dict.fromkeys(COUNTERS, 0)
+    return {key: getattr(stats, key) for key in COUNTERS}
+
+
+def average_sentiment(counters: dict) -> float:
+    if not counters["total"]:
+        return 0
+    score = sum(counters[key] * SENTIMENT_SCORES[key] for key in SENTIMENT_SCORES)
+    return round(score / counters["total"], 2)
+
+
+def _bucket_column():
+    return case(
+        (Feedback.sentiment == "Positive", "positive"),
+        (Feedback.sentiment == "Negative", "negative"),
+        else_="neutral",
+    )
+
+
+def _aggregate_columns():
+    bucket = _bucket_column()
+    return (
+        func.count().label("total"),
+        func.sum(case((Feedback.acknowledged == True, 1), else_=0)).label(
+            "acknowledged"
+        ),
+        *(
+            func.sum(case((bucket == key, 1), else_=0)).label(key)
+            for key in SENTIMENT_SCORES
+        ),
+    )
+
+
+async def compute_stats(db: AsyncSession) -> dict:
+    """
+    Recompute every rollup row from the feedbacks table.
+    """
+    member_rows = await db.execute(
+        select(Feedback.member_id, literal(MEMBER), *_aggregate_columns())
+        .where(Feedback.member_id.is_not(None))
+        .group_by(Feedback.member_id)
+    )
+    manager_rows = await db.execute(
+        select(Feedback.given_by, literal(MANAGER), *_aggregate_columns()).group_by(
+            Feedback.given_by
+        )
+    )
+    expected = {}
+    for row in [*member_rows.all(), *manager_rows.all()]:
+        expected[(row[0], row[1])] = {key: row._mapping[key] for key in COUNTERS}
+    return expected
+
+
+async def compute_trends(db: AsyncSession) -> dict:
+    """
+    Recompute every monthly trend cell from the feedbacks table.
+    """
+    month = year_month(Feedback.created_at)
+    bucket = _bucket_column()
+    result = await db.execute(
+        select(Feedback.given_by, month, bucket, func.count())
+        .where(Feedback.created_at.is_not(None))
+        .group_by(Feedback.given_by, month, bucket)
+    )
+    return {(row[0], row[1], row[2]): row[3] for row in result.all()}
+
+
+async def rebuild_stats(db: AsyncSession) -> list[dict]:
+    """
+    Recompute both rollup tables from scratch and return the rows that had
+    drifted.
+    """
+    zeros = dict.fromkeys(COUNTERS, 0)
+    expected = await compute_stats(db)
+    current_result = await db.execute(select(FeedbackStats))
+    current = {
+        (stats.user_id, stats.scope): to_counters(stats)
+        for stats in current_result.scalars()
+    }
+    drift = [
+        {
+            "table": FeedbackStats.__tablename__,
+            "key": key,
+            "found": current.get(key, zeros),
+            "expected": expected.get(key, zeros),
+        }
+        for key in sorted(expected.keys() | current.keys())
+        if current.get(key, zeros) != expected.get(key, zeros)
+    ]
+
+    expected_trends = await compute_trends(db)
+    trend_result = await db.execute(select(SentimentTrend))
+    current_trends = {
+        (trend.manager_id, trend.month, trend.sentiment): trend.count
+        for trend in trend_result.scalars()
+    }
+    drift += [
+        {
+            "table": SentimentTrend.__tablename__,
+            "key": key,
+            "found": current_trends.get(key, 0),
+            "expected": expected_trends.get(key, 0),
+        }
+        for key in sorted(expected_trends.keys() | current_trends.keys())
+        if current_trends.get(key, 0) != expected_trends.get(key, 0)
+    ]
+
+    await db.execute(delete(FeedbackStats))
+    await db.execute(delete(SentimentTrend))
+    if expected:
+        await db.execute(
+            insert(FeedbackStats),
+            [
+                {"user_id": user_id, "scope": scope, **counters}
+                for (user_id, scope), counters in expected.items()
+            ],
+        )
+    if expected_trends:
+        await db.execute(
+            insert(SentimentTrend),
+            [
+                {
+                    "manager_id": manager_id,
+                    "month": month,
+                    "sentiment": sentiment,
+                    "count": count,
+                }
+                for (manager_id, month, sentiment), count in expected_trends.items()
+            ],
+        )
+    await db.commit()
+    return drift
+
+
+async def ensure_stats(db: AsyncSession):
+    """
+    Populate the rollup tables for databases that predate them.
+    """
+    has_feedback = await db.execute(select(Feedback.id).limit(1))
+    if has_feedback.first() is None:
+        return
+    has_stats = await db.execute(select(FeedbackStats.user_id).limit(1))
+    has_trends = await db.execute(select(SentimentTrend.manager_id).limit(1))
+    if has_stats.first() is None or has_trends.first() is None:
+        await rebuild_stats(db)
+
+
+async def main():
+    from database.db import async_session_maker, engine, Base
+    import models.activity_log  # noqa: F401  registers every table for create_all
+    import models.user  # noqa: F401
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_session_maker() as db:
+        drift = await rebuild_stats(db)
+    await engine.dispose()
+
+    for entry in drift:
+        print(
+            f"{entry['table']} {entry['key']}: "
+            f"found {entry['found']}, expected {entry['expected']}"
+        )
+    print(f"Rebuilt feedback stats, {len(drift)} row(s) had drifted")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
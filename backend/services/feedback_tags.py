@@ -0,0 +1,70 @@
+from datetime import datetime
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.feedback import Feedback, FeedbackTag
+
+
+def normalize(tags: list[str] | None) -> list[str]:
+    """
+    The distinct non-blank tags of a feedback, in their original order.
+    """
+    return list(dict.fromkeys(tag.strip() for tag in tags or [] if tag and tag.strip()))
+
+
+def tag_rows(feedback_id: int, tags: list[str] | None) -> list[dict]:
+    return [{"feedback_id": feedback_id, "tag": tag} for tag in normalize(tags)]
+
+
+async def add_tags(db: AsyncSession, rows: list[dict]):
+    """
+    Insert `feedback_tags` rows built by `tag_rows` in one executemany.
+    """
+    if rows:
+        await db.execute(insert(FeedbackTag), rows)
+
+
+async def replace_tags(db: AsyncSession, feedback_id: int, tags: list[str] | None):
+    await db.execute(delete(FeedbackTag).where(FeedbackTag.feedback_id == feedback_id))
+    await add_tags(db, tag_rows(feedback_id, tags))
+
+
+def with_tags(query, tags: list[str] | None):
+    """
+    Narrow a feedback query to rows carrying every one of `tags`.
+    """
+    for tag in normalize(tags):
+        query = query.where(
+            Feedback.id.in_(
+                select(FeedbackTag.feedback_id).where(FeedbackTag.tag == tag)
+            )
+        )
+    return query
+
+
+async def tag_counts(
+    db: AsyncSession,
+    user_column,
+    user_id: int,
+    start: datetime | None,
+    end: datetime | None,
+    limit: int,
+) -> list[dict]:
+    """
+    The most used tags on feedback whose `user_column` is `user_id`, counted
+    in one GROUP BY over the indexed `feedback_tags` rows.
+    """
+    count = func.count().label("count")
+    query = (
+        select(FeedbackTag.tag, count)
+        .join(Feedback, Feedback.id == FeedbackTag.feedback_id)
+        .where(user_column == user_id)
+        .group_by(FeedbackTag.tag)
+        .order_by(count.desc(), FeedbackTag.tag)
+        .limit(limit)
+    )
+    if start is not None:
+        query = query.where(Feedback.created_at >= start)
+    if end is not None:
+        query = query.where(Feedback.created_at < end)
+    result = await db.execute(query)
+    return [dict(row._mapping) for row in result.all()]
@@ -0,0 +1,146 @@
+import functools
+import os
+import time
+from collections import OrderedDict, defaultdict
+from services import change_versions
+
+
+METRICS_CACHE_TTL_SECONDS = float(os.getenv("METRICS_CACHE_TTL_SECONDS", "60"))
+METRICS_CACHE_MAX_ITEMS = int(os.getenv("METRICS_CACHE_MAX_ITEMS", "10000"))
+
+
+class CacheBackend:
+    """
+    Storage behind MetricsCache.
+
+    Methods are async so a shared store used across workers can do I/O;
+    values are the JSON-compatible dicts and lists returned by endpoints.
+    """
+
+    async def get(self, key: str):
+        raise NotImplementedError
+
+    async def set(self, key: str, value, ttl: float):
+        raise NotImplementedError
+
+    async def delete(self, *keys: str):
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        return 0
+
+
+class MemoryBackend(CacheBackend):
+    """
+    Per-process LRU with per-entry expiry.
+    """
+
+    def __init__(self, max_items: int):
+        self.max_items = max_items
+        self._entries: OrderedDict[str, tuple[float, object]] = OrderedDict()
+
+    async def get(self, key: str):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value, ttl: float):
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_items:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str):
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class MetricsCache:
+    """
+    Response cache for per-user metric endpoints, keyed by (endpoint, user id).
+
+    Entries carry the user's change version they were computed under and only
+    hit for a request that observed the same version, the one its ETag names.
+    A read that raced a write and stored an older result is therefore never
+    served once the write committed. Writers still call `invalidate` after
+    committing to free the superseded entries.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+        self.endpoints: set[str] = set()
+        self.hits: dict[str, int] = defaultdict(int)
+        self.misses: dict[str, int] = defaultdict(int)
+        self.invalidations = 0
+
+    def set_backend(self, backend: CacheBackend):
+        self.backend = backend
+
+    @staticmethod
+    def _key(endpoint: str, user_id: int) -> str:
+        return f"metrics:{endpoint}:{user_id}"
+
+    def cached(self, endpoint: str, user_param: str):
+        """
+        Cache an endpoint's result per value of its `user_param` argument.
+
+        The endpoint must take a `db` session, used to read the user's change
+        version when no ETag check has read it already.
+        """
+        self.endpoints.add(endpoint)
+
+        def decorate(handler):
+            @functools.wraps(handler)
+            async def wrapper(*args, **kwargs):
+                user_id = kwargs[user_param]
+                key = self._key(endpoint, user_id)
+                version = await change_versions.current_version(kwargs["db"], user_id)
+                entry = await self.backend.get(key)
+                if entry is not None and entry[0] == version:
+                    self.hits[endpoint] += 1
+                    return entry[1]
+                self.misses[endpoint] += 1
+                value = await handler(*args, **kwargs)
+                await self.backend.set(key, [version, value], self.ttl)
+                return value
+
+            return wrapper
+
+        return decorate
+
+    async def invalidate(self, *user_ids: int | None):
+        keys = []
+        for user_id in {user_id for user_id in user_ids if user_id is not None}:
+            keys.extend(self._key(endpoint, user_id) for endpoint in self.endpoints)
+        if keys:
+            self.invalidations += 1
+            await self.backend.delete(*keys)
+
+    def stats(self) -> dict:
+        hits, misses = sum(self.hits.values()), sum(self.misses.values())
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0,
+            "invalidations": self.invalidations,
+            "size": len(self.backend),
+            "endpoints": {
+                endpoint: {"hits": self.hits[endpoint], "misses": self.misses[endpoint]}
+                for endpoint in sorted(self.endpoints)
+            },
+        }
+
+
+metrics_cache = MetricsCache(
+    MemoryBackend(METRICS_CACHE_MAX_ITEMS), METRICS_CACHE_TTL_SECONDS
+)
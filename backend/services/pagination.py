@@ -0,0 +1,66 @@
+import base64
+import json
+from datetime import datetime
+from typing import NamedTuple
+from fastapi import HTTPException, Query
+from sqlalchemy import and_, desc, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+from models.feedback import Feedback
+
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class PageParams(NamedTuple):
+    after: tuple[datetime, int] | None
+    limit: int
+
+
+def encode_cursor(feedback: Feedback) -> str:
+    payload = json.dumps([feedback.created_at.isoformat(), feedback.id])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def page_params(
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+) -> PageParams:
+    return PageParams(decode_cursor(cursor) if cursor else None, limit)
+
+
+async def fetch_feedback_page(db: AsyncSession, query: Select, page: PageParams) -> dict:
+    """
+    Fetch one page of feedbacks, newest first, keyed on (created_at, id).
+
+    Seeking past the previous page's last row keeps every page an index range
+    scan, however deep into a user's history the client has scrolled.
+    """
+    if page.after is not None:
+        created_at, row_id = page.after
+        query = query.where(
+            or_(
+                Feedback.created_at < created_at,
+                and_(Feedback.created_at == created_at, Feedback.id < row_id),
+            )
+        )
+    result = await db.execute(
+        query.order_by(desc(Feedback.created_at), desc(Feedback.id)).limit(
+            page.limit + 1
+        )
+    )
+    feedbacks = result.scalars().all()
+    next_cursor = None
+    if len(feedbacks) > page.limit:
+        feedbacks = feedbacks[: page.limit]
+        next_cursor = encode_cursor(feedbacks[-1])
+    return {"items": feedbacks, "next_cursor": next_cursor}
@@ -0,0 +1,65 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import HTTPException
+from passlib.context import CryptContext
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "4"))
+PASSWORD_HASH_QUEUE_DEPTH = int(os.getenv("PASSWORD_HASH_QUEUE_DEPTH", "64"))
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+_executor: ThreadPoolExecutor | None = None
+_in_flight = 0
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+        )
+    return _executor
+
+
+async def _run(func, *args):
+    """
+    Run a bcrypt operation on the worker pool without blocking the event loop.
+
+    bcrypt releases the GIL while hashing, so the pool gives real parallelism.
+    Once every worker is busy and the queue is full, new work is rejected
+    with a 503 rather than piling up behind the storm.
+    """
+    global _in_flight
+    if _in_flight >= PASSWORD_HASH_WORKERS + PASSWORD_HASH_QUEUE_DEPTH:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many authentication requests, please retry shortly",
+            headers={"Retry-After": "1"},
+        )
+    _in_flight += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(
+            _get_executor(), func, *args
+        )
+    finally:
+        _in_flight -= 1
+
+
+async def hash_password(password: str) -> str:
+    return await _run(pwd_context.hash, password)
+
+
+async def verify_password(password: str, hashed: str) -> bool:
+    return await _run(pwd_context.verify, password, hashed)
+
+
+def shutdown():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
@@ -0,0 +1,123 @@
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from services import pdf_reports
+
+
+PDF_CACHE_DIR = Path(
+    os.getenv("PDF_CACHE_DIR", os.path.join(tempfile.gettempdir(), "workplace_vibe_pdfs"))
+)
+PDF_CACHE_MEMORY_ITEMS = int(os.getenv("PDF_CACHE_MEMORY_ITEMS", "256"))
+
+_memory: OrderedDict[tuple[int, str], bytes] = OrderedDict()
+# Renders in progress, so concurrent misses for one report share a render.
+_inflight: dict[tuple[int, str], asyncio.Task] = {}
+
+
+def content_version(data: dict) -> str:
+    """
+    Hash of everything that ends up on the rendered page.
+
+    Doubles as the cache key and the ETag, so any change to the feedback
+    produces a new version without tracking edits explicitly.
+    """
+    payload = json.dumps(data, sort_keys=True, default=str).encode()
+    return hashlib.sha256(payload).hexdigest()[:32]
+
+
+def _disk_path(feedback_id: int, version: str) -> Path:
+    return PDF_CACHE_DIR / f"{feedback_id}-{version}.pdf"
+
+
+def _remember(key: tuple[int, str], pdf: bytes):
+    _memory[key] = pdf
+    _memory.move_to_end(key)
+    while len(_memory) > PDF_CACHE_MEMORY_ITEMS:
+        _memory.popitem(last=False)
+
+
+def _read_disk(path: Path) -> bytes | None:
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _write_disk(path: Path, pdf: bytes):
+    """
+    Write `pdf` to `path` atomically.
+
+    Each writer gets its own temporary file, so concurrent writers (e.g. other
+    worker processes rendering the same report) never share a partial file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f"{path.stem}-", suffix=".tmp", delete=False
+    ) as partial:
+        partial.write(pdf)
+    try:
+        os.replace(partial.name, path)
+    except OSError:
+        os.unlink(partial.name)
+        raise
+
+
+async def _load(key: tuple[int, str], data: dict) -> bytes:
+    path = _disk_path(*key)
+    pdf = await asyncio.to_thread(_read_disk, path)
+    if pdf is None:
+        pdf = await pdf_reports.render_pdf(data)
+        await asyncio.to_thread(_write_disk, path, pdf)
+    _remember(key, pdf)
+    return pdf
+
+
+async def get_pdf(data: dict, version: str) -> bytes:
+    """
+    Return the rendered report for `data`, from memory, disk or a fresh render.
+
+    Concurrent requests for a report that is not cached wait on one render.
+    """
+    key = (data["id"], version)
+    pdf = _memory.get(key)
+    if pdf is not None:
+        _memory.move_to_end(key)
+        return pdf
+
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_load(key, data))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # A client disconnecting must not cancel the render others are waiting on.
+    return await asyncio.shield(task)
+
+
+def _remove_disk(feedback_ids: tuple[int, ...]):
+    for feedback_id in feedback_ids:
+        for path in PDF_CACHE_DIR.glob(f"{feedback_id}-*.pdf"):
+            path.unlink(missing_ok=True)
+
+
+async def invalidate(*feedback_ids: int):
+    """
+    Drop every cached rendering of the given feedbacks after their rows change.
+    """
+    ids = set(feedback_ids)
+    for key in [key for key in _memory if key[0] in ids]:
+        del _memory[key]
+    if feedback_ids:
+        await asyncio.to_thread(_remove_disk, feedback_ids)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
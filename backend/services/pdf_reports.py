@@ -0,0 +1,169 @@
+import asyncio
+import multiprocessing
+import os
+import re
+import zipfile
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
+
+
+PDF_RENDER_WORKERS = int(os.getenv("PDF_RENDER_WORKERS", str(os.cpu_count() or 1)))
+
+_executor: ProcessPoolExecutor | None = None
+
+
+REPORT_FIELDS = (
+    "id",
+    "member",
+    "strengths",
+    "improvement",
+    "sentiment",
+    "tags",
+    "acknowledged",
+    "created_at",
+)
+
+
+def report_data(feedback, manager_name: str) -> dict:
+    """
+    Flatten a feedback into the picklable dict the render workers take.
+
+    Accepts either a Feedback instance or a row mapping with the same keys.
+    """
+    if not isinstance(feedback, Mapping):
+        feedback = {field: getattr(feedback, field) for field in REPORT_FIELDS}
+    tags = feedback["tags"]
+    created_at = feedback["created_at"]
+    return {
+        "id": feedback["id"],
+        "member": feedback["member"],
+        "strengths": feedback["strengths"],
+        "improvement": feedback["improvement"],
+        "sentiment": feedback["sentiment"],
+        "tags": tags if isinstance(tags, list) else [],
+        "given_by_name": manager_name,
+        "acknowledged": bool(feedback["acknowledged"]),
+        "created_at": created_at.strftime("%Y-%m-%d %H:%M:%S") if created_at else "-",
+    }
+
+
+def report_filename(data: dict) -> str:
+    name = f"feedback_{data['id']}_from_{data['given_by_name']}_to_{data['member']}.pdf"
+    return re.sub(r"[^\w.\-]+", "_", name)
+
+
+def render_feedback_pdf(data: dict) -> bytes:
+    """
+    Render one feedback report. Runs inside a worker process.
+    """
+    buffer = BytesIO()
+    p = canvas.Canvas(buffer, pagesize=letter)
+    p.setFont("Helvetica-Bold", 16)
+    p.drawString(72, 750, f"Feedback Report (ID: {data['id']})")
+    p.setFont("Helvetica", 12)
+    y = 720
+    p.drawString(72, y, f"Member: {data['member']}")
+    y -= 20
+    p.drawString(72, y, f"Strengths: {data['strengths']}")
+    y -= 20
+    p.drawString(72, y, f"Improvement: {data['improvement']}")
+    y -= 20
+    p.drawString(72, y, f"Sentiment: {data['sentiment']}")
+    y -= 20
+    tags = data["tags"]
+    p.drawString(72, y, f"Tags: {', '.join(tags) if tags else '-'}")
+    y -= 20
+    p.drawString(72, y, f"Given By: {data['given_by_name']}")
+    y -= 20
+    p.drawString(72, y, f"Acknowledged: {'Yes' if data['acknowledged'] else 'No'}")
+    y -= 20
+    p.drawString(72, y, f"Created At: {data['created_at']}")
+    p.showPage()
+    p.save()
+    return buffer.getvalue()
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=PDF_RENDER_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+async def render_pdf(data: dict) -> bytes:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), render_feedback_pdf, data)
+
+
+async def render_all(rows):
+    """
+    Render reports for an async stream of row batches, yielding
+    (filename, pdf) in input order.
+
+    Up to two renders per worker are kept in flight so the pool stays busy
+    while finished reports are being sent to the client.
+    """
+    window = PDF_RENDER_WORKERS * 2
+    pending = deque()
+    async for batch in rows:
+        for row in batch:
+            data = report_data(row, row["given_by_name"])
+            future = asyncio.ensure_future(render_pdf(data))
+            pending.append((report_filename(data), future))
+            if len(pending) >= window:
+                filename, future = pending.popleft()
+                yield filename, await future
+    while pending:
+        filename, future = pending.popleft()
+        yield filename, await future
+
+
+class _ChunkSink:
+    """
+    Write-only file object that hands out whatever has been written so far.
+
+    It has no tell(), so zipfile writes entries in streaming mode with data
+    descriptors instead of seeking back to patch headers.
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def stream_zip(rows):
+    """
+    Stream a zip of rendered reports, emitting each entry as soon as it is
+    rendered.
+    """
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        async for filename, pdf in render_all(rows):
+            archive.writestr(filename, pdf)
+            yield sink.take()
+    yield sink.take()
+
+
+def shutdown():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
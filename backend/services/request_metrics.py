@@ -0,0 +1,173 @@
+import contextvars
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+UNMATCHED_ROUTE = "<unmatched>"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144)
+DB_TIME_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+
+
+@dataclass
+class QueryStats:
+    queries: int = 0
+    seconds: float = 0.0
+
+
+# Statements and time spent in the database by the request being served.
+# Set by the metrics middleware; tasks spawned while serving inherit it.
+_current: contextvars.ContextVar[QueryStats | None] = contextvars.ContextVar(
+    "query_stats", default=None
+)
+
+
+def track() -> QueryStats:
+    """
+    Start counting the database work of the current request.
+    """
+    stats = QueryStats()
+    _current.set(stats)
+    return stats
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and _current.get() is not None:
+        context._metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    started = getattr(context, "_metrics_started", None)
+    if stats is None or started is None:
+        return
+    stats.queries += 1
+    stats.seconds += time.perf_counter() - started
+
+
+def instrument(engine: AsyncEngine):
+    """
+    Attribute every statement `engine` runs to the request that issued it.
+
+    Executemany batches count as one statement; statements that fail are not
+    counted.
+    """
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class Histogram:
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value: float):
+        index = bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: dict) -> str:
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+class RequestMetrics:
+    """
+    Per-route request counters and histograms, rendered in the Prometheus
+    text format.
+
+    Routes are labelled by their path template, so ids in URLs do not create
+    new series. Each worker process keeps its own registry.
+    """
+
+    def __init__(self):
+        self.requests: dict[tuple[str, str, int], int] = {}
+        self.in_progress: dict[tuple[str, str], int] = {}
+        self.durations: dict[tuple[str, str], Histogram] = {}
+        self.queries: dict[tuple[str, str], Histogram] = {}
+        self.db_durations: dict[tuple[str, str], Histogram] = {}
+
+    def started(self, method: str, route: str):
+        key = (method, route)
+        self.in_progress[key] = self.in_progress.get(key, 0) + 1
+
+    def finished(
+        self, method: str, route: str, status: int, seconds: float, stats: QueryStats
+    ):
+        key = (method, route)
+        self.in_progress[key] -= 1
+        counter = (method, route, status)
+        self.requests[counter] = self.requests.get(counter, 0) + 1
+        for histograms, buckets, value in (
+            (self.durations, LATENCY_BUCKETS, seconds),
+            (self.queries, QUERY_BUCKETS, stats.queries),
+            (self.db_durations, DB_TIME_BUCKETS, stats.seconds),
+        ):
+            if key not in histograms:
+                histograms[key] = Histogram(buckets)
+            histograms[key].observe(value)
+
+    def render(self) -> str:
+        lines = []
+
+        def header(name: str, kind: str, help_text: str):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        header("http_requests_total", "counter", "Requests served, by route and status code.")
+        for (method, route, status), count in sorted(self.requests.items()):
+            labels = _labels({"method": method, "route": route, "status": status})
+            lines.append(f"http_requests_total{labels} {count}")
+
+        header("http_requests_in_progress", "gauge", "Requests currently being served.")
+        for (method, route), count in sorted(self.in_progress.items()):
+            labels = _labels({"method": method, "route": route})
+            lines.append(f"http_requests_in_progress{labels} {count}")
+
+        for name, histograms, help_text in (
+            (
+                "http_request_duration_seconds",
+                self.durations,
+                "Time from receiving a request to sending the last byte of its response.",
+            ),
+            (
+                "http_request_db_queries",
+                self.queries,
+                "SQL statements executed while serving a request.",
+            ),
+            (
+                "http_request_db_duration_seconds",
+                self.db_durations,
+                "Time spent executing SQL statements while serving a request.",
+            ),
+        ):
+            header(name, "histogram", help_text)
+            for (method, route), histogram in sorted(histograms.items()):
+                labels = {"method": method, "route": route}
+                cumulative = 0
+                for bucket, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    bucket_labels = _labels({**labels, "le": bucket})
+                    lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+                bucket_labels = _labels({**labels, "le": "+Inf"})
+                lines.append(f"{name}_bucket{bucket_labels} {histogram.count}")
+                lines.append(f"{name}_sum{_labels(labels)} {histogram.sum}")
+                lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+
+metrics = RequestMetrics()
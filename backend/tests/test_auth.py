@@ -0,0 +1,73 @@
+import calendar
+import time
+import jose.jwt
+import pytest
+from sqlalchemy import delete, update
+from database.db import engine
+from middleware import token_cache as token_cache_module
+from middleware.auth_middleware import token_cache
+from models.user import User
+from routers.auth import ACCESS_TOKEN_EXPIRE_MINUTES
+from tests.conftest import make_user
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def advance_clock(monkeypatch):
+    """
+    Move the clocks of the token cache and of JWT validation forward.
+    """
+    offset = 0
+
+    class Clock:
+        @staticmethod
+        def time():
+            return time.time() + offset
+
+    # jose turns its current time into a timestamp with timegm.
+    def timegm(moment):
+        return calendar.timegm(moment) + offset
+
+    monkeypatch.setattr(token_cache_module, "time", Clock)
+    monkeypatch.setattr(jose.jwt, "timegm", timegm)
+
+    def advance(seconds: float):
+        nonlocal offset
+        offset += seconds
+
+    return advance
+
+
+async def test_cached_token_is_rejected_once_it_expires(client, monkeypatch, advance_clock):
+    monkeypatch.setattr(token_cache, "ttl", float("inf"))
+    alice = await make_user(client, "Alice")
+    path = f"/employee/{alice['id']}/feedbacks/count"
+    token = alice["headers"]["Authorization"].split(" ", 1)[1]
+
+    response = await client.get(path, headers=alice["headers"])
+    assert response.status_code == 200, response.text
+    assert token in token_cache._entries
+
+    advance_clock(ACCESS_TOKEN_EXPIRE_MINUTES * 60 + 60)
+    response = await client.get(path, headers=alice["headers"])
+    assert response.status_code == 401
+    assert token not in token_cache._entries
+
+
+async def test_account_changes_are_seen_after_the_cache_ttl(client, advance_clock):
+    sam = await make_user(client, "Sam")
+    response = await client.post("/feedback/import", json=[], headers=sam["headers"])
+    assert response.status_code == 403
+
+    async with engine.begin() as conn:
+        await conn.execute(update(User).where(User.id == sam["id"]).values(role="manager"))
+    advance_clock(token_cache.ttl + 1)
+    response = await client.post("/feedback/import", json=[], headers=sam["headers"])
+    assert response.status_code == 200, response.text
+
+    async with engine.begin() as conn:
+        await conn.execute(delete(User).where(User.id == sam["id"]))
+    advance_clock(token_cache.ttl + 1)
+    response = await client.post("/feedback/import", json=[], headers=sam["headers"])
+    assert response.status_code == 401
@@ -0,0 +1,43 @@
+import pytest
+from services.metrics_cache import metrics_cache
+from tests.conftest import give_feedback, make_user
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_unchanged_metrics_answer_304(client):
+    manager = await make_user(client, "Morgan", "manager")
+    path = f"/manager/{manager['id']}/feedbacks/count"
+
+    first = await client.get(path, headers=manager["headers"])
+    assert first.status_code == 200, first.text
+    headers = {**manager["headers"], "If-None-Match": first.headers["ETag"]}
+    response = await client.get(path, headers=headers)
+    assert response.status_code == 304
+
+
+async def test_cached_body_matches_the_etag_before_invalidation(client, monkeypatch):
+    manager = await make_user(client, "Morgan", "manager")
+    alice = await make_user(client, "Alice")
+    path = f"/manager/{manager['id']}/feedbacks/count"
+    before = await client.get(path, headers=manager["headers"])
+    assert before.json() == {"total_feedback_given": 0}
+
+    # A read served after the write commits but before it invalidates the
+    # cache must not pair the new ETag with the cached body.
+    async def not_yet(*user_ids):
+        return None
+
+    monkeypatch.setattr(metrics_cache, "invalidate", not_yet)
+    await give_feedback(client, manager, alice)
+    after = await client.get(path, headers=manager["headers"])
+
+    assert after.headers["ETag"] != before.headers["ETag"]
+    assert after.json() == {"total_feedback_given": 1}
+
+
+async def test_non_numeric_user_id_is_a_validation_error(client):
+    manager = await make_user(client, "Morgan", "manager")
+    for path in ("/manager/abc/dashboard", "/employee/abc/feedbacks/count"):
+        response = await client.get(path, headers=manager["headers"])
+        assert response.status_code == 422, (path, response.text)
@@ -0,0 +1,61 @@
+import pytest
+from sqlalchemy import select
+from database.db import engine
+from models.feedback_stats import FeedbackStats
+from tests.conftest import give_feedback, make_user
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_member_id_must_be_the_named_employee_of_the_givers_company(client):
+    manager = await make_user(client, "Morgan", "manager")
+    alice = await make_user(client, "Alice")
+    bob = await make_user(client, "Bob")
+    await make_user(client, "Gus", "manager", company="Globex")
+    outsider = await make_user(client, "Alice", company="Globex")
+
+    for member_id in (outsider["id"], bob["id"], manager["id"], 99999):
+        response = await client.post(
+            "/feedback",
+            json={
+                "member": "Alice",
+                "member_id": member_id,
+                "strengths": "Strong",
+                "improvement": "Weak",
+                "sentiment": "Positive",
+                "given_by": manager["id"],
+                "acknowledged": False,
+            },
+            headers=manager["headers"],
+        )
+        assert response.status_code == 400, (member_id, response.text)
+
+    async with engine.connect() as conn:
+        assert (await conn.execute(select(FeedbackStats))).first() is None
+
+    created = await give_feedback(client, manager, alice)
+    assert created["member_id"] == alice["id"]
+
+
+async def test_member_name_resolves_within_the_givers_company(client):
+    manager = await make_user(client, "Morgan", "manager")
+    await make_user(client, "Gus", "manager", company="Globex")
+    await make_user(client, "Alice", company="Globex")
+    alice = await make_user(client, "Alice")
+
+    created = await give_feedback(client, manager, {"name": "Alice", "id": None})
+    assert created["member_id"] == alice["id"]
+
+    response = await client.post(
+        "/feedback",
+        json={
+            "member": "Nobody",
+            "strengths": "Strong",
+            "improvement": "Weak",
+            "sentiment": "Positive",
+            "given_by": manager["id"],
+            "acknowledged": False,
+        },
+        headers=manager["headers"],
+    )
+    assert response.status_code == 404
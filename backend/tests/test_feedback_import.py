@@ -0,0 +1,61 @@
+import pytest
+from sqlalchemy import event, select
+from database.db import engine
+from models.activity_log import ActivityLog
+from models.feedback import Feedback, FeedbackTag
+from tests.conftest import make_user
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_import_inserts_each_table_in_one_statement(client):
+    manager = await make_user(client, "Morgan", "manager")
+    employees = [await make_user(client, name) for name in ("Alice", "Bob", "Cara")]
+    records = [
+        {
+            "member": employee["name"],
+            "strengths": f"Strength {index}",
+            "improvement": "Same as everyone",
+            "sentiment": ("Positive", "Neutral", "Negative")[index % 3],
+            "tags": [f"Tag{index % 4}"] if index % 5 else [],
+            "given_by": manager["id"],
+            "acknowledged": index % 2 == 0,
+            "created_at": f"2025-0{index % 6 + 1}-01T12:00:00+00:00",
+        }
+        for index in range(50)
+        for employee in [employees[index % 3]]
+    ]
+    # Identical records are interchangeable and must both import.
+    records.append(dict(records[-1]))
+
+    inserts = []
+
+    def count_inserts(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO"):
+            inserts.append(statement.split()[2])
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count_inserts)
+    try:
+        response = await client.post(
+            "/feedback/import", json=records, headers=manager["headers"]
+        )
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count_inserts)
+    assert response.status_code == 200, response.text
+    assert response.json()["imported"] == len(records)
+    assert inserts.count("feedbacks") == 1
+    assert inserts.count("activity_logs") == 1
+
+    async with engine.connect() as conn:
+        feedbacks = (await conn.execute(select(Feedback))).all()
+        tags = (await conn.execute(select(FeedbackTag.feedback_id, FeedbackTag.tag))).all()
+        logs = (await conn.execute(select(ActivityLog.target, ActivityLog.details))).all()
+    by_id = {feedback.id: feedback for feedback in feedbacks}
+    assert len(by_id) == len(records)
+    assert sorted(tags) == sorted(
+        (feedback.id, tag) for feedback in feedbacks for tag in feedback.tags or []
+    )
+    assert sorted(by_id[log.details["feedback_id"]].member for log in logs) == sorted(
+        log.target for log in logs
+    )
+    assert len({log.details["feedback_id"] for log in logs}) == len(records)
@@ -0,0 +1,134 @@
+from datetime import datetime
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.db import engine
+from models.feedback import Feedback
+from schemas.feedback import MAX_BATCH_ITEMS
+from services import feedback_stats
+from tests.conftest import make_user
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_batch_acknowledge_writes_each_table_once(client):
+    managers = [await make_user(client, name, "manager") for name in ("Ada", "Grace")]
+    alice = await make_user(client, "Alice")
+    rows = [
+        {
+            "member": "Alice",
+            "member_id": alice["id"],
+            "strengths": "Strong",
+            "improvement": "Weak",
+            "sentiment": sentiment,
+            "given_by": manager["id"],
+            "acknowledged": False,
+            "created_at": datetime(2025, month, 1),
+        }
+        for manager in managers
+        for month in (4, 5, 6)
+        for sentiment in ("Positive", "Negative")
+    ]
+    async with engine.begin() as conn:
+        result = await conn.execute(
+            insert(Feedback).returning(Feedback.id, sort_by_parameter_order=True), rows
+        )
+        ids = result.scalars().all()
+    async with AsyncSession(engine) as session:
+        await feedback_stats.rebuild_stats(session)
+
+    inserts = []
+
+    def count_inserts(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO"):
+            inserts.append(statement.split()[2])
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count_inserts)
+    try:
+        response = await client.post(
+            "/feedback/acknowledge-batch",
+            json={"feedback_ids": ids},
+            headers=alice["headers"],
+        )
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count_inserts)
+    assert response.status_code == 200, response.text
+    assert sorted(response.json()["acknowledged"]) == sorted(ids)
+
+    assert inserts.count("feedback_stats") == 1
+    assert "sentiment_trends" not in inserts
+    assert inserts.count("activity_logs") == 1
+    async with AsyncSession(engine) as session:
+        assert await feedback_stats.rebuild_stats(session) == []
+        member = await feedback_stats.get_stats(session, alice["id"], feedback_stats.MEMBER)
+    assert member["acknowledged"] == member["total"] == len(ids)
+
+
+async def test_apply_deltas_sums_rows_sharing_a_key(client):
+    manager = await make_user(client, "Ada", "manager")
+    alice = await make_user(client, "Alice")
+    created_at = datetime(2025, 6, 1)
+    changes = [
+        (alice["id"], manager["id"], created_at, feedback_stats.contribution("Positive", False)),
+        (alice["id"], manager["id"], created_at, feedback_stats.contribution("Positive", True)),
+        (None, manager["id"], created_at, feedback_stats.contribution("Negative", False)),
+    ]
+    async with AsyncSession(engine) as session:
+        await feedback_stats.apply_deltas(session, changes)
+        await session.commit()
+        member = await feedback_stats.get_stats(session, alice["id"], feedback_stats.MEMBER)
+        given = await feedback_stats.get_stats(session, manager["id"], feedback_stats.MANAGER)
+        trends = await feedback_stats.get_trends(session, manager["id"], ["2025-06"])
+
+    assert member == {"total": 2, "acknowledged": 1, "positive": 2, "neutral": 0, "negative": 0}
+    assert given == {"total": 3, "acknowledged": 1, "positive": 2, "neutral": 0, "negative": 1}
+    assert trends == {"2025-06": {"positive": 2, "neutral": 0, "negative": 1}}
+
+
+async def test_batches_are_capped(client):
+    alice = await make_user(client, "Alice")
+    manager = await make_user(client, "Ada", "manager")
+    too_many = list(range(1, MAX_BATCH_ITEMS + 2))
+    response = await client.post(
+        "/feedback/acknowledge-batch",
+        json={"feedback_ids": too_many},
+        headers=alice["headers"],
+    )
+    assert response.status_code == 422
+    response = await client.put(
+        "/feedback_request/complete-batch",
+        json={"employees": [str(i) for i in too_many]},
+        headers=manager["headers"],
+    )
+    assert response.status_code == 422
+
+
+async def test_batch_completion_logs_in_one_statement(client):
+    manager = await make_user(client, "Ada", "manager")
+    employees = [await make_user(client, f"Employee {index}") for index in range(20)]
+    for employee in employees:
+        response = await client.post(
+            "/feedback/request", json={"member": employee["name"]}, headers=employee["headers"]
+        )
+        assert response.status_code == 200, response.text
+
+    inserts = []
+
+    def count_inserts(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO"):
+            inserts.append(statement.split()[2])
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count_inserts)
+    try:
+        response = await client.put(
+            "/feedback_request/complete-batch",
+            json={"employees": [employee["name"] for employee in employees]},
+            headers=manager["headers"],
+        )
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count_inserts)
+    assert response.status_code == 200, response.text
+    assert sorted(req["employee_id"] for req in response.json()) == sorted(
+        employee["id"] for employee in employees
+    )
+    assert inserts.count("activity_logs") == 1
@@ -0,0 +1,120 @@
+import sqlite3
+import pytest
+from sqlalchemy import event, select
+from database.db import engine
+from models.feedback_stats import FeedbackStats
+from tests.conftest import give_feedback, make_user
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_request_picks_one_manager_and_the_callers_colleague(client):
+    first_manager = await make_user(client, "Ada", "manager")
+    await make_user(client, "Grace", "manager")
+    await make_user(client, "Gus", "manager", company="Globex")
+    await make_user(client, "Sam", company="Globex")
+    sam = await make_user(client, "Sam")
+
+    response = await client.post(
+        "/feedback/request", json={"member": "Sam"}, headers=first_manager["headers"]
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json()["employee_id"] == sam["id"]
+    assert response.json()["manager_id"] == first_manager["id"]
+
+
+async def test_employee_requests_feedback_for_themselves(client):
+    manager = await make_user(client, "Ada", "manager")
+    await make_user(client, "Sam")
+    second_sam = await make_user(client, "Sam", email="sam.two@example.com")
+    lone_sam = await make_user(client, "Sam", company="Initech")
+
+    response = await client.post(
+        "/feedback/request", json={"member": "Sam"}, headers=second_sam["headers"]
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["employee_id"] == second_sam["id"]
+    assert response.json()["manager_id"] == manager["id"]
+
+    response = await client.post(
+        "/feedback/request", json={"member": "Nobody"}, headers=manager["headers"]
+    )
+    assert response.status_code == 404
+    response = await client.post(
+        "/feedback/request", json={"member": "Sam"}, headers=lone_sam["headers"]
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Manager not found for this company"
+
+
+async def test_edit_racing_an_acknowledgement_keeps_counters_exact(client):
+    if engine.dialect.name != "sqlite":
+        pytest.skip("the concurrent write is made through a second SQLite connection")
+    manager = await make_user(client, "Morgan", "manager")
+    alice = await make_user(client, "Alice")
+    feedback = await give_feedback(client, manager, alice)
+
+    # Acknowledge the feedback from another connection between the edit's
+    # read of the row and its UPDATE, as a concurrent request would.
+    raced = []
+
+    def acknowledge_first(conn, cursor, statement, parameters, context, executemany):
+        if raced or not statement.startswith("UPDATE feedbacks SET"):
+            return
+        raced.append(statement)
+        other = sqlite3.connect(engine.url.database, timeout=5)
+        with other:
+            other.execute("UPDATE feedbacks SET acknowledged = 1 WHERE id = ?", (feedback["id"],))
+            other.execute("UPDATE feedback_stats SET acknowledged = acknowledged + 1")
+        other.close()
+
+    event.listen(engine.sync_engine, "before_cursor_execute", acknowledge_first)
+    try:
+        response = await client.put(
+            f"/feedback/{feedback['id']}",
+            json={"sentiment": "Negative"},
+            headers=manager["headers"],
+        )
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", acknowledge_first)
+    assert response.status_code == 200, response.text
+    assert raced
+
+    async with engine.connect() as conn:
+        rows = (await conn.execute(select(FeedbackStats))).all()
+    counters = {
+        row.scope: (row.total, row.acknowledged, row.positive, row.neutral, row.negative)
+        for row in rows
+    }
+    assert counters == {"member": (1, 1, 0, 0, 1), "manager": (1, 1, 0, 0, 1)}
+
+
+async def test_complete_request_finds_the_namesake_with_a_pending_request(client):
+    manager = await make_user(client, "Ada", "manager")
+    await make_user(client, "Sam")
+    second_sam = await make_user(client, "Sam", email="sam.two@example.com")
+    await make_user(client, "Gus", "manager", company="Globex")
+    await make_user(client, "Sam", company="Globex")
+
+    response = await client.post(
+        "/feedback/request", json={"member": "Sam"}, headers=second_sam["headers"]
+    )
+    assert response.status_code == 200, response.text
+
+    response = await client.put(
+        "/feedback_request/complete",
+        json={"employee": "Sam", "manager_id": manager["id"]},
+        headers=manager["headers"],
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["employee_id"] == second_sam["id"]
+    assert response.json()["status"] == "completed"
+
+    response = await client.put(
+        "/feedback_request/complete",
+        json={"employee": "Sam", "manager_id": manager["id"]},
+        headers=manager["headers"],
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Pending feedback request not found"
@@ -0,0 +1,76 @@
+import pytest
+from sqlalchemy import insert, select, update
+from database.db import engine
+from database.migrations import add_feedback_member_id
+from models.feedback import Feedback
+from models.feedback_stats import FeedbackStats
+from tests.conftest import make_user
+
+pytestmark = pytest.mark.anyio
+
+
+def _legacy_feedback(member: str, given_by: int) -> dict:
+    return {
+        "member": member,
+        "strengths": "Legacy",
+        "improvement": "Legacy",
+        "sentiment": "Positive",
+        "given_by": given_by,
+        "acknowledged": False,
+    }
+
+
+async def test_member_backfill_stays_within_the_givers_company(client):
+    acme_manager = await make_user(client, "Ada", "manager", company="Acme")
+    acme_sam = await make_user(client, "Sam", company="Acme")
+    globex_manager = await make_user(client, "Gus", "manager", company="Globex")
+    globex_sam = await make_user(client, "Sam", company="Globex")
+
+    async with engine.begin() as conn:
+        result = await conn.execute(
+            insert(Feedback).returning(Feedback.id, sort_by_parameter_order=True),
+            [
+                _legacy_feedback("Sam", globex_manager["id"]),
+                _legacy_feedback("Sam", acme_manager["id"]),
+                _legacy_feedback("Nobody", globex_manager["id"]),
+            ],
+        )
+        globex_row, acme_row, unknown_row = result.scalars().all()
+        await conn.run_sync(add_feedback_member_id)
+        linked = dict((await conn.execute(select(Feedback.id, Feedback.member_id))).all())
+
+    assert linked == {
+        globex_row: globex_sam["id"],
+        acme_row: acme_sam["id"],
+        unknown_row: None,
+    }
+
+
+async def test_member_backfill_repairs_links_across_companies(client):
+    await make_user(client, "Ada", "manager", company="Acme")
+    acme_sam = await make_user(client, "Sam", company="Acme")
+    globex_manager = await make_user(client, "Gus", "manager", company="Globex")
+    globex_sam = await make_user(client, "Sam", company="Globex")
+
+    async with engine.begin() as conn:
+        feedback_id = await conn.scalar(
+            insert(Feedback)
+            .values(_legacy_feedback("Sam", globex_manager["id"]))
+            .returning(Feedback.id)
+        )
+        await conn.execute(
+            update(Feedback)
+            .where(Feedback.id == feedback_id)
+            .values(member_id=acme_sam["id"])
+        )
+        await conn.execute(
+            insert(FeedbackStats).values(user_id=acme_sam["id"], scope="member", total=1)
+        )
+        await conn.run_sync(add_feedback_member_id)
+        member_id = await conn.scalar(
+            select(Feedback.member_id).where(Feedback.id == feedback_id)
+        )
+        stats = await conn.scalar(select(FeedbackStats.user_id).limit(1))
+
+    assert member_id == globex_sam["id"]
+    assert stats is None
@@ -0,0 +1,82 @@
+import pytest
+from sqlalchemy import insert, text
+from database.db import engine
+from database.migrations import normalize_feedback_timestamps
+from models.feedback import Feedback
+from tests.conftest import make_user
+
+pytestmark = pytest.mark.anyio
+
+
+async def _pages(client, path: str, headers: dict, limit: int, max_pages: int = 20) -> list[int]:
+    ids, cursor = [], None
+    for _ in range(max_pages):
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        response = await client.get(path, params=params, headers=headers)
+        assert response.status_code == 200, response.text
+        page = response.json()
+        ids.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return ids
+    pytest.fail(f"{path} did not reach its last page in {max_pages} pages")
+
+
+async def test_pages_cover_every_feedback_once(client):
+    manager = await make_user(client, "Morgan", "manager")
+    alice = await make_user(client, "Alice")
+    rows = [
+        {
+            "member": "Alice",
+            "member_id": alice["id"],
+            "strengths": "Strong",
+            "improvement": "Weak",
+            "sentiment": "Positive",
+            "given_by": manager["id"],
+            "acknowledged": False,
+        }
+        for _ in range(5)
+    ]
+    async with engine.begin() as conn:
+        result = await conn.execute(
+            insert(Feedback).returning(Feedback.id, sort_by_parameter_order=True), rows
+        )
+        ids = result.scalars().all()
+
+    pages = await _pages(client, "/employee/Alice/feedbacks", alice["headers"], limit=2)
+    assert sorted(pages) == sorted(ids)
+
+
+async def test_pages_past_timestamps_without_microseconds(client):
+    if engine.dialect.name != "sqlite":
+        pytest.skip("only SQLite stores timestamps as text")
+    manager = await make_user(client, "Morgan", "manager")
+    alice = await make_user(client, "Alice")
+
+    # Rows as found in older databases: several share a second and none have
+    # a fractional part.
+    async with engine.begin() as conn:
+        for created_at in (
+            "2025-06-25 19:17:23",
+            "2025-06-25 19:17:23",
+            "2025-06-25 19:17:23",
+            "2025-06-25 19:17:24",
+            "2025-06-25T19:17:25.5",
+        ):
+            await conn.execute(
+                text(
+                    "INSERT INTO feedbacks (member, member_id, strengths, improvement, "
+                    "sentiment, given_by, acknowledged, created_at) VALUES "
+                    "('Alice', :member_id, 'Strong', 'Weak', 'Positive', :given_by, 0, "
+                    ":created_at)"
+                ),
+                {"member_id": alice["id"], "given_by": manager["id"], "created_at": created_at},
+            )
+        await conn.run_sync(normalize_feedback_timestamps)
+        stored = (await conn.execute(text("SELECT created_at FROM feedbacks"))).scalars().all()
+        ids = (await conn.execute(text("SELECT id FROM feedbacks"))).scalars().all()
+
+    assert all(len(value) == 26 and value[10] == " " for value in stored), stored
+    pages = await _pages(client, "/employee/Alice/feedbacks", alice["headers"], limit=2)
+    assert len(pages) == len(set(pages))
+    assert sorted(pages) == sorted(ids)
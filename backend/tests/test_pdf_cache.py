@@ -0,0 +1,58 @@
+import asyncio
+import threading
+import pytest
+from services import pdf_cache, pdf_reports
+from tests.conftest import give_feedback, make_user
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_concurrent_downloads_share_one_render(client, monkeypatch):
+    manager = await make_user(client, "Morgan", "manager")
+    alice = await make_user(client, "Alice")
+    feedback = await give_feedback(client, manager, alice)
+
+    renders = []
+    render_pdf = pdf_reports.render_pdf
+
+    async def counting_render(data):
+        renders.append(data["id"])
+        await asyncio.sleep(0.05)
+        return await render_pdf(data)
+
+    monkeypatch.setattr(pdf_reports, "render_pdf", counting_render)
+    responses = await asyncio.gather(
+        *(
+            client.get(f"/feedback/{feedback['id']}/export-pdf", headers=manager["headers"])
+            for _ in range(8)
+        )
+    )
+
+    assert [response.status_code for response in responses] == [200] * 8
+    assert len({response.content for response in responses}) == 1
+    assert renders == [feedback["id"]]
+    assert not pdf_cache._inflight
+
+
+def test_concurrent_disk_writes_do_not_collide(tmp_path):
+    path = tmp_path / "1-abc.pdf"
+    errors = []
+    start = threading.Barrier(8)
+
+    def write(index: int):
+        start.wait()
+        try:
+            for _ in range(20):
+                pdf_cache._write_disk(path, b"%PDF-" + bytes([index]))
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=write, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert path.read_bytes().startswith(b"%PDF-")
+    assert [p.name for p in tmp_path.iterdir()] == [path.name]
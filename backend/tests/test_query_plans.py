@@ -0,0 +1,93 @@
+import re
+import pytest
+from sqlalchemy import event
+from database.db import engine
+from tests.conftest import give_feedback, make_user
+
+pytestmark = pytest.mark.anyio
+
+# Tables that grow with usage; a full scan of any of them is a missing index.
+LARGE_TABLES = {"users", "feedbacks", "feedback_tags", "feedback_requests", "activity_logs"}
+FULL_SCAN = re.compile(r"^SCAN (\w+)(?: AS \w+)?$")
+
+
+async def _exercise_routes(client):
+    manager = await make_user(client, "Morgan", "manager")
+    alice = await make_user(client, "Alice")
+    bob = await make_user(client, "Bob")
+    first = await give_feedback(client, manager, alice)
+    await give_feedback(client, manager, bob, sentiment="Negative", tags=["Growth"])
+    m, a = manager["id"], alice["id"]
+
+    requests = [
+        ("post", "/feedback/request", {"json": {"member": "Alice"}}),
+        ("put", "/feedback_request/complete", {"json": {"employee": "Alice", "manager_id": m}}),
+        ("put", f"/feedback/{first['id']}", {"json": {"sentiment": "Neutral"}}),
+        ("post", "/feedback/request", {"json": {"member": "Bob"}}),
+        ("put", "/feedback_request/complete-batch", {"json": {"employees": ["Bob"]}}),
+    ]
+    for path in (
+        f"/manager/{m}/employees",
+        f"/manager/{m}/dashboard",
+        f"/manager/{m}/feedbacks/count",
+        f"/manager/{m}/team/response-rate",
+        f"/manager/{m}/feedbacks/average-sentiment",
+        f"/manager/{m}/feedbacks/pending-ack",
+        f"/manager/{m}/feedbacks/sentiment-trends",
+        f"/manager/{m}/feedbacks/tags",
+        f"/manager/{m}/feedbacks-given?tag=Teamwork",
+        f"/manager/{m}/activities",
+        f"/employee/{a}/feedbacks/count",
+        f"/employee/{a}/feedbacks/pending-ack",
+        f"/employee/{a}/feedbacks/ack-rate",
+        f"/employee/{a}/feedbacks/average-sentiment",
+        f"/employee/{a}/feedbacks/tags",
+        "/employee/Alice/feedbacks",
+        "/feedback?user=Alice&limit=1",
+        "/feedback/search?q=communication",
+        f"/feedback/export?manager_id={m}",
+        f"/feedback/{first['id']}/export-pdf",
+    ):
+        requests.append(("get", path, {}))
+    for method, path, kwargs in requests:
+        response = await client.request(method, path, headers=manager["headers"], **kwargs)
+        assert response.status_code == 200, (path, response.text)
+
+    response = await client.put(f"/feedback/{first['id']}/acknowledge", headers=alice["headers"])
+    assert response.status_code == 200, response.text
+    response = await client.post(
+        "/feedback/acknowledge-batch",
+        json={"feedback_ids": [first["id"]]},
+        headers=alice["headers"],
+    )
+    assert response.status_code == 200, response.text
+
+
+async def test_router_queries_use_indexes(client):
+    if engine.dialect.name != "sqlite":
+        pytest.skip("query plans are checked with SQLite's EXPLAIN QUERY PLAN")
+
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(
+            ("SELECT", "UPDATE", "DELETE", "WITH")
+        ):
+            statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        await _exercise_routes(client)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+    assert statements
+    full_scans = []
+    async with engine.connect() as conn:
+        for statement, parameters in statements:
+            plan = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            for row in plan.all():
+                match = FULL_SCAN.match(row[-1])
+                if match and match.group(1) in LARGE_TABLES:
+                    full_scans.append((row[-1], statement))
+    assert not full_scans, "\n\n".join(f"{detail}:\n{sql}" for detail, sql in full_scans)
@@ -17,6 +17,8 @@ export default function EmployeeDashboard() {
   const [loadingFeedbacks, setLoadingFeedbacks] = useState(true);
   const [feedbacksError, setFeedbacksError] = useState(null);
   const [showAllFeedbacks, setShowAllFeedbacks] = useState(false);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [summary, setSummary] = useState({
     feedbackReceived: 0,
     pendingAck: 0,
@@ -61,30 +63,48 @@ export default function EmployeeDashboard() {
     }
   };
 
+  const fetchFeedbackPage = async (cursor) => {
+    let url = `${API_URL}/employee/${encodeURIComponent(user.name)}/feedbacks`;
+    if (cursor) url += `?cursor=${encodeURIComponent(cursor)}`;
+    const res = await fetch(url, {
+      headers: {
+        Authorization: `Bearer ${getTokenCookie()}`,
+      },
+    });
+    const data = await res.json();
+    if (!res.ok) throw new Error(data.detail || "Failed to fetch feedbacks");
+    setNextCursor(data.next_cursor || null);
+    return data.items;
+  };
+
   const fetchFeedbacks = async () => {
     if (!user || !user.name) return;
     setLoadingFeedbacks(true);
     try {
-      const res = await fetch(
-        `${API_URL}/employee/${encodeURIComponent(user.name)}/feedbacks`,
-        {
-          headers: {
-            Authorization: `Bearer ${getTokenCookie()}`,
-          },
-        }
-      );
-      const data = await res.json();
-      if (!res.ok) throw new Error(data.detail || "Failed to fetch feedbacks");
-      setFeedbacks(data);
+      setFeedbacks(await fetchFeedbackPage(null));
       setFeedbacksError(null);
     } catch (err) {
       setFeedbacksError(err.message);
       setFeedbacks([]);
+      setNextCursor(null);
     } finally {
       setLoadingFeedbacks(false);
     }
   };
 
+  const handleLoadMore = async () => {
+    setLoadingMore(true);
+    try {
+      const items = await fetchFeedbackPage(nextCursor);
+      setFeedbacks((fbs) => [...fbs, ...items]);
+    } catch (err) {
+      setSnackbar({ open: true, message: err.message, severity: "error" });
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+
   const handleRequestFeedback = async () => {
     try {
       const res = await fetch(`${API_URL}/feedback/request`, {
@@ -135,6 +155,38 @@ export default function EmployeeDashboard() {
     }
   };
 
+  const handleAcknowledgeAll = async () => {
+    const pendingIds = feedbacks.filter((fb) => !fb.acknowledged).map((fb) => fb.id);
+    if (pendingIds.length === 0) return;
+    try {
+      const res = await fetch(`${API_URL}/feedback/acknowledge-batch`, {
+        method: "POST",
+        headers: {
+          "Content-Type": "application/json",
+          Authorization: `Bearer ${getTokenCookie()}`,
+        },
+        body: JSON.stringify({ feedback_ids: pendingIds }),
+      });
+      const data = await res.json();
+      if (!res.ok) throw new Error(data.detail || "Failed to acknowledge feedback");
+      const acknowledged = new Set(data.acknowledged);
+      setFeedbacks((fbs) =>
+        fbs.map((fb) =>
+          acknowledged.has(fb.id) ? { ...fb, acknowledged: true } : fb
+        )
+      );
+      setSnackbar({
+        open: true,
+        message: `${data.acknowledged.length} feedback acknowledged!`,
+        severity: "success",
+      });
+      fetchSummary();
+      fetchFeedbacks();
+    } catch (err) {
+      setSnackbar({ open: true, message: err.message, severity: "error" });
+    }
+  };
+
   const handleExportPDF = async (feedbackId) => {
     try {
       const res = await fetch(`${API_URL}/feedback/${feedbackId}/export-pdf`, {
@@ -385,9 +437,33 @@ export default function EmployeeDashboard() {
             mt: 4,
           }}
         >
-          <Typography variant="h6" fontWeight={700} mb={2} color="#ff4f81">
-            Feedback Timeline
-          </Typography>
+          <Box
+            sx={{
+              display: "flex",
+              justifyContent: "space-between",
+              alignItems: "center",
+              mb: 2,
+            }}
+          >
+            <Typography variant="h6" fontWeight={700} color="#ff4f81">
+              Feedback Timeline
+            </Typography>
+            {feedbacks.some((fb) => !fb.acknowledged) && (
+              <Button
+                size="small"
+                variant="outlined"
+                sx={{
+                  borderRadius: 6,
+                  fontWeight: 600,
+                  color: "#22c55e",
+                  borderColor: "#22c55e",
+                }}
+                onClick={handleAcknowledgeAll}
+              >
+                Acknowledge all
+              </Button>
+            )}
+          </Box>
           {loadingFeedbacks ? (
             <Typography>Loading feedbacks...</Typography>
           ) : feedbacksError ? (
@@ -539,6 +615,26 @@ export default function EmployeeDashboard() {
                   Show Less
                 </Button>
               )}
+              {showAllFeedbacks && nextCursor && (
+                <Button
+                  onClick={handleLoadMore}
+                  disabled={loadingMore}
+                  sx={{
+                    px: 0,
+                    py: 0,
+                    minWidth: 0,
+                    mt: -2,
+                    mb: 2,
+                    ml: 2,
+                    fontWeight: 600,
+                    color: "#2563eb",
+                    background: "none",
+                    boxShadow: "none",
+                  }}
+                >
+                  {loadingMore ? "Loading..." : "Load more"}
+                </Button>
+              )}
             </>
           )}
         </Box>
@@ -652,6 +748,8 @@ export default function EmployeeDashboard() {
         feedbacks={[...feedbacks].sort(
           (a, b) => new Date(b.created_at) - new Date(a.created_at)
         )}
+        onLoadMore={nextCursor ? handleLoadMore : undefined}
+        loadingMore={loadingMore}
       />
     </Box>
   );
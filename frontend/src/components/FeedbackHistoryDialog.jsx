@@ -21,7 +21,13 @@ const sentimentOptions = [
   { value: "Negative", label: "Negative" },
 ];
 
-export default function FeedbackHistoryDialog({ open, onClose, feedbacks }) {
+export default function FeedbackHistoryDialog({
+  open,
+  onClose,
+  feedbacks,
+  onLoadMore,
+  loadingMore,
+}) {
   const { user } = useContext(UserContext);
   const [editId, setEditId] = useState(null);
   const [editData, setEditData] = useState({});
@@ -298,6 +304,23 @@ export default function FeedbackHistoryDialog({ open, onClose, feedbacks }) {
             </Paper>
           ))
         )}
+        {onLoadMore && (
+          <Box sx={{ display: "flex", justifyContent: "center", mb: 2 }}>
+            <Button
+              variant="outlined"
+              disabled={loadingMore}
+              onClick={onLoadMore}
+              sx={{
+                borderRadius: 6,
+                fontWeight: 600,
+                color: "#ED5F00",
+                borderColor: "#ED5F00",
+              }}
+            >
+              {loadingMore ? "Loading..." : "Load more"}
+            </Button>
+          </Box>
+        )}
       </DialogContent>
     </Dialog>
   );
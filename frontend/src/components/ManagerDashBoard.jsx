@@ -7,6 +7,31 @@ import { UserContext } from "../context/UserProvider";
 import { API_URL, getTokenCookie } from "../api";
 import SentimentTrendChart from "./SentimentTrendChart";
 
+const SENTIMENT_SCORES = { positive: 5, neutral: 3, negative: 1 };
+
+const round2 = (value) => Math.round(value * 100) / 100;
+
+// Mirrors the derived metrics of GET /manager/{id}/dashboard so pushed
+// counter deltas can be applied without refetching.
+const summaryFromCounters = (counters) => ({
+  totalFeedback: counters.total,
+  responseRate: counters.total_requests
+    ? round2((counters.completed_requests / counters.total_requests) * 100)
+    : 0,
+  avgSentiment: counters.total
+    ? round2(
+        Object.entries(SENTIMENT_SCORES).reduce(
+          (sum, [key, score]) => sum + counters[key] * score,
+          0
+        ) / counters.total
+      )
+    : 0,
+  pendingAck: counters.total - counters.acknowledged,
+  loading: false,
+});
+
+const FEED_RETRY_MS = 5000;
+
 export default function ManagerDashboard() {
   const [dialogOpen, setDialogOpen] = useState(false);
   const { user, logout } = useContext(UserContext);
@@ -21,6 +46,7 @@ export default function ManagerDashboard() {
   });
   const [sentimentData, setSentimentData] = useState([]);
   const [activities, setActivities] = useState([]);
+  const [counters, setCounters] = useState(null);
   const [loadingSentiment, setLoadingSentiment] = useState(true);
   const [loadingActivities, setLoadingActivities] = useState(true);
 
@@ -32,28 +58,12 @@ export default function ManagerDashboard() {
         "Content-Type": "application/json",
         Authorization: `Bearer ${getTokenCookie()}`,
       };
-      const [
-        totalFeedbackRes,
-        responseRateRes,
-        avgSentimentRes,
-        pendingAckRes,
-      ] = await Promise.all([
-        fetch(`${API_URL}/manager/${user.id}/feedbacks/count`, { headers }),
-        fetch(`${API_URL}/manager/${user.id}/team/response-rate`, { headers }),
-        fetch(`${API_URL}/manager/${user.id}/feedbacks/average-sentiment`, { headers }),
-        fetch(`${API_URL}/manager/${user.id}/feedbacks/pending-ack`, { headers }),
-      ]);
-      const totalFeedback = (await totalFeedbackRes.json()).total_feedback_given || 0;
-      const responseRate = (await responseRateRes.json()).response_rate || 0;
-      const avgSentiment = (await avgSentimentRes.json()).average_sentiment || 0;
-      const pendingAck = (await pendingAckRes.json()).pending_acknowledgments || 0;
-      setSummary({
-        totalFeedback,
-        responseRate,
-        avgSentiment,
-        pendingAck,
-        loading: false,
+      const res = await fetch(`${API_URL}/manager/${user.id}/dashboard`, {
+        headers,
       });
+      const data = await res.json();
+      if (!res.ok) throw new Error(data.detail || "Failed to fetch dashboard");
+      setCounters(data.counters);
     } catch (err) {
       setSummary((summary) => ({ ...summary, loading: false }));
     }
@@ -62,15 +72,18 @@ export default function ManagerDashboard() {
   const fetchEmployees = async () => {
     if (!user || !user.id) return;
     try {
-      const res = await fetch(`${API_URL}/manager/${user.id}/employees`, {
-        headers: {
-          "Content-Type": "application/json",
-          Authorization: `Bearer ${getTokenCookie()}`,
-        },
-      });
+      const res = await fetch(
+        `${API_URL}/manager/${user.id}/employees?sort_by=pending&order=desc&limit=500`,
+        {
+          headers: {
+            "Content-Type": "application/json",
+            Authorization: `Bearer ${getTokenCookie()}`,
+          },
+        }
+      );
       const data = await res.json();
       if (!res.ok) throw new Error(data.detail || "Failed to fetch employees");
-      setEmployees(data);
+      setEmployees(data.items);
       setError(null);
     } catch (err) {
       setError(err.message);
@@ -78,6 +91,62 @@ export default function ManagerDashboard() {
     }
   };
 
+  const fetchActivities = () => {
+    if (!user || !user.id) return;
+    setLoadingActivities(true);
+    fetch(`${API_URL}/manager/${user.id}/activities`, {
+      headers: {
+        "Content-Type": "application/json",
+        Authorization: `Bearer ${getTokenCookie()}`,
+      },
+    })
+      .then(async (res) => {
+        const data = await res.json();
+        if (!res.ok || !Array.isArray(data)) {
+          setActivities([]);
+        } else {
+          setActivities(data);
+        }
+      })
+      .catch(() => setActivities([]))
+      .finally(() => setLoadingActivities(false));
+  };
+
+  const applyMetricsDelta = (delta) => {
+    setCounters((current) => {
+      if (!current) return current;
+      const next = { ...current };
+      Object.entries(delta).forEach(([key, value]) => {
+        next[key] = (next[key] || 0) + value;
+      });
+      return next;
+    });
+  };
+
+  const handleFeedMessage = (message) => {
+    let event = "message";
+    let data = "";
+    message.split("\n").forEach((line) => {
+      if (line.startsWith("event: ")) event = line.slice(7);
+      else if (line.startsWith("data: ")) data += line.slice(6);
+    });
+    if (event === "activity") {
+      const activity = JSON.parse(data);
+      setActivities((acts) => [activity, ...acts].slice(0, 5));
+      fetchEmployees();
+    } else if (event === "metrics") {
+      applyMetricsDelta(JSON.parse(data));
+    } else if (event === "resync") {
+      fetchSummary();
+      fetchEmployees();
+      fetchActivities();
+    }
+  };
+
+  useEffect(() => {
+    if (counters) setSummary(summaryFromCounters(counters));
+  }, [counters]);
+
   useEffect(() => {
     fetchSummary();
     // eslint-disable-next-line
@@ -102,25 +171,47 @@ export default function ManagerDashboard() {
       .finally(() => setLoadingSentiment(false));
   }, [user]);
 
+  useEffect(() => {
+    fetchActivities();
+    // eslint-disable-next-line
+  }, [user]);
+
+  // Follow the server-push feed instead of polling; after a dropped
+  // connection, resync and reconnect.
   useEffect(() => {
     if (!user || !user.id) return;
-    setLoadingActivities(true);
-    fetch(`${API_URL}/manager/${user.id}/activities`, {
-      headers: {
-        "Content-Type": "application/json",
-        Authorization: `Bearer ${getTokenCookie()}`,
-      },
-    })
-      .then(async (res) => {
-        const data = await res.json();
-        if (!res.ok || !Array.isArray(data)) {
-          setActivities([]);
-        } else {
-          setActivities(data);
+    const controller = new AbortController();
+    const follow = async () => {
+      const res = await fetch(`${API_URL}/manager/${user.id}/activities/stream`, {
+        headers: { Authorization: `Bearer ${getTokenCookie()}` },
+        signal: controller.signal,
+      });
+      if (!res.ok || !res.body) return;
+      const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+      let buffer = "";
+      while (true) {
+        const { value, done } = await reader.read();
+        if (done) return;
+        buffer += value;
+        const messages = buffer.split("\n\n");
+        buffer = messages.pop();
+        messages.forEach(handleFeedMessage);
+      }
+    };
+    const run = async () => {
+      while (!controller.signal.aborted) {
+        try {
+          await follow();
+        } catch (err) {
+          if (controller.signal.aborted) return;
         }
-      })
-      .catch(() => setActivities([]))
-      .finally(() => setLoadingActivities(false));
+        await new Promise((resolve) => setTimeout(resolve, FEED_RETRY_MS));
+        if (!controller.signal.aborted) handleFeedMessage("event: resync");
+      }
+    };
+    run();
+    return () => controller.abort();
+    // eslint-disable-next-line
   }, [user]);
 
   return (
@@ -496,6 +587,11 @@ export default function ManagerDashboard() {
                 color = "#ff4f81";
                 bgcolor = "#ff4f8122";
                 text = `Feedback request from ${act.user_name}`;
+              } else if (act.action === "completed_feedback_request") {
+                icon = "✓";
+                color = "#2563eb";
+                bgcolor = "#F7F5FD";
+                text = `Feedback request from ${act.user_name} completed`;
               }
               const date = new Date(act.timestamp).toLocaleString();
 
@@ -68,6 +68,7 @@ function NewFeedbackDialog({ open, onClose, team, employeeId }) {
         },
         body: JSON.stringify({
           member,
+          member_id: team.find((m) => m.name === member)?.id,
           strengths,
           improvement,
           sentiment,
@@ -39,30 +39,51 @@ export default function VerticalSidebar({ activeIndex = 0 }) {
   const [feedbackDialogOpen, setFeedbackDialogOpen] = useState(false);
   const [feedbacks, setFeedbacks] = useState([]);
   const [loading, setLoading] = useState(false);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
-  const handleFeedbackClick = async () => {
-    if (!user) return;
-    setLoading(true);
+  const fetchFeedbackPage = async (cursor) => {
     let url = "";
     if (user.role === "employee") {
       url = `${API_URL}/employee/${encodeURIComponent(user.name)}/feedbacks`;
     } else if (user.role === "manager") {
       url = `${API_URL}/manager/${user.id}/feedbacks-given`;
     }
+    if (cursor) url += `?cursor=${encodeURIComponent(cursor)}`;
+    const res = await fetch(url, {
+      headers: { Authorization: `Bearer ${getTokenCookie()}` },
+    });
+    const data = await res.json();
+    setNextCursor(data.next_cursor || null);
+    return Array.isArray(data.items) ? data.items : [];
+  };
+
+  const handleFeedbackClick = async () => {
+    if (!user) return;
+    setLoading(true);
     try {
-      const res = await fetch(url, {
-        headers: { Authorization: `Bearer ${getTokenCookie()}` },
-      });
-      const data = await res.json();
-      setFeedbacks(Array.isArray(data) ? data : []);
+      setFeedbacks(await fetchFeedbackPage(null));
     } catch {
       setFeedbacks([]);
+      setNextCursor(null);
     } finally {
       setLoading(false);
       setFeedbackDialogOpen(true);
     }
   };
 
+  const handleLoadMore = async () => {
+    setLoadingMore(true);
+    try {
+      const items = await fetchFeedbackPage(nextCursor);
+      setFeedbacks((feedbacks) => [...feedbacks, ...items]);
+    } catch {
+      setNextCursor(null);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   return (
     <>
       <Box
@@ -119,6 +140,8 @@ export default function VerticalSidebar({ activeIndex = 0 }) {
           (a, b) => new Date(b.created_at) - new Date(a.created_at)
         )}
         loading={loading}
+        onLoadMore={nextCursor ? handleLoadMore : undefined}
+        loadingMore={loadingMore}
       />
     </>
   );